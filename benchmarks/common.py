@@ -0,0 +1,147 @@
+"""
+Shared benchmark helpers.
+Baseline storage and budget checks used by every suite.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+BENCH_DIR = Path(__file__).parent
+BUDGETS_PATH = BENCH_DIR / 'budgets.json'
+
+
+def baseline_path(suite: str) -> Path:
+    """Default baseline file of a suite."""
+    return BENCH_DIR / 'baselines' / f'{suite}.json'
+
+
+def load_json(path: Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def check_budgets(
+    metrics: Dict[str, float],
+    budgets: Dict[str, object],
+    baseline: Optional[Dict[str, float]] = None
+) -> List[str]:
+    """
+    Compare metrics with their budgets.
+    
+    Budgets has an optional 'max_ms' table of absolute limits per metric and
+    an optional 'regression' fraction: any metric in the baseline may grow
+    by at most that much. Only the metrics in 'tracked' (default: all) are
+    checked against the baseline, since small groups are noisy.
+    
+    Returns:
+        One message per exceeded budget, empty if all are met
+    """
+    failures: List[str] = []
+    
+    for name, limit in budgets.get('max_ms', {}).items():
+        value = metrics.get(name)
+        if value is not None and value > limit:
+            failures.append(f'{name}: {value:.1f} ms exceeds budget of {limit:.1f} ms')
+    
+    regression = budgets.get('regression')
+    if baseline and regression is not None:
+        tracked = budgets.get('tracked') or list(baseline)
+        for name in tracked:
+            value, reference = metrics.get(name), baseline.get(name)
+            if value is None or not reference:
+                continue
+            limit = reference * (1 + regression)
+            if value > limit:
+                failures.append(
+                    f'{name}: {value:.1f} ms is {value / reference - 1:.0%} over '
+                    f'baseline {reference:.1f} ms (allowed {regression:.0%})'
+                )
+    
+    return failures
+
+
+def compare_to_baseline(
+    metrics: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: Optional[float] = None
+) -> List[str]:
+    """
+    Side-by-side report of each metric against its baseline value.
+    
+    Metrics that grew by more than threshold (a fraction) are flagged
+    REGRESSION and those that shrank by more than it IMPROVED; metrics
+    missing from either side are listed as new or removed.
+    
+    Returns:
+        Report lines, starting with a header
+    """
+    names = sorted(set(metrics) | set(baseline))
+    width = max([len(name) for name in names] + [len('metric')])
+    lines = [f'{"metric":<{width}}  {"baseline":>10}  {"current":>10}  {"change":>8}']
+    
+    for name in names:
+        value, reference = metrics.get(name), baseline.get(name)
+        if value is None or reference is None:
+            before = '-' if reference is None else f'{reference:.3f}'
+            after = '-' if value is None else f'{value:.3f}'
+            note = 'new' if reference is None else 'removed'
+            lines.append(f'{name:<{width}}  {before:>10}  {after:>10}  {"":>8}  {note}')
+            continue
+        
+        change = value / reference - 1 if reference else 0.0
+        flag = ''
+        if threshold is not None and change > threshold:
+            flag = 'REGRESSION'
+        elif threshold is not None and change < -threshold:
+            flag = 'IMPROVED'
+        lines.append(f'{name:<{width}}  {reference:>10.3f}  {value:>10.3f}  {change:>+8.0%}  {flag}'.rstrip())
+    
+    return lines
+
+
+def add_common_arguments(parser: argparse.ArgumentParser, suite: str) -> None:
+    """Options every suite accepts: repeat count, budgets and baseline handling."""
+    parser.add_argument('--repeat', type=int, default=5, help='runs per measurement (median is kept)')
+    parser.add_argument('--budgets', type=Path, default=BUDGETS_PATH)
+    parser.add_argument('--baseline', type=Path, default=baseline_path(suite))
+    parser.add_argument('--update-baseline', action='store_true', help='store results as the new baseline')
+    parser.add_argument(
+        '--threshold', type=float,
+        help="allowed growth over the baseline as a fraction (overrides the suite's 'regression' budget)"
+    )
+
+
+def report(suite: str, metrics: Dict[str, float], args: argparse.Namespace) -> int:
+    """
+    Print metrics, then store them as the baseline or compare them with it
+    and check them against the suite's budgets.
+    
+    Returns:
+        Process exit code: 1 if a budget is exceeded, else 0
+    """
+    print(json.dumps(metrics, indent=2))
+    
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(metrics, indent=2) + '\n', encoding='utf-8')
+        print(f'Baseline written to {args.baseline}', file=sys.stderr)
+        return 0
+    
+    budgets = dict((load_json(args.budgets) or {}).get(suite, {}))
+    if args.threshold is not None:
+        budgets['regression'] = args.threshold
+    
+    baseline = load_json(args.baseline)
+    if baseline:
+        for line in compare_to_baseline(metrics, baseline, budgets.get('regression')):
+            print(line, file=sys.stderr)
+    
+    failures = check_budgets(metrics, budgets, baseline)
+    for failure in failures:
+        print(f'BUDGET EXCEEDED {failure}', file=sys.stderr)
+    return 1 if failures else 0
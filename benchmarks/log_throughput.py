@@ -0,0 +1,203 @@
+"""
+Logging throughput benchmark.
+Measures the caller-side cost of a log call, synchronous against queued.
+
+Usage:
+    python -m benchmarks.log_throughput
+    python -m benchmarks.log_throughput --threads 4 --queue-size 1000 --update-baseline
+    python -m benchmarks.log_throughput --slow-calls 1000 --sink-delay-ms 2
+
+Each run logs a mix of 80% DEBUG and 20% INFO records from --threads worker
+threads into a file in a temporary directory. 'sync' writes and flushes on
+the calling thread, as the logger did before the queue; 'queue.<policy>'
+goes through the bounded queue with that overflow policy. Per-call costs
+are in microseconds; drain times (writing out what is still queued when
+logging stops) are in milliseconds.
+
+A local file absorbs writes in the page cache, so these variants show the
+queue's overhead rather than its benefit. The 'slow.*' variants repeat
+them with --slow-calls records per thread against a sink whose every flush
+takes --sink-delay-ms, like a file on a busy disk or a network share:
+'slow.sync' pays that delay on the logging thread for each record, while
+the queued variants pay it once per batch on the listener thread.
+"""
+
+import argparse
+import logging
+import queue
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.common import add_common_arguments, report
+from src.utils.log_pipeline import (
+    OVERFLOW_POLICIES, BatchedFileHandler, BatchFlushMixin, BatchingQueueListener, BoundedQueueHandler
+)
+
+
+SUITE = 'log_throughput'
+FORMAT = '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s'
+
+
+class SlowFlushMixin:
+    """Handler mixin that sleeps on every flush, standing in for slow I/O."""
+    
+    delay = 0.0
+    
+    def flush(self) -> None:
+        if self.delay > 0:
+            time.sleep(self.delay)
+        super().flush()
+
+
+class SlowFileHandler(SlowFlushMixin, logging.FileHandler):
+    """FileHandler on a slow sink, flushed after every record."""
+
+
+class SlowBatchedFileHandler(BatchFlushMixin, SlowFlushMixin, logging.FileHandler):
+    """BatchedFileHandler on a slow sink, flushed once per listener batch."""
+
+
+def log_from_threads(logger: logging.Logger, threads: int, calls: int) -> float:
+    """
+    Log calls records from each of threads threads.
+    
+    Returns:
+        Mean wall time per call in microseconds, as seen by the callers
+    """
+    barrier = threading.Barrier(threads + 1)
+    durations: List[float] = []
+    
+    def worker(index: int) -> None:
+        barrier.wait()
+        started = time.perf_counter()
+        for i in range(calls):
+            if i % 5:
+                logger.debug('worker %d step %d: copied file', index, i)
+            else:
+                logger.info('worker %d step %d: progress', index, i)
+        durations.append(time.perf_counter() - started)
+    
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    for thread in workers:
+        thread.join()
+    
+    return sum(durations) / (threads * calls) * 1e6
+
+
+def run_sync(directory: Path, threads: int, calls: int, delay_ms: float = 0.0) -> Tuple[float, float]:
+    logger = logging.getLogger('bench.sync')
+    if delay_ms > 0:
+        handler = SlowFileHandler(directory / 'sync.log', encoding='utf-8')
+        handler.delay = delay_ms / 1000
+    else:
+        handler = logging.FileHandler(directory / 'sync.log', encoding='utf-8')
+    handler.setFormatter(logging.Formatter(FORMAT))
+    logger.addHandler(handler)
+    try:
+        return log_from_threads(logger, threads, calls), 0.0
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def run_queued(
+    directory: Path,
+    threads: int,
+    calls: int,
+    policy: str,
+    queue_size: int,
+    delay_ms: float = 0.0
+) -> Tuple[float, float]:
+    logger = logging.getLogger(f'bench.{policy}')
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    handler = BoundedQueueHandler(log_queue, policy)
+    if delay_ms > 0:
+        file_handler = SlowBatchedFileHandler(directory / f'{policy}.log', encoding='utf-8')
+        file_handler.delay = delay_ms / 1000
+    else:
+        file_handler = BatchedFileHandler(directory / f'{policy}.log', encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(FORMAT))
+    listener = BatchingQueueListener(log_queue, file_handler, source=handler)
+    
+    logger.addHandler(handler)
+    listener.start()
+    try:
+        per_call = log_from_threads(logger, threads, calls)
+        started = time.perf_counter()
+        listener.stop()
+        return per_call, (time.perf_counter() - started) * 1000
+    finally:
+        logger.removeHandler(handler)
+        file_handler.close()
+
+
+def measure(
+    threads: int,
+    calls: int,
+    queue_size: int,
+    repeat: int,
+    slow_calls: int = 500,
+    sink_delay_ms: float = 0.5
+) -> Dict[str, float]:
+    """
+    Returns:
+        '<variant>.us_per_call' and '<variant>.drain_ms' medians per variant,
+        the slow sink variants prefixed with 'slow.'
+    """
+    variants: Dict[str, Callable[[Path], Tuple[float, float]]] = {
+        'sync': lambda d: run_sync(d, threads, calls),
+    }
+    for policy in OVERFLOW_POLICIES:
+        variants[f'queue.{policy}'] = lambda d, p=policy: run_queued(d, threads, calls, p, queue_size)
+    
+    if slow_calls > 0 and sink_delay_ms > 0:
+        variants['slow.sync'] = lambda d: run_sync(d, threads, slow_calls, sink_delay_ms)
+        for policy in OVERFLOW_POLICIES:
+            variants[f'slow.queue.{policy}'] = lambda d, p=policy: run_queued(
+                d, threads, slow_calls, p, queue_size, sink_delay_ms
+            )
+    
+    metrics: Dict[str, float] = {}
+    for name, run in variants.items():
+        samples = []
+        for _ in range(repeat):
+            with tempfile.TemporaryDirectory() as directory:
+                samples.append(run(Path(directory)))
+        metrics[f'{name}.us_per_call'] = statistics.median(s[0] for s in samples)
+        if not name.endswith('sync'):
+            metrics[f'{name}.drain_ms'] = statistics.median(s[1] for s in samples)
+    
+    return {k: round(v, 2) for k, v in sorted(metrics.items())}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure the cost of a log call.')
+    add_common_arguments(parser, SUITE)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--calls', type=int, default=20000, help='log calls per thread')
+    parser.add_argument('--queue-size', type=int, default=10000)
+    parser.add_argument('--slow-calls', type=int, default=500, help='log calls per thread against the slow sink')
+    parser.add_argument('--sink-delay-ms', type=float, default=0.5, help='time each flush of the slow sink takes')
+    args = parser.parse_args(argv)
+    
+    # Only the pipeline under test should write, and DEBUG counts
+    bench_logger = logging.getLogger('bench')
+    bench_logger.setLevel(logging.DEBUG)
+    bench_logger.propagate = False
+    
+    metrics = measure(
+        args.threads, args.calls, args.queue_size, args.repeat, args.slow_calls, args.sink_delay_ms
+    )
+    return report(SUITE, metrics, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,336 @@
+"""
+Module orchestration benchmark.
+Measures what the executor and BaseModule add on top of the commands a module runs.
+
+Usage:
+    python -m benchmarks.orchestration
+    python -m benchmarks.orchestration --latency lognormal --latency-ms 20 --update-baseline
+    python -m benchmarks.orchestration --jobs 500 --workers 2 --threshold 0.2
+
+Every module in src/modules/bugfix and src/modules/reset runs against a
+fake backend: commands are never spawned and files are never deleted, each
+such call sleeps for a latency drawn from --latency instead. Validation
+always passes and the connectivity probe reports no connectivity before the
+first repair and a working network after it. The journal, event log and
+trace file are written to a temporary directory, so the runs pay for them
+as they would in the application.
+
+'module.<id>.overhead_ms' is the median wall time of execute() minus the
+time spent in the fake backend. 'executor.callback.*' is the time from
+ModuleExecutor.execute() to its on_complete callback for an empty job, and
+'executor.queue.*' the time per job when --jobs module runs are queued at
+once. All values are in milliseconds. With a baseline, a comparison table
+flagging changes beyond the regression threshold is printed to stderr.
+"""
+
+import argparse
+import contextlib
+import logging
+import math
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from unittest.mock import patch
+
+from benchmarks.common import add_common_arguments, report
+from src.core.executor import ExecutionResult, ExecutionStatus, ModuleExecutor
+from src.core.journal import ExecutionJournal
+from src.core.validator import ValidationResult, Validator
+from src.modules.registry import MANIFEST, ModuleSpec
+from src.system.commands import CommandRunner
+from src.system.files import DeletionStats, ThrottledDeleter
+from src.system.probes import ConnectivityProbe, ConnectivityReport, ProbeResult
+from src.utils.config import Config
+from src.utils.events import EventLog
+from src.utils.logger import get_logger
+from src.utils.tracing import ChromeTraceExporter, Tracer
+
+
+SUITE = 'orchestration'
+PACKAGES = ('src.modules.bugfix.', 'src.modules.reset.')
+DISTRIBUTIONS = ('fixed', 'uniform', 'exponential', 'lognormal')
+# Spread of the lognormal distribution; its mean stays at --latency-ms
+LOGNORMAL_SIGMA = 1.0
+
+
+class FakeBackend:
+    """
+    Stands in for spawned commands, file deletion and connectivity probes.
+    
+    Each call sleeps for a latency drawn from the distribution and counts
+    the time actually slept, so that it can be subtracted from a run.
+    """
+    
+    def __init__(self, distribution: str = 'fixed', latency_ms: float = 5.0, seed: int = 0) -> None:
+        """
+        Args:
+            distribution: One of DISTRIBUTIONS
+            latency_ms: Mean latency of a call in milliseconds
+            seed: Seed of the latency draws
+        """
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f'Unknown latency distribution: {distribution}')
+        self.distribution = distribution
+        self.latency_ms = latency_ms
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._probes = 0
+        self.calls = 0
+        self.waited_ms = 0.0
+    
+    def sample(self) -> float:
+        """Latency of the next call in milliseconds."""
+        mean = self.latency_ms
+        if mean <= 0:
+            return 0.0
+        with self._lock:
+            if self.distribution == 'uniform':
+                return self._rng.uniform(0, 2 * mean)
+            if self.distribution == 'exponential':
+                return self._rng.expovariate(1 / mean)
+            if self.distribution == 'lognormal':
+                mu = math.log(mean) - LOGNORMAL_SIGMA ** 2 / 2
+                return self._rng.lognormvariate(mu, LOGNORMAL_SIGMA)
+            return mean
+    
+    def wait(self) -> float:
+        """
+        Sleep for one call.
+        
+        Returns:
+            Time actually slept in milliseconds
+        """
+        latency = self.sample()
+        started = time.perf_counter()
+        if latency > 0:
+            time.sleep(latency / 1000)
+        waited = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.calls += 1
+            self.waited_ms += waited
+        return waited
+    
+    def reset(self) -> Tuple[int, float]:
+        """
+        Start counting afresh.
+        
+        Returns:
+            Calls and milliseconds waited since the last reset
+        """
+        with self._lock:
+            counted = self.calls, self.waited_ms
+            self.calls, self.waited_ms = 0, 0.0
+        return counted
+    
+    def connected(self) -> bool:
+        """Probe outcome: down before the first repair of a run, up after it."""
+        with self._lock:
+            self._probes += 1
+            return self._probes % 2 == 0
+    
+    @contextlib.contextmanager
+    def installed(self, directory: Path) -> Iterator['FakeBackend']:
+        """Route commands, deletions, probes and all run output through this backend."""
+        backend = self
+        
+        def resolve_command(runner: CommandRunner, command: str) -> Optional[str]:
+            # The allow-list still applies; the name stands in for the path
+            return command if command.lower() in runner.ALLOWED_COMMANDS else None
+        
+        def run_process(runner, full_args, timeout, env, capture_output, phases):
+            phases['spawn_ms'] = 0.0
+            phases['run_ms'] = round(backend.wait(), 1)
+            return subprocess.CompletedProcess(full_args, 0, 'The operation completed successfully.', ''), None
+        
+        def clear_directory(deleter, path, recursive=True, remove_root=False) -> DeletionStats:
+            return DeletionStats(elapsed=backend.wait() / 1000)
+        
+        def probe(connectivity: ConnectivityProbe) -> ConnectivityReport:
+            latency = backend.wait()
+            return ConnectivityReport([ProbeResult('tcp', 'fake:443', backend.connected(), latency, '')])
+        
+        def validate_all(validator, **kwargs) -> ValidationResult:
+            return ValidationResult(valid=True, messages=[], warnings=[])
+        
+        event_log = EventLog(directory)
+        exporter = ChromeTraceExporter(directory)
+        tracer = Tracer(exporter, sample_rate=Config.load().trace_sample_rate)
+        
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(patch.object(CommandRunner, '_resolve_command', resolve_command))
+            stack.enter_context(patch.object(CommandRunner, '_run_process', run_process))
+            stack.enter_context(patch.object(ThrottledDeleter, 'clear_directory', clear_directory))
+            stack.enter_context(patch.object(ConnectivityProbe, 'run', probe))
+            stack.enter_context(patch.object(Validator, 'validate_all', validate_all))
+            stack.enter_context(patch('src.core.journal._journal', ExecutionJournal(directory / 'journal')))
+            stack.enter_context(patch('src.utils.events._event_log', event_log))
+            stack.enter_context(patch('src.utils.tracing._tracer', tracer))
+            try:
+                yield self
+            finally:
+                event_log.close()
+                exporter.close()
+
+
+def module_specs() -> List[ModuleSpec]:
+    """Specs of the bundled bugfix and reset modules, in manifest order."""
+    return [spec for spec in MANIFEST if spec.target.startswith(PACKAGES)]
+
+
+def measure_modules(backend: FakeBackend, repeat: int) -> Dict[str, float]:
+    """
+    Run each module repeat times.
+    
+    Returns:
+        'module.<id>.overhead_ms' medians and their sum as 'modules.overhead_ms'
+    """
+    metrics: Dict[str, float] = {}
+    
+    for spec in module_specs():
+        module = spec.load_class()()
+        samples = []
+        for _ in range(repeat):
+            backend.reset()
+            started = time.perf_counter()
+            module.execute()
+            elapsed = (time.perf_counter() - started) * 1000
+            samples.append(elapsed - backend.reset()[1])
+        metrics[f'module.{spec.module_id}.overhead_ms'] = statistics.median(samples)
+    
+    metrics['modules.overhead_ms'] = sum(metrics.values())
+    return metrics
+
+
+def measure_callback_latency(samples: int) -> Dict[str, float]:
+    """
+    Time from submitting an empty job to its on_complete callback, one job
+    at a time.
+    """
+    executor = ModuleExecutor()
+    latencies: List[float] = []
+    done = threading.Event()
+    
+    def job() -> ExecutionResult:
+        return ExecutionResult(status=ExecutionStatus.SUCCESS, message='')
+    
+    def on_complete(result: ExecutionResult) -> None:
+        latencies.append((time.perf_counter() - started) * 1000)
+        done.set()
+    
+    try:
+        for _ in range(samples):
+            done.clear()
+            started = time.perf_counter()
+            executor.execute(job, on_complete=on_complete)
+            done.wait()
+    finally:
+        executor.shutdown(wait=True)
+    
+    latencies.sort()
+    return {
+        'executor.callback.p50_ms': statistics.median(latencies),
+        'executor.callback.p95_ms': latencies[int(0.95 * (len(latencies) - 1))],
+    }
+
+
+def measure_queue(backend: FakeBackend, jobs: int, workers: int, repeat: int) -> Dict[str, float]:
+    """
+    Queue jobs runs of a single-command module at once and wait for all
+    callbacks.
+    
+    Returns:
+        'executor.queue.ms_per_job' wall time and
+        'executor.queue.overhead_ms_per_job' without the backend's latency
+    """
+    module_class = next(spec for spec in MANIFEST if spec.module_id == 'DNSFlushModule').load_class()
+    per_job: List[float] = []
+    overhead: List[float] = []
+    
+    for _ in range(repeat):
+        modules = [module_class() for _ in range(jobs)]
+        executor = ModuleExecutor(max_workers=workers)
+        remaining = jobs
+        lock = threading.Lock()
+        done = threading.Event()
+        
+        def on_complete(result: ExecutionResult) -> None:
+            nonlocal remaining
+            with lock:
+                remaining -= 1
+                if remaining == 0:
+                    done.set()
+        
+        backend.reset()
+        started = time.perf_counter()
+        for module in modules:
+            executor.execute(module.execute, on_complete=on_complete)
+        done.wait()
+        elapsed = (time.perf_counter() - started) * 1000
+        executor.shutdown(wait=True)
+        
+        waited = backend.reset()[1]
+        per_job.append(elapsed / jobs)
+        overhead.append(max(elapsed - waited / workers, 0.0) / jobs)
+    
+    return {
+        'executor.queue.ms_per_job': statistics.median(per_job),
+        'executor.queue.overhead_ms_per_job': statistics.median(overhead),
+    }
+
+
+def measure(
+    distribution: str,
+    latency_ms: float,
+    repeat: int,
+    samples: int,
+    jobs: int,
+    workers: int,
+    seed: int = 0
+) -> Dict[str, float]:
+    """
+    Run all measurements against one fake backend.
+    
+    Returns:
+        Metrics in milliseconds, sorted by name
+    """
+    backend = FakeBackend(distribution, latency_ms, seed)
+    metrics: Dict[str, float] = {}
+    
+    with tempfile.TemporaryDirectory() as directory, backend.installed(Path(directory)):
+        # One unmeasured pass imports the modules and warms the caches
+        measure_modules(backend, 1)
+        metrics.update(measure_modules(backend, repeat))
+        metrics.update(measure_callback_latency(samples))
+        metrics.update(measure_queue(backend, jobs, workers, repeat))
+    
+    return {k: round(v, 3) for k, v in sorted(metrics.items())}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure executor and module orchestration overhead.')
+    add_common_arguments(parser, SUITE)
+    parser.add_argument('--latency', choices=DISTRIBUTIONS, default='fixed', help='fake backend latency distribution')
+    parser.add_argument('--latency-ms', type=float, default=5.0, help='mean latency of a fake command')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--samples', type=int, default=200, help='jobs timed for the callback latency')
+    parser.add_argument('--jobs', type=int, default=200, help='module runs queued at once')
+    parser.add_argument('--workers', type=int, default=1, help='executor threads for the queued runs')
+    args = parser.parse_args(argv)
+    
+    # Module logs still go to the log file, as in the application
+    get_logger().set_console_level(logging.CRITICAL + 1)
+    
+    metrics = measure(
+        args.latency, args.latency_ms, args.repeat, args.samples, args.jobs, args.workers, args.seed
+    )
+    return report(SUITE, metrics, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,285 @@
+"""
+Startup benchmark.
+Measures interpreter start, per-package import cost and time to the first painted window.
+
+Usage:
+    python -m benchmarks.startup                  # measure and check budgets
+    python -m benchmarks.startup --update-baseline
+    python -m benchmarks.startup --extra-modules 50
+
+The window is created with QT_QPA_PLATFORM=offscreen, so the suite runs on a
+headless Linux machine. Each measurement runs in a fresh interpreter and the
+median of --repeat runs is reported.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.common import add_common_arguments, report
+
+
+SUITE = 'startup'
+ROOT = Path(__file__).parent.parent
+
+# Import targets: the GUI entry point and the headless CLI
+IMPORT_TARGETS = ['src.app', 'src.cli']
+
+
+@dataclass
+class ImportRecord:
+    """One line of -X importtime output."""
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    Parse the stderr of python -X importtime.
+    
+    Lines that are not import timings (warnings, tracebacks) are ignored.
+    """
+    records: List[ImportRecord] = []
+    
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0])
+            cumulative_us = int(parts[1])
+        except ValueError:
+            continue  # header line
+        
+        name = parts[2].rstrip()
+        indent = len(name) - len(name.lstrip()) - 1
+        records.append(ImportRecord(
+            name=name.strip(),
+            self_us=self_us,
+            cumulative_us=cumulative_us,
+            depth=max(indent, 0) // 2
+        ))
+    
+    return records
+
+
+def package_group(name: str) -> str:
+    """
+    Group a module name for reporting.
+    
+    Project modules are grouped by subpackage (src.ui, src.modules, ...),
+    everything else by top-level package (PySide6, json, ...).
+    """
+    parts = name.split('.')
+    if parts[0] == 'src' and len(parts) > 1:
+        return '.'.join(parts[:2])
+    return parts[0]
+
+
+def group_import_times(records: List[ImportRecord]) -> Dict[str, float]:
+    """
+    Sum self time per package group, in milliseconds.
+    
+    Self times add up without double counting, unlike cumulative times.
+    """
+    groups: Dict[str, float] = {}
+    for record in records:
+        group = package_group(record.name)
+        groups[group] = groups.get(group, 0.0) + record.self_us / 1000
+    return groups
+
+
+def _python(args: List[str], env: Optional[Dict[str, str]] = None, timeout: int = 120) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env={**os.environ, **(env or {})},
+        timeout=timeout
+    )
+
+
+def measure_interpreter() -> float:
+    """Wall time of an interpreter that does nothing, in milliseconds."""
+    started = time.perf_counter()
+    _python(['-c', 'pass'])
+    return (time.perf_counter() - started) * 1000
+
+
+def measure_imports(target: str, top: int = 10) -> Optional[Dict[str, float]]:
+    """
+    Import cost of a module, in milliseconds.
+    
+    Returns:
+        'total' plus the most expensive package groups, or None if the
+        target cannot be imported here (e.g. PySide6 is missing)
+    """
+    completed = _python(['-X', 'importtime', '-c', f'import {target}'])
+    if completed.returncode != 0:
+        return None
+    
+    records = parse_importtime(completed.stderr)
+    total = next((r.cumulative_us for r in records if r.depth == 0 and r.name == target), 0) / 1000
+    
+    groups = sorted(group_import_times(records).items(), key=lambda item: item[1], reverse=True)
+    metrics = {'total': total}
+    metrics.update(dict(groups[:top]))
+    return metrics
+
+
+# Runs in a child process. Prints one JSON object with wall-clock marks, so
+# the parent can include interpreter start-up in the total.
+WINDOW_PROBE = '''
+import dataclasses, json, os, sys, time
+marks = {'start': time.time()}
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QApplication, QMessageBox
+from src.ui.main_window import MainWindow
+marks['imported'] = time.time()
+
+# Startup warnings (e.g. the compatibility check on Linux) would block on a
+# modal dialog nobody can click
+for name in ('information', 'warning', 'critical', 'question'):
+    setattr(QMessageBox, name, staticmethod(lambda *args, **kwargs: QMessageBox.No))
+
+# Pad the manifest with copies of a bug-fix module to see how startup scales
+from src.modules import registry
+template = registry.MANIFEST[1]
+registry.MANIFEST.extend(
+    dataclasses.replace(template, module_id=f'{template.module_id}{i}')
+    for i in range(int(os.environ.get('IWS_BENCH_EXTRA_MODULES', '0')))
+)
+
+app = QApplication(sys.argv)
+marks['application'] = time.time()
+
+window = MainWindow()
+marks['constructed'] = time.time()
+
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and 'painted' not in marks:
+            marks['painted'] = time.time()
+            QTimer.singleShot(0, app.quit)
+        return False
+
+
+painted = FirstPaint()
+window.installEventFilter(painted)
+QTimer.singleShot(10000, app.quit)
+marks['show'] = time.time()
+window.show()
+app.exec()
+print(json.dumps(marks))
+'''
+
+
+def measure_window(extra_modules: int = 0) -> Optional[Dict[str, float]]:
+    """
+    Time from process spawn to the first painted MainWindow, in milliseconds.
+    
+    Args:
+        extra_modules: Synthetic modules added to the manifest
+    
+    Returns:
+        Phase durations, or None if Qt is not available here
+    """
+    spawned = time.time()
+    try:
+        completed = _python(
+            ['-c', WINDOW_PROBE],
+            env={'QT_QPA_PLATFORM': 'offscreen', 'IWS_BENCH_EXTRA_MODULES': str(extra_modules)}
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    if completed.returncode != 0:
+        return None
+    
+    marks = json.loads(completed.stdout.strip().splitlines()[-1])
+    if 'painted' not in marks:
+        return None
+    
+    def span(start: float, end: float) -> float:
+        return (end - start) * 1000
+    
+    return {
+        'interpreter': span(spawned, marks['start']),
+        'import': span(marks['start'], marks['imported']),
+        'qapplication': span(marks['imported'], marks['application']),
+        'construct': span(marks['application'], marks['constructed']),
+        'first_show': span(marks['show'], marks['painted']),
+        'total': span(spawned, marks['painted']),
+    }
+
+
+def _median(samples: List[Optional[Dict[str, float]]]) -> Optional[Dict[str, float]]:
+    samples = [s for s in samples if s is not None]
+    if not samples:
+        return None
+    keys = set().union(*samples)
+    return {k: statistics.median(s[k] for s in samples if k in s) for k in keys}
+
+
+def run_suite(repeat: int = 5, extra_modules: int = 0) -> Dict[str, float]:
+    """
+    Run every measurement and return flat metrics in milliseconds.
+    
+    Metric names look like 'interpreter', 'imports.src.cli.total',
+    'imports.src.app.PySide6' and 'window.construct'. With extra_modules,
+    the window is measured again with a padded manifest under
+    'window.<n>_extra.*'. Measurements that cannot run here are left out.
+    """
+    metrics: Dict[str, float] = {
+        'interpreter': statistics.median(measure_interpreter() for _ in range(repeat))
+    }
+    
+    for target in IMPORT_TARGETS:
+        result = _median([measure_imports(target) for _ in range(repeat)])
+        if result is None:
+            print(f'skipped: {target} cannot be imported', file=sys.stderr)
+            continue
+        metrics.update({f'imports.{target}.{k}': v for k, v in result.items()})
+    
+    window = _median([measure_window() for _ in range(repeat)])
+    if window is None:
+        print('skipped: MainWindow could not be shown (is PySide6 installed?)', file=sys.stderr)
+    else:
+        metrics.update({f'window.{k}': v for k, v in window.items()})
+    
+    if extra_modules and window is not None:
+        padded = _median([measure_window(extra_modules) for _ in range(repeat)])
+        if padded is not None:
+            metrics.update({f'window.{extra_modules}_extra.{k}': v for k, v in padded.items()})
+    
+    return {k: round(v, 2) for k, v in sorted(metrics.items())}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure IWS-WinCare startup time.')
+    add_common_arguments(parser, SUITE)
+    parser.add_argument(
+        '--extra-modules', type=int, default=0,
+        help='also measure the window with this many synthetic modules'
+    )
+    args = parser.parse_args(argv)
+    
+    metrics = run_suite(repeat=args.repeat, extra_modules=args.extra_modules)
+    return report(SUITE, metrics, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
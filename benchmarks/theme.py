@@ -0,0 +1,103 @@
+"""
+Theme toggle benchmark.
+Measures card construction and theme switch latency as the number of cards grows.
+
+Usage:
+    python -m benchmarks.theme
+    python -m benchmarks.theme --cards 14 100 400 --update-baseline
+
+Runs in-process with QT_QPA_PLATFORM=offscreen. Each card count lists that
+many copies of the manifest's modules in a ModuleBrowser, whose
+ModuleCardDelegate paints only the visible rows. A toggle is timed from
+setStyleSheet until the browser has been re-polished and rendered.
+"""
+
+import argparse
+import itertools
+import os
+import statistics
+import sys
+import time
+from dataclasses import replace
+from typing import Dict, List, Optional
+
+from benchmarks.common import add_common_arguments, report
+
+
+SUITE = 'theme'
+DEFAULT_CARD_COUNTS = [14, 100, 400]
+# Tab the benchmark's module specs are listed on
+TAB = 'bugfix'
+WINDOW_SIZE = (1000, 700)
+
+
+def measure(card_counts: List[int], repeat: int) -> Dict[str, float]:
+    """
+    Build a module browser per card count and toggle its theme repeatedly.
+    
+    Returns:
+        'cards.<n>' construction time and 'toggle.<n>' median toggle time,
+        in milliseconds
+    """
+    from PySide6.QtWidgets import QApplication
+    
+    from src.modules.registry import MANIFEST, ModuleRegistry
+    from src.ui.styles import Styles
+    from src.ui.widgets import ModuleBrowser, ModuleListModel
+    
+    app = QApplication.instance() or QApplication(sys.argv)
+    metrics: Dict[str, float] = {}
+    
+    for count in card_counts:
+        specs = [
+            replace(spec, module_id=f'{spec.module_id}{i}', tab=TAB)
+            for i, spec in zip(range(count), itertools.cycle(MANIFEST))
+        ]
+        
+        started = time.perf_counter()
+        model = ModuleListModel(ModuleRegistry(specs, load_entry_points=False))
+        browser = ModuleBrowser(model, TAB)
+        browser.setStyleSheet(Styles.get_theme(True))
+        browser.set_dark_mode(True)
+        browser.resize(*WINDOW_SIZE)
+        browser.show()
+        browser.grab()
+        metrics[f'cards.{count}'] = (time.perf_counter() - started) * 1000
+        
+        samples = []
+        dark_mode = True
+        for _ in range(repeat):
+            dark_mode = not dark_mode
+            started = time.perf_counter()
+            browser.setStyleSheet(Styles.get_theme(dark_mode))
+            browser.set_dark_mode(dark_mode)
+            app.processEvents()
+            browser.grab()
+            samples.append((time.perf_counter() - started) * 1000)
+        metrics[f'toggle.{count}'] = statistics.median(samples)
+        
+        browser.close()
+        browser.deleteLater()
+        app.processEvents()
+    
+    return {k: round(v, 2) for k, v in sorted(metrics.items())}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure theme toggle latency against card count.')
+    add_common_arguments(parser, SUITE)
+    parser.add_argument('--cards', type=int, nargs='+', default=DEFAULT_CARD_COUNTS)
+    args = parser.parse_args(argv)
+    
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    try:
+        import PySide6  # noqa: F401
+    except ImportError:
+        print('skipped: PySide6 is not installed', file=sys.stderr)
+        return 0
+    
+    return report(SUITE, measure(args.cards, args.repeat), args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,7 +10,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
 from src.ui.main_window import MainWindow
-from src.system.platform_check import PlatformCheck
+from src.system.snapshot import get_snapshot
 from src.utils.logger import get_logger
 
 
@@ -19,7 +19,7 @@ def main() -> int:
     logger = get_logger()
     logger.info('IWS-WinCare starting')
     
-    system_info = PlatformCheck.check_system()
+    system_info = get_snapshot()
     logger.info(
         f'System: {system_info.os_name} {system_info.os_version} '
         f'({system_info.architecture})'
@@ -0,0 +1,410 @@
+"""
+IWS-WinCare - Command line entry point.
+Lists and runs modules without loading the graphical interface, and
+summarizes recorded timings.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from src.core.executor import ExecutionResult, ExecutionStatus, ModuleExecutor
+from src.core.reboot import RebootManager
+from src.modules.registry import ModuleRegistry
+from src.system.snapshot import get_snapshot
+from src.utils.events import (
+    DEFAULT_EVENT_DIR, SUMMARY_KEYS, SUMMARY_SORTS, event_files, read_events, summarize
+)
+from src.utils.log_search import (
+    DEFAULT_LOG_DIR, LEVELS, log_files, parse_time, read_from, search_files, tail
+)
+from src.utils.logger import get_logger
+from src.utils.tracing import set_sample_rate
+
+
+# Process exit code per final execution status. 2 is left to argparse for
+# usage errors such as an unknown module id.
+EXIT_CODES: Dict[ExecutionStatus, int] = {
+    ExecutionStatus.SUCCESS: 0,
+    ExecutionStatus.FAILED: 1,
+    ExecutionStatus.CANCELLED: 3,
+}
+EXIT_USAGE = 2
+
+# Seconds between checks for new lines with 'logs --follow'
+FOLLOW_INTERVAL = 0.5
+
+# A batch reports its worst result
+_SEVERITY = [ExecutionStatus.FAILED, ExecutionStatus.CANCELLED, ExecutionStatus.SUCCESS]
+
+
+def exit_code(status: ExecutionStatus) -> int:
+    """Exit code for a final status; anything unfinished counts as failed."""
+    return EXIT_CODES.get(status, EXIT_CODES[ExecutionStatus.FAILED])
+
+
+def result_to_dict(module_id: str, name: str, result: ExecutionResult) -> Dict[str, Any]:
+    """JSON-serializable form of an execution result."""
+    return {
+        'module_id': module_id,
+        'name': name,
+        'status': result.status.value,
+        'message': result.message,
+        'details': result.details,
+        'reboot_required': result.reboot_required,
+        'error': str(result.error) if result.error else None,
+        'timings': result.timings.to_dict() if result.timings else None,
+    }
+
+
+class EventWriter:
+    """Writes one JSON object per line and flushes, so callers can stream it."""
+    
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+        self._lock = threading.Lock()
+    
+    def emit(self, event: str, **fields: Any) -> None:
+        line = json.dumps({'event': event, **fields})
+        with self._lock:
+            self._stream.write(line + '\n')
+            self._stream.flush()
+
+
+class ProgressHandler(logging.Handler):
+    """Forwards log records as progress events while a module runs."""
+    
+    def __init__(self, writer: EventWriter, module_id: str) -> None:
+        super().__init__(logging.INFO)
+        self._writer = writer
+        self._module_id = module_id
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._writer.emit(
+                'progress',
+                module_id=self._module_id,
+                level=record.levelname.lower(),
+                message=record.getMessage()
+            )
+        except Exception:
+            self.handleError(record)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='iws-wincare-cli',
+        description='Run IWS-WinCare repair and reset modules without the GUI.'
+    )
+    parser.add_argument(
+        '-v', '--verbose', action='store_true',
+        help='also write the application log to stderr'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    list_parser = commands.add_parser('list', help='list available modules')
+    list_parser.add_argument('--tab', choices=['bugfix', 'reset'], help='only modules on this tab')
+    list_parser.add_argument(
+        '--check', action='store_true',
+        help='also check whether each module can run on this machine'
+    )
+    
+    run_parser = commands.add_parser('run', help='run one or more modules in order')
+    run_parser.add_argument('module_ids', nargs='+', metavar='MODULE_ID')
+    run_parser.add_argument(
+        '-y', '--yes', action='store_true',
+        help='confirm critical modules instead of skipping them'
+    )
+    run_parser.add_argument(
+        '--stop-on-failure', action='store_true',
+        help='skip the remaining modules once one fails'
+    )
+    run_parser.add_argument(
+        '--trace', action='store_true',
+        help='trace every module run to logs/trace_*.json instead of a sample'
+    )
+    
+    stats_parser = commands.add_parser('stats', help='summarize recorded module and command timings')
+    stats_parser.add_argument(
+        '--by', choices=sorted(SUMMARY_KEYS), default='module',
+        help='group durations per module, per command line or per UI stall site'
+    )
+    stats_parser.add_argument('--module', metavar='MODULE_ID', help='only runs of this module')
+    stats_parser.add_argument(
+        '--sort', choices=sorted(SUMMARY_SORTS), default='duration',
+        help='order groups by total duration, CPU time, peak memory or I/O of spawned commands'
+    )
+    stats_parser.add_argument(
+        '--dir', type=Path, default=DEFAULT_EVENT_DIR,
+        help='folder containing events_*.jsonl files'
+    )
+    
+    logs_parser = commands.add_parser('logs', help='search or follow the application logs')
+    logs_parser.add_argument('query', nargs='?', default='', help='text to look for (case-insensitive)')
+    logs_parser.add_argument('--level', choices=LEVELS, help='lowest level to show')
+    logs_parser.add_argument('--run', metavar='RUN_ID', help='only lines logged during this run')
+    logs_parser.add_argument('--since', type=parse_time, help="e.g. '2026-10-19 14:00'")
+    logs_parser.add_argument('--until', type=parse_time)
+    logs_parser.add_argument(
+        '--tail', type=int, metavar='N',
+        help='show the last N lines of the newest log instead of searching'
+    )
+    logs_parser.add_argument(
+        '-f', '--follow', action='store_true',
+        help='keep printing lines as they are added to the newest log'
+    )
+    logs_parser.add_argument(
+        '--dir', type=Path, default=DEFAULT_LOG_DIR,
+        help='folder containing toolkit_*.log files'
+    )
+    
+    return parser
+
+
+def cmd_list(registry: ModuleRegistry, tab: Optional[str], check: bool, out: TextIO) -> int:
+    """Print module metadata as a JSON document."""
+    module_ids = registry.ids(tab=tab)
+    
+    capabilities = {}
+    if check:
+        # Imported here: plain listing needs no service or snapshot code
+        from src.core.capabilities import CapabilityProbe
+        specs = registry.specs()
+        capabilities = CapabilityProbe({m: specs[m] for m in module_ids}).run()
+    
+    modules = []
+    for module_id in module_ids:
+        info = registry.info(module_id)
+        entry = {
+            'module_id': module_id,
+            'tab': registry.spec(module_id).tab,
+            'name': info.name,
+            'description': info.description,
+            'category': info.category,
+            'requires_admin': info.requires_admin,
+            'requires_reboot': info.requires_reboot,
+            'is_critical': info.is_critical,
+        }
+        if module_id in capabilities:
+            entry['available'] = capabilities[module_id].available
+            entry['reasons'] = list(capabilities[module_id].reasons)
+        modules.append(entry)
+    
+    json.dump({'modules': modules}, out, indent=2)
+    out.write('\n')
+    return 0
+
+
+def _run_module(
+    executor: ModuleExecutor,
+    registry: ModuleRegistry,
+    module_id: str,
+    writer: EventWriter
+) -> Tuple[ExecutionResult, bool]:
+    """
+    Run one module and wait for it.
+    
+    Ctrl+C cancels the run but still waits for the module to return, since
+    stopping it halfway could leave the system in a partial state.
+    
+    Returns:
+        The result, and whether the run was interrupted
+    """
+    try:
+        module = registry[module_id]
+    except Exception as e:
+        get_logger().exception(f'Could not load module {module_id}')
+        result = ExecutionResult(
+            status=ExecutionStatus.FAILED,
+            message='Module could not be loaded',
+            details=str(e),
+            error=e
+        )
+        return result, False
+    
+    future = executor.execute(
+        module.execute,
+        on_progress=lambda message: writer.emit('progress', module_id=module_id, level='info', message=message)
+    )
+    
+    try:
+        return future.result(), False
+    except KeyboardInterrupt:
+        executor.cancel()
+        writer.emit(
+            'progress', module_id=module_id, level='warning',
+            message='Interrupted, waiting for the module to finish its current step...'
+        )
+    
+    try:
+        return future.result(), True
+    except CancelledError:
+        return ExecutionResult(status=ExecutionStatus.CANCELLED, message='Execution cancelled'), True
+
+
+def cmd_run(
+    registry: ModuleRegistry,
+    module_ids: List[str],
+    confirmed: bool,
+    stop_on_failure: bool,
+    writer: EventWriter
+) -> int:
+    """Run modules in order, streaming progress and results as JSON lines."""
+    unknown = [m for m in module_ids if m not in registry]
+    if unknown:
+        writer.emit('error', message=f'Unknown module id(s): {", ".join(unknown)}')
+        return EXIT_USAGE
+    
+    snapshot = get_snapshot()
+    if not snapshot.is_compatible:
+        writer.emit('error', message=snapshot.compatibility_message)
+        return exit_code(ExecutionStatus.FAILED)
+    
+    logger = get_logger()
+    executor = ModuleExecutor()
+    reboot_manager = RebootManager()
+    results: List[Dict[str, Any]] = []
+    skip_reason: Optional[str] = None
+    interrupted = False
+    
+    for module_id in module_ids:
+        info = registry.info(module_id)
+        
+        if skip_reason:
+            result = ExecutionResult(status=ExecutionStatus.CANCELLED, message=skip_reason)
+        elif info.is_critical and not confirmed:
+            result = ExecutionResult(
+                status=ExecutionStatus.CANCELLED,
+                message='Critical module skipped: pass --yes to confirm'
+            )
+        else:
+            if info.requires_reboot:
+                reboot_manager.expect(module_id)
+            
+            writer.emit('started', module_id=module_id, name=info.name)
+            handler = ProgressHandler(writer, module_id)
+            logger.add_handler(handler)
+            try:
+                result, interrupted = _run_module(executor, registry, module_id, writer)
+            finally:
+                logger.remove_handler(handler)
+            
+            if info.requires_reboot or result.reboot_required:
+                if result.success:
+                    reboot_manager.require(module_id, info.name)
+                else:
+                    reboot_manager.forget(module_id)
+        
+        logger.info(f'Execution of {module_id} completed: {result.status.value} - {result.message}')
+        entry = result_to_dict(module_id, info.name, result)
+        writer.emit('finished', **entry)
+        results.append(entry)
+        
+        if skip_reason is None:
+            if interrupted:
+                skip_reason = 'Skipped after interruption'
+            elif stop_on_failure and result.status == ExecutionStatus.FAILED:
+                skip_reason = 'Skipped after earlier failure'
+    
+    executor.shutdown(wait=True)
+    
+    statuses = {ExecutionStatus(r['status']) for r in results}
+    status = next(s for s in _SEVERITY if s in statuses)
+    writer.emit(
+        'summary',
+        status=status.value,
+        exit_code=exit_code(status),
+        reboot_required=reboot_manager.has_pending,
+        results=results
+    )
+    return exit_code(status)
+
+
+def cmd_stats(
+    directory: Path,
+    by: str,
+    module_id: Optional[str],
+    out: TextIO,
+    sort: str = 'duration'
+) -> int:
+    """Print duration percentiles and resource totals from the event logs as a JSON document."""
+    files = event_files(directory)
+    groups = summarize(read_events(files), by=by, module_id=module_id, sort=sort)
+    
+    json.dump({'by': by, 'sort': sort, 'files': len(files), 'groups': groups}, out, indent=2)
+    out.write('\n')
+    return 0
+
+
+def cmd_logs(args: argparse.Namespace, out: TextIO) -> int:
+    """Search the text logs, or print and follow the end of the newest one."""
+    files = log_files(args.dir)
+    
+    if args.tail is None and not args.follow:
+        filters = {
+            'query': args.query, 'min_level': args.level, 'run_id': args.run,
+            'since': args.since, 'until': args.until,
+        }
+        show_names = len(files) > 1
+        for match in search_files(files, **filters):
+            prefix = f'{match.path.name}: ' if show_names else ''
+            out.write(f'{prefix}{match.text}\n')
+        out.flush()
+        return 0
+    
+    plain = [path for path in files if path.suffix == '.log']
+    if not plain:
+        return 0
+    
+    # The session's active file has no rotation number
+    path = next((p for p in reversed(plain) if p.stem.count('.') == 0), plain[-1])
+    lines, offset = tail(path, args.tail if args.tail is not None else 10)
+    while True:
+        for line in lines:
+            out.write(line + '\n')
+        out.flush()
+        if not args.follow:
+            return 0
+        try:
+            time.sleep(FOLLOW_INTERVAL)
+        except KeyboardInterrupt:
+            return 0
+        lines, offset = read_from(path, offset)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    args = _build_parser().parse_args(argv)
+    
+    logger = get_logger()
+    logger.set_console_level(logging.DEBUG if args.verbose else logging.CRITICAL + 1)
+    
+    registry = ModuleRegistry()
+    
+    if args.command == 'list':
+        return cmd_list(registry, args.tab, args.check, sys.stdout)
+    if args.command == 'stats':
+        return cmd_stats(args.dir, args.by, args.module, sys.stdout, args.sort)
+    if args.command == 'logs':
+        return cmd_logs(args, sys.stdout)
+    
+    if args.trace:
+        set_sample_rate(1.0)
+    
+    return cmd_run(
+        registry,
+        args.module_ids,
+        confirmed=args.yes,
+        stop_on_failure=args.stop_on_failure,
+        writer=EventWriter(sys.stdout)
+    )
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Module capability probing.
+Checks in the background which modules can run on this machine.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from src.system.services import get_service_inventory
+from src.system.snapshot import get_snapshot
+from src.utils.logger import get_logger
+
+
+@dataclass(frozen=True)
+class Capability:
+    """Whether a module can run, and why not."""
+    module_id: str
+    reasons: Tuple[str, ...] = ()
+    
+    @property
+    def available(self) -> bool:
+        return not self.reasons
+    
+    @property
+    def tooltip(self) -> str:
+        if self.available:
+            return ''
+        return 'Unavailable:\n' + '\n'.join(f'- {reason}' for reason in self.reasons)
+
+
+class CapabilityProbe:
+    """
+    Evaluates module requirements concurrently on background threads.
+    Results are delivered one by one as they complete.
+    """
+    
+    def __init__(self, modules: Mapping[str, Any], max_workers: int = 4) -> None:
+        """
+        Args:
+            modules: Objects with missing_requirements() keyed by module id,
+                such as ModuleRegistry.specs(), which answer from metadata
+                without importing module code, or module instances
+            max_workers: Requirement checks run in parallel
+        """
+        self._logger = get_logger()
+        self._modules = modules
+        self._max_workers = max_workers
+        self._thread: Optional[threading.Thread] = None
+    
+    def probe(self, module_id: str) -> Capability:
+        """Check a single module."""
+        try:
+            reasons = self._modules[module_id].missing_requirements()
+        except Exception as e:
+            self._logger.exception(f'Capability check failed for {module_id}')
+            reasons = [f'Capability check failed: {e}']
+        return Capability(module_id=module_id, reasons=tuple(reasons))
+    
+    def run(self, on_result: Optional[Callable[[Capability], None]] = None) -> Dict[str, Capability]:
+        """
+        Probe all modules and wait for the results.
+        
+        Args:
+            on_result: Called from a worker thread as each result arrives
+        
+        Returns:
+            Capabilities keyed by module id
+        """
+        # Shared facts are gathered once up front rather than raced for by workers
+        get_snapshot()
+        get_service_inventory()
+        
+        results: Dict[str, Capability] = {}
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix='capability') as pool:
+            futures = [pool.submit(self.probe, module_id) for module_id in list(self._modules)]
+            for future in as_completed(futures):
+                capability = future.result()
+                results[capability.module_id] = capability
+                if on_result:
+                    on_result(capability)
+        
+        unavailable = sum(1 for c in results.values() if not c.available)
+        self._logger.info(f'Capability probe finished: {unavailable} of {len(results)} module(s) unavailable')
+        return results
+    
+    def start(self, on_result: Callable[[Capability], None]) -> None:
+        """Run the probe on a background thread."""
+        self._thread = threading.Thread(
+            target=self.run,
+            args=(on_result,),
+            name='CapabilityProbe',
+            daemon=True
+        )
+        self._thread.start()
@@ -5,11 +5,17 @@ Handles async execution of repair and reset modules with proper error handling.
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Callable, Optional, Any
+from functools import partial
+from typing import Callable, Dict, List, Optional, Any
 from concurrent.futures import ThreadPoolExecutor, Future
+import contextvars
 import threading
 
+from .journal import ExecutionJournal, JournalRun, RunState, get_journal
+from ..system.platform_check import PlatformCheck
 from ..utils.logger import get_logger
+from ..utils.timings import ExecutionTimings
+from ..utils.tracing import get_tracer
 
 
 class ExecutionStatus(Enum):
@@ -28,6 +34,8 @@ class ExecutionResult:
     message: str
     details: Optional[str] = None
     error: Optional[Exception] = None
+    reboot_required: bool = False
+    timings: Optional[ExecutionTimings] = None
     
     @property
     def success(self) -> bool:
@@ -76,7 +84,10 @@ class ModuleExecutor:
                 if on_progress:
                     on_progress('Starting execution...')
                 
-                result = module_func()
+                with get_tracer().trace('executor.execute') as span:
+                    result = module_func()
+                    if span is not None:
+                        span.set(status=result.status.value)
                 
                 if self._cancel_flag.is_set():
                     return ExecutionResult(
@@ -107,7 +118,9 @@ class ModuleExecutor:
                         error=e
                     ))
         
-        self._current_task = self._executor.submit(wrapper)
+        # The caller's context carries any open span over to the worker thread
+        context = contextvars.copy_context()
+        self._current_task = self._executor.submit(context.run, wrapper)
         self._current_task.add_done_callback(done_callback)
         
         return self._current_task
@@ -115,7 +128,8 @@ class ModuleExecutor:
     def execute_sync(self, module_func: Callable[[], ExecutionResult]) -> ExecutionResult:
         """Execute a module function synchronously."""
         try:
-            return module_func()
+            with get_tracer().trace('executor.execute_sync'):
+                return module_func()
         except Exception as e:
             self._logger.exception('Sync module execution failed')
             return ExecutionResult(
@@ -125,6 +139,69 @@ class ModuleExecutor:
                 error=e
             )
     
+    def recover(
+        self,
+        modules: Dict[str, Any],
+        runs: Optional[List[JournalRun]] = None,
+        journal: Optional[ExecutionJournal] = None,
+        on_complete: Optional[Callable[[str, ExecutionResult], None]] = None,
+        compensate_only: bool = False
+    ) -> List[str]:
+        """
+        Resume, compensate or continue journaled runs from a previous session.
+        
+        Interrupted runs are resumed from the last committed step or rolled
+        back, depending on the module's resume_policy. Runs parked for a
+        restart continue only once the machine has actually rebooted.
+        
+        Args:
+            modules: Module instances keyed by module id
+            runs: Runs to recover (defaults to all pending journal runs)
+            journal: Journal to read from (defaults to the shared journal)
+            on_complete: Callback receiving module id and result per run
+            compensate_only: Roll back interrupted runs instead of resuming
+        
+        Returns:
+            Module ids for which recovery was scheduled
+        """
+        journal = journal or get_journal()
+        if runs is None:
+            runs = journal.pending_runs()
+        
+        scheduled: List[str] = []
+        
+        for run in runs:
+            module = modules.get(run.module_id)
+            if module is None:
+                self._logger.warning(f'Discarding journal for unknown module: {run.module_id}')
+                journal.discard(run)
+                continue
+            
+            if run.state == RunState.AWAITING_REBOOT:
+                if not PlatformCheck.has_rebooted_since(run.boot_time):
+                    continue
+                func = partial(module.continue_after_reboot, run)
+            elif not run.started_steps:
+                self._logger.warning(
+                    f'Discarding interrupted run of {run.module_id}: no journaled steps'
+                )
+                journal.discard(run)
+                continue
+            elif compensate_only or module.resume_policy == 'compensate':
+                func = partial(module.compensate, run)
+            else:
+                func = partial(module.execute, resume=run)
+            
+            callback = None
+            if on_complete:
+                callback = partial(on_complete, run.module_id)
+            
+            self._logger.info(f'Recovering {run.state.value} run of {run.module_id}')
+            self.execute(func, on_complete=callback)
+            scheduled.append(run.module_id)
+        
+        return scheduled
+    
     def cancel(self) -> bool:
         """Request cancellation of current execution."""
         self._cancel_flag.set()
@@ -136,6 +213,6 @@ class ModuleExecutor:
         """Check if an execution is currently in progress."""
         return self._current_task is not None and not self._current_task.done()
     
-    def shutdown(self) -> None:
+    def shutdown(self, wait: bool = False) -> None:
         """Shutdown the executor and release resources."""
-        self._executor.shutdown(wait=False)
+        self._executor.shutdown(wait=wait)
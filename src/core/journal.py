@@ -0,0 +1,324 @@
+"""
+Crash-safe execution journal.
+Write-ahead log of module step starts and completions, used to resume or
+compensate runs interrupted by a crash or a system restart.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO
+
+from src.utils.logger import get_logger
+
+
+DEFAULT_JOURNAL_DIR = Path(__file__).parent.parent.parent / 'logs' / 'journal'
+
+
+class RunState(Enum):
+    """Lifecycle state of a journaled run."""
+    RUNNING = 'running'
+    AWAITING_REBOOT = 'awaiting_reboot'
+    FINISHED = 'finished'
+
+
+@dataclass
+class JournalRun:
+    """Replayed state of a single journaled module run."""
+    run_id: str
+    module_id: str
+    path: Path
+    state: RunState = RunState.RUNNING
+    boot_time: float = 0.0
+    started_steps: List[str] = field(default_factory=list)
+    committed_steps: Dict[str, str] = field(default_factory=dict)
+    continuations: List[str] = field(default_factory=list)
+    
+    @property
+    def is_interrupted(self) -> bool:
+        """Run stopped without recording its end."""
+        return self.state == RunState.RUNNING
+    
+    @property
+    def last_committed_step(self) -> Optional[str]:
+        """Most recent step that completed before the interruption."""
+        committed = [s for s in self.started_steps if s in self.committed_steps]
+        return committed[-1] if committed else None
+    
+    @property
+    def uncommitted_steps(self) -> List[str]:
+        """Steps that were started but never committed."""
+        return [s for s in self.started_steps if s not in self.committed_steps]
+
+
+class JournalWriter:
+    """
+    Append-only JSON-lines writer with batched fsync.
+    The file is created by the first record. Records are flushed on every
+    append; fsync is deferred until the batch interval elapses or a caller
+    requests a durable barrier.
+    """
+    
+    def __init__(self, path: Path, fsync_interval: float = 0.5) -> None:
+        self._path = path
+        self._fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._file: Optional[TextIO] = None
+        self._last_sync = time.monotonic()
+        self._dirty = False
+    
+    @property
+    def path(self) -> Path:
+        return self._path
+    
+    def append(self, record: Dict[str, Any], durable: bool = False) -> None:
+        """
+        Append a record.
+        
+        Args:
+            record: JSON-serialisable record
+            durable: Force fsync before returning (write-ahead barrier)
+        """
+        line = json.dumps(record, separators=(',', ':'))
+        
+        with self._lock:
+            if self._file is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self._path, 'a', encoding='utf-8')
+            self._file.write(line + '\n')
+            self._file.flush()
+            self._dirty = True
+            
+            now = time.monotonic()
+            if durable or now - self._last_sync >= self._fsync_interval:
+                os.fsync(self._file.fileno())
+                self._last_sync = now
+                self._dirty = False
+    
+    def sync(self) -> None:
+        """Fsync any records written since the last barrier."""
+        with self._lock:
+            if self._dirty and self._file is not None and not self._file.closed:
+                os.fsync(self._file.fileno())
+                self._last_sync = time.monotonic()
+                self._dirty = False
+    
+    def close(self) -> None:
+        """Sync and close the underlying file."""
+        self.sync()
+        with self._lock:
+            if self._file is not None and not self._file.closed:
+                self._file.close()
+
+
+class RunHandle:
+    """
+    Journal handle for one module run.
+    
+    A new run writes nothing until its first step or continuation, so runs
+    of modules without journaled steps cost no file and no fsync.
+    """
+    
+    def __init__(
+        self,
+        run: JournalRun,
+        writer: JournalWriter,
+        header: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Args:
+            run: Replayed or new run state
+            writer: Writer of the run's journal file
+            header: run_start record written ahead of the first record
+        """
+        self._run = run
+        self._writer = writer
+        self._header = header
+    
+    def _append(self, record: Dict[str, Any], durable: bool = False) -> None:
+        if self._header is not None:
+            self._writer.append(self._header)
+            self._header = None
+        self._writer.append(record, durable=durable)
+    
+    @property
+    def run(self) -> JournalRun:
+        return self._run
+    
+    def is_committed(self, step_id: str) -> bool:
+        """Check whether a step already completed in an earlier attempt."""
+        return step_id in self._run.committed_steps
+    
+    def step_started(self, step_id: str) -> None:
+        """Record that a step is about to run (durable before side effects)."""
+        if step_id not in self._run.started_steps:
+            self._run.started_steps.append(step_id)
+        self._append({'type': 'step_start', 'step': step_id, 'ts': time.time()}, durable=True)
+    
+    def step_committed(self, step_id: str, detail: str = '') -> None:
+        """Record that a step completed."""
+        self._run.committed_steps[step_id] = detail
+        self._append({'type': 'step_commit', 'step': step_id, 'detail': detail, 'ts': time.time()})
+    
+    def add_continuation(self, name: str) -> None:
+        """Register a continuation to run after the next restart."""
+        if name not in self._run.continuations:
+            self._run.continuations.append(name)
+        self._append({'type': 'continuation', 'name': name, 'ts': time.time()})
+    
+    def await_reboot(self, boot_time: float) -> None:
+        """Park the run until the machine has restarted."""
+        self._run.state = RunState.AWAITING_REBOOT
+        self._run.boot_time = boot_time
+        # The record lists the continuations still to run, replacing those
+        # registered before an earlier restart
+        self._append(
+            {
+                'type': 'await_reboot',
+                'boot_time': boot_time,
+                'continuations': list(self._run.continuations),
+                'ts': time.time()
+            },
+            durable=True
+        )
+        self._writer.close()
+    
+    def finish(self, status: str) -> None:
+        """Record the end of the run and discard its journal file."""
+        self._run.state = RunState.FINISHED
+        if self._header is not None:
+            # Nothing was journaled, so there is no file to close out
+            return
+        
+        self._writer.append({'type': 'run_end', 'status': status, 'ts': time.time()}, durable=True)
+        self._writer.close()
+        
+        try:
+            self._run.path.unlink()
+        except OSError:
+            pass
+
+
+class ExecutionJournal:
+    """Directory of per-run write-ahead journals."""
+    
+    SUFFIX = '.wal'
+    
+    def __init__(self, directory: Optional[Path] = None, fsync_interval: float = 0.5) -> None:
+        self._logger = get_logger()
+        self._directory = directory or DEFAULT_JOURNAL_DIR
+        self._fsync_interval = fsync_interval
+    
+    @property
+    def directory(self) -> Path:
+        return self._directory
+    
+    def begin(self, module_id: str, boot_time: float = 0.0) -> RunHandle:
+        """Start journaling a new module run; its file is written on the first step."""
+        run_id = uuid.uuid4().hex[:12]
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        path = self._directory / f'run_{timestamp}_{run_id}{self.SUFFIX}'
+        
+        run = JournalRun(run_id=run_id, module_id=module_id, path=path, boot_time=boot_time)
+        header = {
+            'type': 'run_start',
+            'run_id': run_id,
+            'module_id': module_id,
+            'boot_time': boot_time,
+            'ts': time.time()
+        }
+        return RunHandle(run, JournalWriter(path, self._fsync_interval), header)
+    
+    def reopen(self, run: JournalRun) -> RunHandle:
+        """Continue appending to an existing run journal."""
+        run.state = RunState.RUNNING
+        writer = JournalWriter(run.path, self._fsync_interval)
+        writer.append({'type': 'run_resume', 'ts': time.time()}, durable=True)
+        return RunHandle(run, writer)
+    
+    def load(self, path: Path) -> Optional[JournalRun]:
+        """
+        Replay a journal file.
+        A torn trailing record from a crash mid-write is ignored.
+        """
+        run: Optional[JournalRun] = None
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    
+                    kind = record.get('type')
+                    if kind == 'run_start':
+                        run = JournalRun(
+                            run_id=record['run_id'],
+                            module_id=record['module_id'],
+                            path=path,
+                            boot_time=record.get('boot_time', 0.0)
+                        )
+                    elif run is None:
+                        continue
+                    elif kind == 'step_start':
+                        if record['step'] not in run.started_steps:
+                            run.started_steps.append(record['step'])
+                    elif kind == 'step_commit':
+                        run.committed_steps[record['step']] = record.get('detail', '')
+                    elif kind == 'continuation':
+                        if record['name'] not in run.continuations:
+                            run.continuations.append(record['name'])
+                    elif kind == 'await_reboot':
+                        run.state = RunState.AWAITING_REBOOT
+                        run.boot_time = record.get('boot_time', run.boot_time)
+                        run.continuations = list(record.get('continuations', run.continuations))
+                    elif kind == 'run_resume':
+                        run.state = RunState.RUNNING
+                    elif kind == 'run_end':
+                        run.state = RunState.FINISHED
+        except OSError:
+            self._logger.warning(f'Could not read journal: {path}')
+            return None
+        
+        return run
+    
+    def pending_runs(self) -> List[JournalRun]:
+        """Return runs that were interrupted or are waiting for a restart."""
+        if not self._directory.exists():
+            return []
+        
+        pending: List[JournalRun] = []
+        for path in sorted(self._directory.glob(f'*{self.SUFFIX}')):
+            run = self.load(path)
+            if run is None:
+                continue
+            if run.state == RunState.FINISHED:
+                self.discard(run)
+                continue
+            pending.append(run)
+        
+        return pending
+    
+    def discard(self, run: JournalRun) -> None:
+        """Remove a run journal that needs no further handling."""
+        try:
+            run.path.unlink()
+        except OSError:
+            pass
+
+
+_journal: Optional[ExecutionJournal] = None
+
+
+def get_journal() -> ExecutionJournal:
+    """Get the shared execution journal."""
+    global _journal
+    if _journal is None:
+        _journal = ExecutionJournal()
+    return _journal
@@ -0,0 +1,221 @@
+"""
+Session-level reboot coordination.
+Collects reboot requirements from a batch of modules so the user is asked
+to restart once, optionally inside a scheduled maintenance window.
+"""
+
+import json
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from src.system.commands import CommandRunner, CommandResult
+from src.system.platform_check import PlatformCheck
+from src.utils.logger import get_logger
+
+
+DEFAULT_STATE_PATH = Path(__file__).parent.parent.parent / 'logs' / 'post_reboot.json'
+
+# Upper bound accepted by shutdown.exe /t
+MAX_SHUTDOWN_DELAY = 315360000
+
+
+@dataclass
+class RebootRequirement:
+    """A module run whose changes only take effect after a restart."""
+    module_id: str
+    module_name: str
+    requested_at: float
+
+
+def parse_restart_window(window: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a restart window like '02:00-04:30'.
+    
+    Returns:
+        (start, end) as minutes after midnight, or None if empty or invalid
+    """
+    try:
+        start_text, end_text = window.split('-')
+        start_h, start_m = (int(part) for part in start_text.strip().split(':'))
+        end_h, end_m = (int(part) for part in end_text.strip().split(':'))
+    except (AttributeError, ValueError):
+        return None
+    
+    if not (0 <= start_h < 24 and 0 <= end_h < 24 and 0 <= start_m < 60 and 0 <= end_m < 60):
+        return None
+    
+    return start_h * 60 + start_m, end_h * 60 + end_m
+
+
+def seconds_until_window(window: str, now: Optional[datetime] = None) -> Optional[int]:
+    """
+    Seconds from now until the restart window opens.
+    Returns 0 if the window is currently open, None if the window is invalid.
+    """
+    parsed = parse_restart_window(window)
+    if parsed is None:
+        return None
+    
+    start, end = parsed
+    now = now or datetime.now()
+    minute = now.hour * 60 + now.minute
+    
+    if start <= end:
+        inside = start <= minute < end
+    else:
+        # Window wraps past midnight, e.g. 23:00-02:00
+        inside = minute >= start or minute < end
+    
+    if inside:
+        return 0
+    
+    opens = now.replace(hour=start // 60, minute=start % 60, second=0, microsecond=0)
+    if opens <= now:
+        opens += timedelta(days=1)
+    return int((opens - now).total_seconds())
+
+
+class RebootManager:
+    """
+    Gathers reboot requirements across queued and completed modules.
+    The pending list is persisted so the modules can be verified once the
+    machine has actually restarted.
+    """
+    
+    def __init__(self, state_path: Optional[Path] = None) -> None:
+        self._logger = get_logger()
+        self._state_path = state_path or DEFAULT_STATE_PATH
+        self._requirements: List[RebootRequirement] = []
+        self._expected: List[str] = []
+    
+    @property
+    def requirements(self) -> List[RebootRequirement]:
+        """Completed module runs waiting for a restart."""
+        return list(self._requirements)
+    
+    @property
+    def has_pending(self) -> bool:
+        """Check if any completed module still needs a restart."""
+        return bool(self._requirements)
+    
+    @property
+    def expects_more(self) -> bool:
+        """Check if queued modules will add further reboot requirements."""
+        return bool(self._expected)
+    
+    def expect(self, module_id: str) -> None:
+        """Note a queued module that will require a restart when it completes."""
+        if module_id not in self._expected:
+            self._expected.append(module_id)
+    
+    def forget(self, module_id: str) -> None:
+        """Drop an expectation for a module that failed or was cancelled."""
+        if module_id in self._expected:
+            self._expected.remove(module_id)
+    
+    def require(self, module_id: str, module_name: str) -> None:
+        """Record that a completed module requires a restart."""
+        self.forget(module_id)
+        
+        if any(r.module_id == module_id for r in self._requirements):
+            return
+        
+        self._requirements.append(RebootRequirement(
+            module_id=module_id,
+            module_name=module_name,
+            requested_at=time.time()
+        ))
+        self._save()
+    
+    def _save(self) -> None:
+        """Persist the post-reboot verification list."""
+        state = {
+            'boot_time': PlatformCheck.get_boot_time(),
+            'modules': [asdict(r) for r in self._requirements]
+        }
+        
+        try:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._state_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2)
+            tmp_path.replace(self._state_path)
+        except OSError:
+            self._logger.warning(f'Could not persist reboot state: {self._state_path}')
+    
+    def restore(self) -> List[RebootRequirement]:
+        """
+        Load the verification list from a previous session.
+        
+        If the machine has restarted since the list was written, the list is
+        consumed and returned for verification. Otherwise the requirements
+        are still pending and are restored into this manager.
+        
+        Returns:
+            Requirements that are now due for post-reboot verification
+        """
+        if not self._state_path.exists():
+            return []
+        
+        try:
+            with open(self._state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            requirements = [RebootRequirement(**entry) for entry in state.get('modules', [])]
+            saved_boot = float(state.get('boot_time', 0.0))
+        except (OSError, ValueError, TypeError):
+            self._logger.warning(f'Discarding unreadable reboot state: {self._state_path}')
+            self._clear_state()
+            return []
+        
+        if PlatformCheck.has_rebooted_since(saved_boot):
+            self._clear_state()
+            return requirements
+        
+        for requirement in requirements:
+            if not any(r.module_id == requirement.module_id for r in self._requirements):
+                self._requirements.append(requirement)
+        return []
+    
+    def _clear_state(self) -> None:
+        try:
+            self._state_path.unlink()
+        except OSError:
+            pass
+    
+    def schedule_restart(
+        self,
+        delay_seconds: int = 30,
+        window: str = ''
+    ) -> CommandResult:
+        """
+        Schedule a single restart covering all pending requirements.
+        
+        Args:
+            delay_seconds: Delay before restarting when no window is given
+            window: Optional restart window such as '02:00-04:00'
+        
+        Returns:
+            CommandResult of the shutdown request
+        """
+        delay = delay_seconds
+        if window:
+            until_window = seconds_until_window(window)
+            if until_window is not None:
+                delay = max(delay_seconds, until_window)
+        delay = min(delay, MAX_SHUTDOWN_DELAY)
+        
+        names = ', '.join(r.module_name for r in self._requirements)
+        self._logger.info(f'Scheduling restart in {delay}s for: {names}')
+        self._save()
+        
+        return CommandRunner().run([
+            'shutdown', '/r', '/t', str(delay), '/c',
+            'IWS-WinCare: Restarting to complete repairs'
+        ])
+    
+    def cancel_restart(self) -> CommandResult:
+        """Abort a scheduled restart; requirements stay pending."""
+        return CommandRunner().run(['shutdown', '/a'])
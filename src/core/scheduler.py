@@ -0,0 +1,289 @@
+"""
+Idle-aware background maintenance scheduler.
+Runs configured modules on intervals, but only while the machine is idle.
+"""
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.system.idle import IdleSignals
+from src.utils.logger import get_logger
+from src.utils.tracing import get_tracer
+
+
+DEFAULT_STATE_PATH = Path(__file__).parent.parent.parent / 'logs' / 'scheduler_state.json'
+
+
+@dataclass
+class ScheduledJob:
+    """A module run on a fixed interval."""
+    module_id: str
+    interval: float
+    jitter: float = 0.0
+    next_run: float = 0.0
+    last_run: Optional[float] = None
+    deferrals: int = 0
+
+
+@dataclass
+class IdlePolicy:
+    """Thresholds that must hold before a job may run."""
+    max_cpu_percent: float = 20.0
+    max_disk_percent: float = 25.0
+    min_input_idle_seconds: float = 600.0
+    require_ac_power: bool = True
+    defer_seconds: float = 300.0
+
+
+class MaintenanceScheduler:
+    """
+    Interval scheduler gated by idle signals.
+    
+    Due jobs run only when CPU and disk utilisation are below the policy
+    thresholds, the user has been inactive long enough and the machine is on
+    mains power. Otherwise they are deferred with jitter so deferred jobs do
+    not all fire at the same moment. Clock, random source and signals are
+    injectable for testing.
+    """
+    
+    def __init__(
+        self,
+        dispatch: Callable[[str], bool],
+        signals: IdleSignals,
+        policy: Optional[IdlePolicy] = None,
+        clock: Callable[[], float] = time.time,
+        rng: Optional[random.Random] = None,
+        is_busy: Callable[[], bool] = lambda: False,
+        state_path: Optional[Path] = None
+    ) -> None:
+        """
+        Args:
+            dispatch: Called with a module id when its job should run; returns
+                False if the run was not accepted, so the job is retried
+            signals: Idle signal source
+            policy: Idle thresholds
+            clock: Wall clock returning seconds
+            rng: Random source for jitter
+            is_busy: Returns True while another module is running
+            state_path: File persisting last run times across launches
+        """
+        self._logger = get_logger()
+        self._dispatch = dispatch
+        self._signals = signals
+        self._policy = policy or IdlePolicy()
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._is_busy = is_busy
+        self._state_path = state_path
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def jobs(self) -> List[ScheduledJob]:
+        """Copies of the scheduled jobs, consistent as of the call."""
+        with self._lock:
+            return [replace(job) for job in self._jobs.values()]
+    
+    def _jitter(self, job: ScheduledJob) -> float:
+        return self._rng.uniform(0, job.jitter) if job.jitter > 0 else 0.0
+    
+    def add_job(self, module_id: str, interval: float, jitter: float = 0.0) -> ScheduledJob:
+        """
+        Schedule a module.
+        
+        Args:
+            module_id: Module to dispatch
+            interval: Seconds between runs
+            jitter: Maximum random delay added to each run
+        
+        Returns:
+            The scheduled job
+        """
+        job = ScheduledJob(module_id=module_id, interval=interval, jitter=jitter)
+        last_run = self._load_state().get(module_id)
+        now = self._clock()
+        
+        job.last_run = last_run
+        base = last_run if last_run is not None else now
+        job.next_run = base + interval + self._jitter(job)
+        
+        with self._lock:
+            self._jobs[module_id] = job
+        return job
+    
+    def check_idle(self) -> Tuple[bool, str]:
+        """
+        Evaluate the idle policy.
+        
+        Returns:
+            (idle, reason) where reason explains a non-idle verdict
+        """
+        policy = self._policy
+        
+        if self._is_busy():
+            return False, 'another operation is running'
+        
+        if policy.require_ac_power and not self._signals.on_ac_power():
+            return False, 'running on battery'
+        
+        idle_for = self._signals.input_idle_seconds()
+        if idle_for < policy.min_input_idle_seconds:
+            return False, f'user active {idle_for:.0f}s ago'
+        
+        cpu = self._signals.cpu_percent()
+        if cpu > policy.max_cpu_percent:
+            return False, f'CPU at {cpu:.0f}%'
+        
+        disk = self._signals.disk_percent()
+        if disk > policy.max_disk_percent:
+            return False, f'disk at {disk:.0f}%'
+        
+        return True, 'idle'
+    
+    def tick(self) -> List[str]:
+        """
+        Run one scheduling pass.
+        
+        Returns:
+            Module ids dispatched in this pass
+        """
+        now = self._clock()
+        with self._lock:
+            # Least recently run first, so a short-interval job cannot starve
+            # one that keeps losing the single slot per pass
+            due = sorted(
+                (job for job in self._jobs.values() if job.next_run <= now),
+                key=lambda job: (job.last_run is not None, job.last_run or 0.0, job.next_run)
+            )
+        
+        if not due:
+            return []
+        
+        with get_tracer().trace('scheduler.tick', due=len(due)) as span:
+            idle, reason = self.check_idle()
+            dispatched: List[str] = []
+            deferred: List[Tuple[str, str]] = []
+            
+            for job in due:
+                # Dispatch outside the lock, as the callback may call back into the scheduler
+                if idle and self._dispatch(job.module_id):
+                    with self._lock:
+                        job.last_run = now
+                        job.deferrals = 0
+                        job.next_run = now + job.interval + self._jitter(job)
+                    dispatched.append(job.module_id)
+                    self._logger.info(f'Running scheduled maintenance: {job.module_id}')
+                    
+                    # Only one job per idle window; the next pass re-checks the signals
+                    idle, reason = False, 'a maintenance job was just started'
+                    continue
+                
+                # A rejected job has not run, so it is retried like a deferred one
+                why = reason if not idle else 'not accepted for dispatch'
+                with self._lock:
+                    job.deferrals += 1
+                    job.next_run = now + self._policy.defer_seconds + self._jitter(job)
+                deferred.append((job.module_id, why))
+            
+            for module_id, why in deferred:
+                self._logger.debug(f'Deferring scheduled {module_id}: {why}')
+            
+            if span is not None:
+                span.set(dispatched=dispatched)
+        
+        if dispatched:
+            self._save_state()
+        return dispatched
+    
+    def next_due(self) -> Optional[float]:
+        """Clock time of the earliest pending job."""
+        with self._lock:
+            return min((job.next_run for job in self._jobs.values()), default=None)
+    
+    def _load_state(self) -> Dict[str, float]:
+        if self._state_path is None or not self._state_path.exists():
+            return {}
+        try:
+            with open(self._state_path, 'r', encoding='utf-8') as f:
+                return {k: float(v) for k, v in json.load(f).items()}
+        except (OSError, ValueError, AttributeError):
+            return {}
+    
+    def _save_state(self) -> None:
+        if self._state_path is None:
+            return
+        state = {job.module_id: job.last_run for job in self.jobs if job.last_run is not None}
+        try:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._state_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2)
+        except OSError:
+            self._logger.warning(f'Could not save scheduler state: {self._state_path}')
+    
+    def start(self, poll_interval: float = 60.0) -> None:
+        """Run the scheduler on a background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        
+        # Prime utilisation counters so the first reading covers a full interval
+        self._signals.cpu_percent()
+        self._signals.disk_percent()
+        
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop,
+            args=(poll_interval,),
+            name='MaintenanceScheduler',
+            daemon=True
+        )
+        self._thread.start()
+    
+    def _loop(self, poll_interval: float) -> None:
+        while not self._stop.wait(poll_interval):
+            try:
+                self.tick()
+            except Exception:
+                self._logger.exception('Scheduler pass failed')
+    
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+def create_scheduler(
+    config,
+    dispatch: Callable[[str], bool],
+    signals: IdleSignals,
+    is_busy: Callable[[], bool] = lambda: False
+) -> MaintenanceScheduler:
+    """Build a scheduler from the jobs and idle thresholds in Config."""
+    policy = IdlePolicy(
+        max_cpu_percent=config.idle_max_cpu_percent,
+        max_disk_percent=config.idle_max_disk_percent,
+        min_input_idle_seconds=config.idle_min_input_minutes * 60,
+        require_ac_power=config.idle_require_ac_power
+    )
+    scheduler = MaintenanceScheduler(
+        dispatch=dispatch,
+        signals=signals,
+        policy=policy,
+        is_busy=is_busy,
+        state_path=DEFAULT_STATE_PATH
+    )
+    
+    for entry in config.scheduled_jobs:
+        interval = float(entry.get('interval_hours', 24)) * 3600
+        jitter = float(entry.get('jitter_minutes', 30)) * 60
+        scheduler.add_job(entry['module'], interval, jitter)
+    
+    return scheduler
@@ -7,9 +7,10 @@ from dataclasses import dataclass
 from typing import List, Optional
 from pathlib import Path
 
-from src.system.admin import is_admin
-from src.system.platform_check import PlatformCheck
+from src.system.services import get_service_inventory
+from src.system.snapshot import get_snapshot
 from src.utils.logger import get_logger
+from src.utils.tracing import traced
 
 
 @dataclass
@@ -32,7 +33,7 @@ class Validator:
     
     def validate_admin(self) -> ValidationResult:
         """Check if running with administrator privileges."""
-        if is_admin():
+        if get_snapshot().is_admin:
             return ValidationResult(
                 valid=True,
                 messages=['Running with administrator privileges'],
@@ -46,7 +47,7 @@ class Validator:
     
     def validate_platform(self) -> ValidationResult:
         """Check if running on supported Windows version."""
-        info = PlatformCheck.check_system()
+        info = get_snapshot()
         
         if info.is_compatible:
             return ValidationResult(
@@ -62,12 +63,7 @@ class Validator:
     
     def validate_service_exists(self, service_name: str) -> ValidationResult:
         """Check if a Windows service exists."""
-        from ..system.commands import CommandRunner
-        
-        runner = CommandRunner()
-        result = runner.run(['sc', 'query', service_name])
-        
-        if result.success:
+        if service_name in get_service_inventory():
             return ValidationResult(
                 valid=True,
                 messages=[f'Service {service_name} exists'],
@@ -95,6 +91,7 @@ class Validator:
             warnings=[]
         )
     
+    @traced('validator.validate_all')
     def validate_all(
         self,
         require_admin: bool = True,
@@ -140,10 +137,8 @@ class Validator:
         
         # Service checks
         if services:
-            for service in services:
-                service_result = self.validate_service_exists(service)
-                if not service_result.valid:
-                    all_warnings.append(service_result.messages[0])
+            for service in get_service_inventory().missing(services):
+                all_warnings.append(f'Service {service} not found')
         
         return ValidationResult(
             valid=is_valid,
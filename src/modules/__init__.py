@@ -1,6 +1,13 @@
 """Repair and reset modules package."""
 
-from src.modules import bugfix
-from src.modules import reset
+import importlib
 
-__all__ = ['bugfix', 'reset']
+__all__ = ['bugfix', 'reset', 'registry']
+
+
+def __getattr__(name: str):
+    # Subpackages are imported on first access so that loading the registry
+    # does not pull in every module's code
+    if name in __all__:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
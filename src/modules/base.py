@@ -3,14 +3,30 @@ Base class for all repair and reset modules.
 Provides common interface and execution patterns.
 """
 
+import os
+import time
 from abc import ABC, abstractmethod
+from functools import cached_property
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Callable, Iterable, Optional, List
 
 from src.core.executor import ExecutionResult, ExecutionStatus
+from src.core.journal import JournalRun, RunHandle, get_journal
 from src.core.validator import Validator, ValidationResult
+from src.system.autostart import AutoStart
 from src.system.commands import CommandRunner
+from src.system.files import ThrottledDeleter
+from src.system.platform_check import PlatformCheck
+from src.system.probes import has_network_adapter
+from src.system.services import get_service_inventory
+from src.system.snapshot import get_snapshot
+from src.system.throttle import ThrottlePolicy, background_mode
+from src.utils.config import Config
+from src.utils.events import bind, bound, get_event_log
 from src.utils.logger import get_logger
+from src.utils.memory import MemoryProbe
+from src.utils.timings import ExecutionTimings, NullTimings, collect
+from src.utils.tracing import current_span, get_tracer
 
 
 @dataclass
@@ -24,16 +40,88 @@ class ModuleInfo:
     is_critical: bool
 
 
+def missing_requirements(
+    requires_admin: bool,
+    services: Iterable[str] = (),
+    paths: Iterable[str] = (),
+    network_adapter: bool = False
+) -> List[str]:
+    """
+    Check module requirements against this machine.
+    
+    Args:
+        requires_admin: Administrator privileges are needed
+        services: Services that must be installed
+        paths: Paths that must exist; may contain environment variables
+        network_adapter: A non-loopback network adapter must be present
+    
+    Returns:
+        Reasons the module cannot run, empty if it can
+    """
+    reasons: List[str] = []
+    snapshot = get_snapshot()
+    
+    if not snapshot.is_compatible:
+        reasons.append(snapshot.compatibility_message)
+    if requires_admin and not snapshot.is_admin:
+        reasons.append('Administrator privileges required')
+    
+    services = list(services)
+    if services:
+        for service in get_service_inventory().missing(services):
+            reasons.append(f'Service {service} not found')
+    
+    for path in paths:
+        expanded = os.path.expandvars(path)
+        if not os.path.exists(expanded):
+            reasons.append(f'Path not found: {expanded}')
+    
+    if network_adapter and not has_network_adapter():
+        reasons.append('No network adapters found')
+    
+    return reasons
+
+
 class BaseModule(ABC):
     """
     Abstract base class for all repair/reset modules.
     Enforces consistent interface and execution patterns.
     """
     
+    # How an interrupted run is recovered: 'resume' re-runs the module and
+    # skips committed steps, 'compensate' rolls back partial effects instead.
+    resume_policy: str = 'resume'
+    
+    # Services and paths the module cannot work without. Paths may contain
+    # environment variables such as %SystemRoot%.
+    required_services: List[str] = []
+    required_paths: List[str] = []
+    requires_network_adapter: bool = False
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # ModuleInfo never changes for an instance, so build it once instead
+        # of on every access
+        info = cls.__dict__.get('info')
+        if isinstance(info, property) and not getattr(info, '__isabstractmethod__', False):
+            cached = cached_property(info.fget)
+            cached.__set_name__(cls, 'info')
+            cls.info = cached
+    
     def __init__(self) -> None:
         self._logger = get_logger()
         self._validator = Validator()
         self._runner = CommandRunner()
+        self._journal = get_journal()
+        self._run: Optional[RunHandle] = None
+        self._throttle: Optional[ThrottlePolicy] = None
+        self._deleter = ThrottledDeleter(ThrottlePolicy())
+        self._config: Optional[Config] = None
+    
+    @property
+    def module_id(self) -> str:
+        """Stable identifier used in the journal and the UI."""
+        return type(self).__name__
     
     @property
     @abstractmethod
@@ -49,48 +137,372 @@ class BaseModule(ABC):
         """
         pass
     
+    @property
+    def config(self) -> Config:
+        """Application settings, read from config.json once per module instance."""
+        if self._config is None:
+            self._config = Config.load()
+        return self._config
+    
+    @property
+    def throttle(self) -> ThrottlePolicy:
+        """Resource limits for this module, from Config unless set explicitly."""
+        if self._throttle is not None:
+            return self._throttle
+        return ThrottlePolicy.from_config(self.config, self.module_id)
+    
+    def set_throttle(self, policy: Optional[ThrottlePolicy]) -> None:
+        """Override the configured throttle policy (None restores it)."""
+        self._throttle = policy
+    
+    def _apply_throttle(self) -> ThrottlePolicy:
+        """Apply the throttle policy to spawned commands and file deletion."""
+        policy = self.throttle
+        self._runner.policy = policy
+        self._deleter = ThrottledDeleter(policy)
+        return policy
+    
     def validate(self) -> ValidationResult:
         """
         Pre-execution validation.
         Override to add module-specific checks.
         """
         return self._validator.validate_all(
-            require_admin=self.info.requires_admin
+            require_admin=self.info.requires_admin,
+            paths=[os.path.expandvars(p) for p in self.required_paths],
+            services=self.required_services
+        )
+    
+    def missing_requirements(self) -> List[str]:
+        """
+        Reasons the module cannot run on this machine, empty if it can.
+        Override to add checks beyond admin rights, services, paths and
+        network adapters.
+        """
+        return missing_requirements(
+            self.info.requires_admin,
+            self.required_services,
+            self.required_paths,
+            self.requires_network_adapter
         )
     
-    def execute(self) -> ExecutionResult:
+    def verify(self) -> ExecutionResult:
+        """
+        Post-restart verification.
+        Override to check that the module's changes took effect.
+        """
+        validation = self.validate()
+        
+        if validation.valid:
+            return ExecutionResult(
+                status=ExecutionStatus.SUCCESS,
+                message=f'{self.info.name} verified after restart',
+                details='\n'.join(validation.messages + validation.warnings) or None
+            )
+        
+        return ExecutionResult(
+            status=ExecutionStatus.FAILED,
+            message=f'{self.info.name} verification failed',
+            details='\n'.join(validation.messages)
+        )
+    
+    def execute(self, resume: Optional[JournalRun] = None) -> ExecutionResult:
         """
         Execute the module with validation.
         
+        Args:
+            resume: Interrupted run to continue; committed steps are skipped
+        
         Returns:
             ExecutionResult with success/failure status
         """
         self._logger.info(f'Executing module: {self.info.name}')
         
-        validation = self.validate()
-        if not validation.valid:
-            self._logger.warning(f'Validation failed for {self.info.name}')
-            return ExecutionResult(
-                status=ExecutionStatus.FAILED,
-                message='Validation failed',
-                details='\n'.join(validation.messages)
-            )
+        events = get_event_log()
+        config = self.config
+        enabled = config.collect_timings
+        timings = ExecutionTimings() if enabled else NullTimings()
+        
+        # Snapshots are taken outside the timed span
+        probe = MemoryProbe(config.memory_probe_top) if config.memory_probe else None
+        if probe is not None:
+            probe.start()
+        
+        # A run that raises must not leave tracemalloc on for the rest of the session
+        try:
+            started = time.perf_counter()
+            
+            with bind(module_id=self.module_id), collect(timings if enabled else None), \
+                    get_tracer().trace('module.execute', module_id=self.module_id, resume=resume is not None):
+                events.emit('module_start', resume=resume is not None)
+                
+                with timings.phase('validation'):
+                    validation = self.validate()
+                events.emit(
+                    'validation',
+                    valid=validation.valid,
+                    duration_ms=timings.phases.get('validation')
+                )
+                
+                if not validation.valid:
+                    self._logger.warning(f'Validation failed for {self.info.name}')
+                    result = ExecutionResult(
+                        status=ExecutionStatus.FAILED,
+                        message='Validation failed',
+                        details='\n'.join(validation.messages)
+                    )
+                    return self._finish(result, timings, started, enabled, probe)
+                
+                with timings.phase('journal'):
+                    if resume is not None:
+                        self._logger.info(
+                            f'Resuming {self.info.name} after step: {resume.last_committed_step or "<start>"}'
+                        )
+                        self._run = self._journal.reopen(resume)
+                    else:
+                        self._run = self._journal.begin(self.module_id, PlatformCheck.get_boot_time())
+                
+                with bind(run_id=self._run.run.run_id):
+                    result = self._execute_run(timings)
+                    return self._finish(result, timings, started, enabled, probe)
+        finally:
+            if probe is not None:
+                probe.close()
+    
+    def _execute_run(self, timings: ExecutionTimings) -> ExecutionResult:
+        """Run _execute under the throttle policy and close the journal entry."""
+        policy = self._apply_throttle()
+        started = time.monotonic()
         
         try:
-            result = self._execute()
+            with timings.phase('execute'), background_mode(policy):
+                result = self._execute()
+            
+            if policy.is_throttled:
+                self._logger.info(
+                    f'{self.info.name} ran for {time.monotonic() - started:.1f}s '
+                    f'under throttle: {policy.describe()}'
+                )
             
             if result.success:
                 self._logger.info(f'Module {self.info.name} completed successfully')
             else:
                 self._logger.warning(f'Module {self.info.name} failed: {result.message}')
             
+            with timings.phase('finalize'):
+                self._close_run(result)
             return result
             
         except Exception as e:
             self._logger.exception(f'Module {self.info.name} raised exception')
+            
+            with timings.phase('finalize'):
+                details = str(e)
+                if self._run.run.uncommitted_steps:
+                    try:
+                        details += '\n' + self._compensate(self._run.run)
+                    except Exception:
+                        self._logger.exception(f'Compensation for {self.info.name} failed')
+                
+                result = ExecutionResult(
+                    status=ExecutionStatus.FAILED,
+                    message='Execution error',
+                    details=details,
+                    error=e
+                )
+                self._close_run(result)
+            return result
+    
+    def _finish(
+        self,
+        result: ExecutionResult,
+        timings: ExecutionTimings,
+        started: float,
+        enabled: bool,
+        probe: Optional[MemoryProbe] = None
+    ) -> ExecutionResult:
+        """
+        Record the total time, attach the breakdown and emit module_end,
+        preceded by a memory event when the probe is on.
+        """
+        timings.phases['total'] = round((time.perf_counter() - started) * 1000, 1)
+        if enabled:
+            result.timings = timings
+        
+        if probe is not None:
+            report = probe.stop()
+            self._logger.info(f'Memory after {self.info.name}: {report.describe()}')
+            get_event_log().emit('memory', **report.to_dict())
+        
+        span = current_span()
+        if span is not None:
+            span.set(status=result.status.value, run_id=bound('run_id'))
+        
+        get_event_log().emit(
+            'module_end',
+            flush=True,
+            status=result.status.value,
+            reboot_required=result.reboot_required,
+            duration_ms=timings.phases['total'],
+            phases=timings.phases,
+            **(timings.usage.to_dict() if timings.usage else {})
+        )
+        return result
+    
+    def _close_run(self, result: ExecutionResult) -> None:
+        """Finish the journal entry, or park it until the next restart."""
+        handle = self._run
+        self._run = None
+        
+        if handle is None:
+            return
+        
+        needs_reboot = self.info.requires_reboot or result.reboot_required
+        if result.success and needs_reboot and handle.run.continuations:
+            self._await_reboot(handle)
+        else:
+            handle.finish(result.status.value)
+    
+    def _await_reboot(self, handle: RunHandle) -> None:
+        """Park a run with registered continuations until the next restart."""
+        handle.await_reboot(PlatformCheck.get_boot_time())
+        AutoStart().register_run_once()
+        self._logger.info(f'{self.info.name} will continue after restart')
+    
+    def _step(self, step_id: str, action: Callable[[], str]) -> str:
+        """
+        Run a journaled step.
+        
+        The step start is made durable before the action runs. When resuming
+        an interrupted run, a step committed by the earlier attempt is skipped
+        and its recorded detail is returned instead.
+        
+        Args:
+            step_id: Identifier unique within the module
+            action: Callable performing the step, returning detail text
+        
+        Returns:
+            Detail text produced by the step
+        """
+        if self._run is None:
+            return action()
+        
+        if self._run.is_committed(step_id):
+            self._logger.debug(f'Skipping committed step: {step_id}')
+            return self._run.run.committed_steps[step_id]
+        
+        self._run.step_started(step_id)
+        with bind(step=step_id), get_tracer().span('module.step', step=step_id):
+            detail = action()
+        self._run.step_committed(step_id, detail)
+        return detail
+    
+    def register_continuation(self, name: str) -> None:
+        """
+        Register a method to run after the next system restart.
+        Only takes effect when the module or its result requires a reboot.
+        
+        Args:
+            name: Name of a method on this module returning detail text, or
+                an ExecutionResult when the continuation can fail
+        """
+        if self._run is not None:
+            self._run.add_continuation(name)
+    
+    def _compensate(self, run: JournalRun) -> str:
+        """
+        Roll back partial effects of an interrupted run.
+        Override in modules whose steps leave the system in a degraded state.
+        
+        Returns:
+            Detail text describing what was rolled back
+        """
+        return ''
+    
+    def compensate(self, run: JournalRun) -> ExecutionResult:
+        """Roll back an interrupted run and close its journal."""
+        self._logger.info(f'Compensating interrupted run of {self.info.name}')
+        handle = self._journal.reopen(run)
+        self._apply_throttle()
+        
+        try:
+            details = self._compensate(run)
+        except Exception as e:
+            self._logger.exception(f'Compensation for {self.info.name} failed')
+            handle.finish(ExecutionStatus.FAILED.value)
             return ExecutionResult(
                 status=ExecutionStatus.FAILED,
-                message='Execution error',
+                message=f'Could not roll back interrupted {self.info.name}',
                 details=str(e),
                 error=e
             )
+        
+        handle.finish('compensated')
+        return ExecutionResult(
+            status=ExecutionStatus.SUCCESS,
+            message=f'Interrupted {self.info.name} rolled back',
+            details=details or None
+        )
+    
+    def continue_after_reboot(self, run: JournalRun) -> ExecutionResult:
+        """
+        Run the continuations registered before the last restart.
+        
+        A continuation fails the run by raising or by returning an unsuccessful
+        ExecutionResult; later continuations are then skipped. Continuations
+        that register new ones, e.g. a repair that itself needs a restart,
+        park the run again until the next restart.
+        """
+        self._logger.info(f'Continuing {self.info.name} after restart')
+        handle = self._journal.reopen(run)
+        pending = list(run.continuations)
+        run.continuations.clear()
+        lines: List[str] = []
+        self._apply_throttle()
+        
+        # Continuations may run journaled steps and register continuations of their own
+        self._run = handle
+        try:
+            for name in pending:
+                outcome = getattr(self, name)()
+                if not isinstance(outcome, ExecutionResult):
+                    lines.append(outcome)
+                    continue
+                
+                if outcome.details:
+                    lines.append(outcome.details)
+                if not outcome.success:
+                    self._run = None
+                    handle.finish(outcome.status.value)
+                    return ExecutionResult(
+                        status=outcome.status,
+                        message=f'{self.info.name} could not complete after restart: {outcome.message}',
+                        details='\n'.join(lines) or None
+                    )
+        except Exception as e:
+            self._logger.exception(f'Post-restart continuation for {self.info.name} failed')
+            self._run = None
+            handle.finish(ExecutionStatus.FAILED.value)
+            return ExecutionResult(
+                status=ExecutionStatus.FAILED,
+                message=f'{self.info.name} could not complete after restart',
+                details='\n'.join(lines + [str(e)]),
+                error=e
+            )
+        
+        self._run = None
+        if run.continuations:
+            self._await_reboot(handle)
+            return ExecutionResult(
+                status=ExecutionStatus.SUCCESS,
+                message=f'{self.info.name} needs another restart to complete',
+                details='\n'.join(lines) or None,
+                reboot_required=True
+            )
+        
+        handle.finish(ExecutionStatus.SUCCESS.value)
+        return ExecutionResult(
+            status=ExecutionStatus.SUCCESS,
+            message=f'{self.info.name} completed after restart',
+            details='\n'.join(lines) or None
+        )
@@ -1,19 +1,23 @@
 """Bug-fix modules for Windows repair operations."""
 
-from src.modules.bugfix.dns_flush import DNSFlushModule
-from src.modules.bugfix.winsock_reset import WinsockResetModule
-from src.modules.bugfix.network_adapter import NetworkAdapterModule
-from src.modules.bugfix.update_cache import UpdateCacheModule
-from src.modules.bugfix.explorer_cache import ExplorerCacheModule
-from src.modules.bugfix.temp_cleanup import TempCleanupModule
-from src.modules.bugfix.env_refresh import EnvironmentRefreshModule
+import importlib
 
-__all__ = [
-    'DNSFlushModule',
-    'WinsockResetModule',
-    'NetworkAdapterModule',
-    'UpdateCacheModule',
-    'ExplorerCacheModule',
-    'TempCleanupModule',
-    'EnvironmentRefreshModule',
-]
+_EXPORTS = {
+    'DNSFlushModule': 'dns_flush',
+    'WinsockResetModule': 'winsock_reset',
+    'NetworkAdapterModule': 'network_adapter',
+    'UpdateCacheModule': 'update_cache',
+    'ExplorerCacheModule': 'explorer_cache',
+    'TempCleanupModule': 'temp_cleanup',
+    'EnvironmentRefreshModule': 'env_refresh',
+    'NetworkRepairModule': 'network_repair',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    # Classes are imported on first access, see src.modules.registry
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f'{__name__}.{_EXPORTS[name]}'), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
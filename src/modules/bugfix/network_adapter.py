@@ -11,6 +11,8 @@ import time
 class NetworkAdapterModule(BaseModule):
     """Restart network adapters to resolve connectivity issues."""
     
+    requires_network_adapter = True
+    
     @property
     def info(self) -> ModuleInfo:
         return ModuleInfo(
@@ -0,0 +1,141 @@
+"""
+Automatic Network Repair Module.
+Escalates from the cheapest to the most disruptive network fix, probing
+connectivity between tiers and stopping as soon as it is restored.
+"""
+
+from typing import List, Optional
+
+from src.modules.base import BaseModule, ModuleInfo
+from src.core.executor import ExecutionResult, ExecutionStatus
+from src.system.probes import ConnectivityProbe, ConnectivityReport
+from src.utils.config import Config
+
+
+class NetworkRepairModule(BaseModule):
+    """Escalating network remediation pipeline."""
+    
+    def __init__(
+        self,
+        probe: Optional[ConnectivityProbe] = None,
+        tiers: Optional[List[BaseModule]] = None
+    ) -> None:
+        """
+        Args:
+            probe: Connectivity probe (defaults to the targets in Config)
+            tiers: Repair modules ordered from cheapest to most disruptive
+        """
+        super().__init__()
+        self._probe = probe
+        self._tiers = tiers
+    
+    @property
+    def info(self) -> ModuleInfo:
+        return ModuleInfo(
+            name='Automatic Network Repair',
+            description='Tries DNS flush, adapter restart, Winsock reset and network reset in turn, '
+                        'stopping once connectivity is restored',
+            category='Network',
+            requires_admin=True,
+            requires_reboot=False,
+            is_critical=True
+        )
+    
+    def _get_probe(self) -> ConnectivityProbe:
+        if self._probe is None:
+            self._probe = ConnectivityProbe.from_config(Config.load())
+        return self._probe
+    
+    def _get_tiers(self) -> List[BaseModule]:
+        if self._tiers is None:
+            from src.modules.bugfix.dns_flush import DNSFlushModule
+            from src.modules.bugfix.network_adapter import NetworkAdapterModule
+            from src.modules.bugfix.winsock_reset import WinsockResetModule
+            from src.modules.reset.network_reset import NetworkResetModule
+            
+            self._tiers = [
+                DNSFlushModule(),
+                NetworkAdapterModule(),
+                WinsockResetModule(),
+                NetworkResetModule(),
+            ]
+        return self._tiers
+    
+    def _probe_step(self, label: str, operations: List[str]) -> ConnectivityReport:
+        report = self._get_probe().run()
+        state = 'connected' if report.healthy else 'no connectivity'
+        operations.append(f'[PROBE] {label}: {state}')
+        if report.results:
+            operations.append(report.summary())
+        return report
+    
+    def _run_tier(self, tier: BaseModule) -> str:
+        result = tier.execute()
+        status = 'OK' if result.success else 'FAIL'
+        return f'[{status}] {tier.info.name}: {result.message}'
+    
+    def _escalate(self, tiers: List[BaseModule], operations: List[str]) -> ExecutionResult:
+        """Run tiers in order until the probes pass or a restart is needed."""
+        for tier in tiers:
+            tier_info = tier.info
+            self._logger.info(f'Network repair escalating to: {tier_info.name}')
+            
+            line = self._step(f'tier_{tier.module_id}', lambda tier=tier: self._run_tier(tier))
+            operations.append(line)
+            
+            if not line.startswith('[OK]'):
+                continue
+            
+            if tier_info.requires_reboot:
+                # The fix only takes effect after a restart, so further tiers
+                # cannot be judged until then.
+                self.register_continuation('_continue_after_restart')
+                return ExecutionResult(
+                    status=ExecutionStatus.SUCCESS,
+                    message=f'{tier_info.name} applied. Restart required to complete the repair.',
+                    details='\n'.join(operations),
+                    reboot_required=True
+                )
+            
+            if self._probe_step(f'After {tier_info.name}', operations).healthy:
+                return ExecutionResult(
+                    status=ExecutionStatus.SUCCESS,
+                    message=f'Connectivity restored by {tier_info.name}',
+                    details='\n'.join(operations)
+                )
+        
+        return ExecutionResult(
+            status=ExecutionStatus.FAILED,
+            message='Network repair could not restore connectivity',
+            details='\n'.join(operations)
+        )
+    
+    def _execute(self) -> ExecutionResult:
+        operations: List[str] = []
+        
+        if self._probe_step('Before repair', operations).healthy:
+            return ExecutionResult(
+                status=ExecutionStatus.SUCCESS,
+                message='Network connectivity is working, no repair needed',
+                details='\n'.join(operations)
+            )
+        
+        return self._escalate(self._get_tiers(), operations)
+    
+    def _continue_after_restart(self) -> ExecutionResult:
+        """Probe after the restart and escalate past the tier that needed it."""
+        operations: List[str] = []
+        if self._probe_step('After restart', operations).healthy:
+            return ExecutionResult(
+                status=ExecutionStatus.SUCCESS,
+                message='Network connectivity restored after restart',
+                details='\n'.join(operations)
+            )
+        
+        tiers = self._get_tiers()
+        committed = self._run.run.committed_steps if self._run else {}
+        tried = [i for i, tier in enumerate(tiers) if f'tier_{tier.module_id}' in committed]
+        remaining = tiers[max(tried) + 1:] if tried else tiers
+        
+        # A tier needing another restart registers this continuation again
+        return self._escalate(remaining, operations)
@@ -3,8 +3,13 @@ Temporary Files Cleanup Module.
 Safely removes temporary files from system directories.
 """
 
+import os
+from pathlib import Path
+from typing import List
+
 from src.modules.base import BaseModule, ModuleInfo
 from src.core.executor import ExecutionResult, ExecutionStatus
+from src.system.files import DeletionStats
 
 
 class TempCleanupModule(BaseModule):
@@ -21,62 +26,48 @@ class TempCleanupModule(BaseModule):
             is_critical=False
         )
     
-    def _execute(self) -> ExecutionResult:
-        ps_script = '''
-        $totalSize = 0
-        $filesDeleted = 0
+    def _temp_directories(self) -> List[Path]:
+        """Existing temp directories, without duplicates."""
+        system_root = os.environ.get('SystemRoot', r'C:\Windows')
+        candidates = [
+            os.environ.get('TEMP'),
+            os.path.join(system_root, 'Temp'),
+            os.path.join(os.environ['LOCALAPPDATA'], 'Temp') if os.environ.get('LOCALAPPDATA') else None,
+        ]
         
-        $tempPaths = @(
-            $env:TEMP,
-            "$env:SystemRoot\\Temp",
-            "$env:LOCALAPPDATA\\Temp"
-        )
+        directories: List[Path] = []
+        seen = set()
+        for candidate in candidates:
+            if not candidate:
+                continue
+            path = Path(candidate)
+            key = os.path.normcase(str(path.resolve()))
+            if key not in seen and path.is_dir():
+                seen.add(key)
+                directories.append(path)
+        return directories
+    
+    def _execute(self) -> ExecutionResult:
+        total = DeletionStats()
+        operations: List[str] = []
         
-        foreach ($path in $tempPaths) {
-            if (Test-Path $path) {
-                $files = Get-ChildItem -Path $path -Recurse -Force -ErrorAction SilentlyContinue
-                foreach ($file in $files) {
-                    try {
-                        $totalSize += $file.Length
-                        Remove-Item -Path $file.FullName -Force -Recurse -ErrorAction Stop
-                        $filesDeleted++
-                    } catch {
-                        # File in use, skip
-                    }
-                }
-            }
-        }
+        for path in self._temp_directories():
+            stats = self._deleter.clear_directory(path)
+            total.add(stats)
+            operations.append(f'[OK] {path}: {stats.files} files, {stats.megabytes:.2f} MB')
         
         # Clear Windows prefetch (requires admin)
-        $prefetchPath = "$env:SystemRoot\\Prefetch"
-        if (Test-Path $prefetchPath) {
-            $prefetchFiles = Get-ChildItem -Path $prefetchPath -ErrorAction SilentlyContinue
-            foreach ($file in $prefetchFiles) {
-                try {
-                    $totalSize += $file.Length
-                    Remove-Item -Path $file.FullName -Force -ErrorAction Stop
-                    $filesDeleted++
-                } catch {
-                    # Access denied, skip
-                }
-            }
-        }
-        
-        $sizeMB = [math]::Round($totalSize / 1MB, 2)
-        Write-Output "Deleted $filesDeleted files, freed $sizeMB MB"
-        '''
-        
-        result = self._runner.run_powershell(ps_script, timeout=120)
+        prefetch = Path(os.environ.get('SystemRoot', r'C:\Windows')) / 'Prefetch'
+        stats = self._deleter.clear_directory(prefetch, recursive=False)
+        total.add(stats)
+        if stats.files:
+            operations.append(f'[OK] {prefetch}: {stats.files} files, {stats.megabytes:.2f} MB')
         
-        if result.success:
-            return ExecutionResult(
-                status=ExecutionStatus.SUCCESS,
-                message='Temporary files cleaned successfully',
-                details=result.stdout
-            )
+        operations.append(total.summary())
+        operations.append(f'Throttle: {self._runner.policy.describe()}')
         
         return ExecutionResult(
-            status=ExecutionStatus.FAILED,
-            message='Cleanup completed with errors',
-            details=result.stderr or result.stdout
+            status=ExecutionStatus.SUCCESS,
+            message=f'Temporary files cleaned successfully, freed {total.megabytes:.2f} MB',
+            details='\n'.join(operations)
         )
@@ -3,13 +3,20 @@ Windows Update Cache Repair Module.
 Clears and repairs the Windows Update cache.
 """
 
+import os
+from pathlib import Path
+
 from src.modules.base import BaseModule, ModuleInfo
 from src.core.executor import ExecutionResult, ExecutionStatus
+from src.system.files import DeletionStats
 
 
 class UpdateCacheModule(BaseModule):
     """Repair Windows Update cache to fix update failures."""
     
+    required_services = ['wuauserv', 'bits', 'cryptsvc']
+    required_paths = [r'%SystemRoot%\SoftwareDistribution']
+    
     @property
     def info(self) -> ModuleInfo:
         return ModuleInfo(
@@ -35,24 +42,16 @@ class UpdateCacheModule(BaseModule):
                 success_count += 1
         
         # Clear SoftwareDistribution folder
-        ps_clear = '''
-        $paths = @(
-            "$env:SystemRoot\\SoftwareDistribution\\Download\\*",
-            "$env:SystemRoot\\SoftwareDistribution\\DataStore\\*"
-        )
-        foreach ($path in $paths) {
-            if (Test-Path $path) {
-                Remove-Item -Path $path -Recurse -Force -ErrorAction SilentlyContinue
-            }
-        }
-        Write-Output "Cache cleared"
-        '''
+        distribution = Path(os.environ.get('SystemRoot', r'C:\Windows')) / 'SoftwareDistribution'
+        cleared = DeletionStats()
+        for name in ('Download', 'DataStore'):
+            cleared.add(self._deleter.clear_directory(distribution / name))
         
-        clear_result = self._runner.run_powershell(ps_clear)
-        if clear_result.success:
-            success_count += 1
+        # The deleter skips what it cannot remove instead of raising
+        if cleared.skipped:
+            errors.append(f'Failed to clear update cache: {cleared.skipped} item(s) in use or access denied')
         else:
-            errors.append('Failed to clear update cache')
+            success_count += 1
         
         # Restart services
         for service in services_to_stop:
@@ -64,11 +63,12 @@ class UpdateCacheModule(BaseModule):
             return ExecutionResult(
                 status=ExecutionStatus.FAILED,
                 message='Update cache repair completed with errors',
-                details='\n'.join(errors)
+                details='\n'.join(errors + [cleared.summary()])
             )
         
         return ExecutionResult(
             status=ExecutionStatus.SUCCESS,
             message='Windows Update cache repaired successfully',
-            details=f'Completed {success_count} operations'
+            details=f'Completed {success_count} operations\n{cleared.summary()}\n'
+                    f'Throttle: {self._runner.policy.describe()}'
         )
@@ -5,6 +5,7 @@ Resets Windows Sockets catalog to default state.
 
 from src.modules.base import BaseModule, ModuleInfo
 from src.core.executor import ExecutionResult, ExecutionStatus
+from src.modules.checks import verify_ipv4
 
 
 class WinsockResetModule(BaseModule):
@@ -36,3 +37,6 @@ class WinsockResetModule(BaseModule):
             message='Failed to reset Winsock catalog',
             details=result.stderr or result.stdout
         )
+    
+    def verify(self) -> ExecutionResult:
+        return verify_ipv4(self._runner, self.info.name)
@@ -0,0 +1,34 @@
+"""
+Post-restart checks.
+Verification shared by modules that reset the same subsystem.
+"""
+
+from src.core.executor import ExecutionResult, ExecutionStatus
+from src.system.commands import CommandRunner
+
+
+def verify_ipv4(runner: CommandRunner, name: str) -> ExecutionResult:
+    """
+    Check that the network stack came back with an IPv4 configuration.
+    
+    Args:
+        runner: Command runner of the module being verified
+        name: Module name for the result message
+    
+    Returns:
+        ExecutionResult of the check
+    """
+    result = runner.run(['ipconfig'])
+    
+    if result.success and 'IPv4' in result.stdout:
+        return ExecutionResult(
+            status=ExecutionStatus.SUCCESS,
+            message=f'{name} verified: network stack is up',
+            details=result.stdout
+        )
+    
+    return ExecutionResult(
+        status=ExecutionStatus.FAILED,
+        message=f'{name} verification failed: no IPv4 configuration',
+        details=result.stderr or result.stdout
+    )
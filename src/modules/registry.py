@@ -0,0 +1,325 @@
+"""
+Module registry.
+Serves module metadata from a static manifest and imports module code on first use.
+"""
+
+import importlib
+import importlib.metadata
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from src.modules.base import BaseModule, ModuleInfo, missing_requirements
+from src.utils.logger import get_logger
+
+
+# Third-party packages register modules under this entry point group. Each
+# entry point must reference a list of ModuleSpec, or a callable returning
+# one, defined somewhere cheap to import (not in the module code itself).
+ENTRY_POINT_GROUP = 'iws_wincare.modules'
+
+
+@dataclass(frozen=True)
+class ModuleSpec:
+    """Static description of a module, available without importing it."""
+    module_id: str
+    target: str
+    info: ModuleInfo
+    tab: str = 'bugfix'
+    # Repeat the module class's requirements, so capabilities can be
+    # probed without importing it
+    required_services: Tuple[str, ...] = ()
+    required_paths: Tuple[str, ...] = ()
+    requires_network_adapter: bool = False
+    
+    def load_class(self) -> Type[BaseModule]:
+        """Import the module class named by target ('package.module:Class')."""
+        module_name, _, class_name = self.target.partition(':')
+        return getattr(importlib.import_module(module_name), class_name)
+    
+    def missing_requirements(self) -> List[str]:
+        """Reasons the module cannot run on this machine, from the spec alone."""
+        return missing_requirements(
+            self.info.requires_admin,
+            self.required_services,
+            self.required_paths,
+            self.requires_network_adapter
+        )
+
+
+MANIFEST: List[ModuleSpec] = [
+    ModuleSpec(
+        module_id='NetworkRepairModule',
+        target='src.modules.bugfix.network_repair:NetworkRepairModule',
+        info=ModuleInfo(
+            name='Automatic Network Repair',
+            description='Tries DNS flush, adapter restart, Winsock reset and network reset in turn, '
+                        'stopping once connectivity is restored',
+            category='Network',
+            requires_admin=True,
+            requires_reboot=False,
+            is_critical=True
+        )
+    ),
+    ModuleSpec(
+        module_id='DNSFlushModule',
+        target='src.modules.bugfix.dns_flush:DNSFlushModule',
+        info=ModuleInfo(
+            name='DNS Cache Flush',
+            description='Clears the DNS resolver cache to resolve DNS-related connectivity issues',
+            category='Network',
+            requires_admin=True,
+            requires_reboot=False,
+            is_critical=False
+        )
+    ),
+    ModuleSpec(
+        module_id='WinsockResetModule',
+        target='src.modules.bugfix.winsock_reset:WinsockResetModule',
+        info=ModuleInfo(
+            name='Winsock Reset',
+            description='Resets Windows Sockets catalog to resolve network stack corruption',
+            category='Network',
+            requires_admin=True,
+            requires_reboot=True,
+            is_critical=True
+        )
+    ),
+    ModuleSpec(
+        module_id='NetworkAdapterModule',
+        target='src.modules.bugfix.network_adapter:NetworkAdapterModule',
+        info=ModuleInfo(
+            name='Network Adapter Restart',
+            description='Restarts all network adapters to resolve connectivity issues',
+            category='Network',
+            requires_admin=True,
+            requires_reboot=False,
+            is_critical=False
+        ),
+        requires_network_adapter=True
+    ),
+    ModuleSpec(
+        module_id='UpdateCacheModule',
+        target='src.modules.bugfix.update_cache:UpdateCacheModule',
+        info=ModuleInfo(
+            name='Windows Update Cache Repair',
+            description='Stops update services, clears cache, and restarts services',
+            category='System',
+            requires_admin=True,
+            requires_reboot=False,
+            is_critical=True
+        ),
+        required_services=('wuauserv', 'bits', 'cryptsvc'),
+        required_paths=(r'%SystemRoot%\SoftwareDistribution',)
+    ),
+    ModuleSpec(
+        module_id='ExplorerCacheModule',
+        target='src.modules.bugfix.explorer_cache:ExplorerCacheModule',
+        info=ModuleInfo(
+            name='Explorer Cache Reset',
+            description='Clears icon cache and thumbnail cache to fix display issues',
+            category='System',
+            requires_admin=True,
+            requires_reboot=False,
+            is_critical=False
+        )
+    ),
+    ModuleSpec(
+        module_id='TempCleanupModule',
+        target='src.modules.bugfix.temp_cleanup:TempCleanupModule',
+        info=ModuleInfo(
+            name='Temporary Files Cleanup',
+            description='Removes temporary files from Windows and user temp directories',
+            category='Cleanup',
+            requires_admin=True,
+            requires_reboot=False,
+            is_critical=False
+        )
+    ),
+    ModuleSpec(
+        module_id='EnvironmentRefreshModule',
+        target='src.modules.bugfix.env_refresh:EnvironmentRefreshModule',
+        info=ModuleInfo(
+            name='Environment Variables Refresh',
+            description='Broadcasts WM_SETTINGCHANGE to refresh environment variables',
+            category='System',
+            requires_admin=False,
+            requires_reboot=False,
+            is_critical=False
+        )
+    ),
+    ModuleSpec(
+        module_id='NetworkResetModule',
+        target='src.modules.reset.network_reset:NetworkResetModule',
+        tab='reset',
+        info=ModuleInfo(
+            name='Network Reset',
+            description='Resets IP configuration, Winsock catalog, and network settings',
+            category='Network',
+            requires_admin=True,
+            requires_reboot=True,
+            is_critical=True
+        )
+    ),
+    ModuleSpec(
+        module_id='PowerPlanResetModule',
+        target='src.modules.reset.power_plan:PowerPlanResetModule',
+        tab='reset',
+        info=ModuleInfo(
+            name='Power Plan Reset',
+            description='Restores all power plans to Windows default settings',
+            category='System',
+            requires_admin=True,
+            requires_reboot=False,
+            is_critical=False
+        )
+    ),
+    ModuleSpec(
+        module_id='DefaultAppsResetModule',
+        target='src.modules.reset.default_apps:DefaultAppsResetModule',
+        tab='reset',
+        info=ModuleInfo(
+            name='Default Apps Reset',
+            description='Resets file type associations to Windows recommended defaults',
+            category='System',
+            requires_admin=True,
+            requires_reboot=False,
+            is_critical=True
+        )
+    ),
+    ModuleSpec(
+        module_id='SearchIndexModule',
+        target='src.modules.reset.search_index:SearchIndexModule',
+        tab='reset',
+        info=ModuleInfo(
+            name='Search Index Rebuild',
+            description='Stops search service, clears index, and rebuilds from scratch',
+            category='System',
+            requires_admin=True,
+            requires_reboot=False,
+            is_critical=True
+        ),
+        required_services=('WSearch',)
+    ),
+    ModuleSpec(
+        module_id='StartMenuResetModule',
+        target='src.modules.reset.startmenu_reset:StartMenuResetModule',
+        tab='reset',
+        info=ModuleInfo(
+            name='Start Menu & Explorer Reset',
+            description='Resets Start Menu layout and Explorer settings to defaults',
+            category='System',
+            requires_admin=True,
+            requires_reboot=False,
+            is_critical=True
+        )
+    ),
+    ModuleSpec(
+        module_id='UpdateResetModule',
+        target='src.modules.reset.update_reset:UpdateResetModule',
+        tab='reset',
+        info=ModuleInfo(
+            name='Windows Update Soft-Reset',
+            description='Resets Windows Update components, clears cache, and re-registers DLLs',
+            category='System',
+            requires_admin=True,
+            requires_reboot=True,
+            is_critical=True
+        ),
+        required_services=('wuauserv', 'bits', 'cryptsvc', 'msiserver'),
+        required_paths=(r'%SystemRoot%\SoftwareDistribution',)
+    ),
+]
+
+
+class ModuleRegistry(Mapping):
+    """
+    Lazy mapping of module id to module instance.
+    
+    Metadata comes from the specs alone; a module's code is imported and
+    the instance created on first lookup, then reused. Membership tests and
+    iteration never import module code.
+    """
+    
+    def __init__(
+        self,
+        specs: Optional[Iterable[ModuleSpec]] = None,
+        load_entry_points: bool = True
+    ) -> None:
+        """
+        Args:
+            specs: Built-in specs (defaults to MANIFEST)
+            load_entry_points: Also register modules from installed plugins
+        """
+        self._logger = get_logger()
+        self._specs: Dict[str, ModuleSpec] = {}
+        self._instances: Dict[str, BaseModule] = {}
+        self._lock = threading.Lock()
+        
+        for spec in (MANIFEST if specs is None else specs):
+            self.register(spec)
+        
+        if load_entry_points:
+            self._load_entry_points()
+    
+    def register(self, spec: ModuleSpec) -> None:
+        """Add a module spec. Ids already registered are kept."""
+        if spec.module_id in self._specs:
+            self._logger.warning(f'Duplicate module id ignored: {spec.module_id} ({spec.target})')
+            return
+        self._specs[spec.module_id] = spec
+    
+    def _load_entry_points(self) -> None:
+        try:
+            entry_points = importlib.metadata.entry_points(group=ENTRY_POINT_GROUP)
+        except Exception:
+            self._logger.exception('Could not read module entry points')
+            return
+        
+        for entry_point in entry_points:
+            try:
+                specs = entry_point.load()
+                for spec in (specs() if callable(specs) else specs):
+                    self.register(spec)
+            except Exception:
+                self._logger.exception(f'Could not load module plugin: {entry_point.name}')
+    
+    def spec(self, module_id: str) -> ModuleSpec:
+        return self._specs[module_id]
+    
+    def specs(self) -> Dict[str, ModuleSpec]:
+        """Specs keyed by module id, in manifest order."""
+        return dict(self._specs)
+    
+    def info(self, module_id: str) -> ModuleInfo:
+        """Module metadata, without importing the module."""
+        return self._specs[module_id].info
+    
+    def ids(self, tab: Optional[str] = None) -> List[str]:
+        """Module ids in manifest order, optionally only those shown on a tab."""
+        return [m for m, spec in self._specs.items() if tab is None or spec.tab == tab]
+    
+    def is_loaded(self, module_id: str) -> bool:
+        return module_id in self._instances
+    
+    def __getitem__(self, module_id: str) -> BaseModule:
+        module = self._instances.get(module_id)
+        if module is not None:
+            return module
+        
+        spec = self._specs[module_id]
+        with self._lock:
+            if module_id not in self._instances:
+                self._logger.debug(f'Loading module: {spec.target}')
+                self._instances[module_id] = spec.load_class()()
+            return self._instances[module_id]
+    
+    def __contains__(self, module_id: object) -> bool:
+        return module_id in self._specs
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+    
+    def __len__(self) -> int:
+        return len(self._specs)
@@ -1,17 +1,21 @@
 """Reset modules for Windows system restoration."""
 
-from src.modules.reset.network_reset import NetworkResetModule
-from src.modules.reset.power_plan import PowerPlanResetModule
-from src.modules.reset.default_apps import DefaultAppsResetModule
-from src.modules.reset.search_index import SearchIndexModule
-from src.modules.reset.startmenu_reset import StartMenuResetModule
-from src.modules.reset.update_reset import UpdateResetModule
+import importlib
 
-__all__ = [
-    'NetworkResetModule',
-    'PowerPlanResetModule',
-    'DefaultAppsResetModule',
-    'SearchIndexModule',
-    'StartMenuResetModule',
-    'UpdateResetModule',
-]
+_EXPORTS = {
+    'NetworkResetModule': 'network_reset',
+    'PowerPlanResetModule': 'power_plan',
+    'DefaultAppsResetModule': 'default_apps',
+    'SearchIndexModule': 'search_index',
+    'StartMenuResetModule': 'startmenu_reset',
+    'UpdateResetModule': 'update_reset',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    # Classes are imported on first access, see src.modules.registry
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f'{__name__}.{_EXPORTS[name]}'), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
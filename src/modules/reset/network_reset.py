@@ -5,6 +5,7 @@ Performs comprehensive network stack reset.
 
 from src.modules.base import BaseModule, ModuleInfo
 from src.core.executor import ExecutionResult, ExecutionStatus
+from src.modules.checks import verify_ipv4
 
 
 class NetworkResetModule(BaseModule):
@@ -57,3 +58,6 @@ class NetworkResetModule(BaseModule):
             message='Network reset completed. Restart required.',
             details=details
         )
+    
+    def verify(self) -> ExecutionResult:
+        return verify_ipv4(self._runner, self.info.name)
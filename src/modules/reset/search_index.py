@@ -10,6 +10,8 @@ from src.core.executor import ExecutionResult, ExecutionStatus
 class SearchIndexModule(BaseModule):
     """Rebuild Windows Search index to fix search issues."""
     
+    required_services = ['WSearch']
+    
     @property
     def info(self) -> ModuleInfo:
         return ModuleInfo(
@@ -3,13 +3,36 @@ Windows Update Soft-Reset Module.
 Resets Windows Update components without reinstallation.
 """
 
+import os
+from pathlib import Path
+
 from src.modules.base import BaseModule, ModuleInfo
 from src.core.executor import ExecutionResult, ExecutionStatus
+from src.core.journal import JournalRun
+from src.system.files import DeletionStats
+from src.system.services import get_service_inventory
 
 
 class UpdateResetModule(BaseModule):
     """Soft-reset Windows Update components."""
     
+    SERVICES = ['wuauserv', 'bits', 'cryptsvc', 'msiserver']
+    
+    required_services = SERVICES
+    required_paths = [r'%SystemRoot%\SoftwareDistribution']
+    
+    DLLS = [
+        'atl.dll', 'urlmon.dll', 'mshtml.dll', 'shdocvw.dll',
+        'browseui.dll', 'jscript.dll', 'vbscript.dll', 'scrrun.dll',
+        'msxml.dll', 'msxml3.dll', 'msxml6.dll', 'actxprxy.dll',
+        'softpub.dll', 'wintrust.dll', 'dssenh.dll', 'rsaenh.dll',
+        'gpkcsp.dll', 'sccbase.dll', 'slbcsp.dll', 'cryptdlg.dll',
+        'oleaut32.dll', 'ole32.dll', 'shell32.dll', 'initpki.dll',
+        'wuapi.dll', 'wuaueng.dll', 'wuaueng1.dll', 'wucltui.dll',
+        'wups.dll', 'wups2.dll', 'wuweb.dll', 'qmgr.dll', 'qmgrprxy.dll',
+        'wucltux.dll', 'muweb.dll', 'wuwebv.dll'
+    ]
+    
     @property
     def info(self) -> ModuleInfo:
         return ModuleInfo(
@@ -22,90 +45,104 @@ class UpdateResetModule(BaseModule):
         )
     
     def _execute(self) -> ExecutionResult:
-        operations = []
+        operations = [
+            self._step('stop_services', self._stop_services),
+            self._step('rename_folders', self._rename_folders),
+            self._step('register_dlls', self._register_dlls),
+            self._step('winsock_reset', self._reset_winsock),
+            self._step('start_services', self._start_services),
+        ]
         
-        # Services to manage
-        services = ['wuauserv', 'bits', 'cryptsvc', 'msiserver']
+        details = '\n'.join(line for line in operations if line)
         
-        # Stop services
-        for service in services:
+        return ExecutionResult(
+            status=ExecutionStatus.SUCCESS,
+            message='Windows Update soft-reset completed. Restart recommended.',
+            details=details
+        )
+    
+    def _stop_services(self) -> str:
+        operations = []
+        for service in self.SERVICES:
             result = self._runner.run(['net', 'stop', service])
             if result.success or 'not started' in result.stderr.lower():
                 operations.append(f'[OK] Stopped {service}')
             else:
                 operations.append(f'[WARN] Could not stop {service}')
-        
-        # Rename SoftwareDistribution folder
-        ps_rename = '''
-        $sdPath = "$env:SystemRoot\\SoftwareDistribution"
-        $sdBackup = "$env:SystemRoot\\SoftwareDistribution.old"
-        
-        if (Test-Path $sdBackup) {
-            Remove-Item -Path $sdBackup -Recurse -Force -ErrorAction SilentlyContinue
-        }
-        
-        if (Test-Path $sdPath) {
-            Rename-Item -Path $sdPath -NewName "SoftwareDistribution.old" -Force -ErrorAction SilentlyContinue
-        }
-        
-        $catroot2Path = "$env:SystemRoot\\System32\\catroot2"
-        $catroot2Backup = "$env:SystemRoot\\System32\\catroot2.old"
-        
-        if (Test-Path $catroot2Backup) {
-            Remove-Item -Path $catroot2Backup -Recurse -Force -ErrorAction SilentlyContinue
-        }
-        
-        if (Test-Path $catroot2Path) {
-            Rename-Item -Path $catroot2Path -NewName "catroot2.old" -Force -ErrorAction SilentlyContinue
-        }
-        
-        Write-Output "Folders renamed"
-        '''
-        
-        rename_result = self._runner.run_powershell(ps_rename)
-        if rename_result.success:
-            operations.append('[OK] Update folders renamed')
-        else:
-            operations.append('[WARN] Could not rename all folders')
-        
-        # Re-register Windows Update DLLs
-        dlls = [
-            'atl.dll', 'urlmon.dll', 'mshtml.dll', 'shdocvw.dll',
-            'browseui.dll', 'jscript.dll', 'vbscript.dll', 'scrrun.dll',
-            'msxml.dll', 'msxml3.dll', 'msxml6.dll', 'actxprxy.dll',
-            'softpub.dll', 'wintrust.dll', 'dssenh.dll', 'rsaenh.dll',
-            'gpkcsp.dll', 'sccbase.dll', 'slbcsp.dll', 'cryptdlg.dll',
-            'oleaut32.dll', 'ole32.dll', 'shell32.dll', 'initpki.dll',
-            'wuapi.dll', 'wuaueng.dll', 'wuaueng1.dll', 'wucltui.dll',
-            'wups.dll', 'wups2.dll', 'wuweb.dll', 'qmgr.dll', 'qmgrprxy.dll',
-            'wucltux.dll', 'muweb.dll', 'wuwebv.dll'
+        return '\n'.join(operations)
+    
+    def _rename_folders(self) -> str:
+        system_root = Path(os.environ.get('SystemRoot', r'C:\Windows'))
+        folders = [
+            system_root / 'SoftwareDistribution',
+            system_root / 'System32' / 'catroot2',
         ]
         
+        removed = DeletionStats()
+        renamed = 0
+        for folder in folders:
+            backup = folder.with_name(folder.name + '.old')
+            
+            # Old backups can be large, so they go through the throttled deleter
+            if backup.exists():
+                removed.add(self._deleter.clear_directory(backup, remove_root=True))
+            
+            if folder.exists():
+                try:
+                    folder.rename(backup)
+                    renamed += 1
+                except OSError:
+                    self._logger.warning(f'Could not rename {folder}')
+            else:
+                renamed += 1
+        
+        status = '[OK] Update folders renamed' if renamed == len(folders) else '[WARN] Could not rename all folders'
+        return f'{status}\n[INFO] Old backups: {removed.summary()}'
+    
+    def _register_dlls(self) -> str:
         dll_success = 0
-        for dll in dlls:
+        for dll in self.DLLS:
             result = self._runner.run(['regsvr32', '/s', dll])
             if result.success:
                 dll_success += 1
         
-        operations.append(f'[OK] Re-registered {dll_success}/{len(dlls)} DLLs')
-        
-        # Reset Winsock
+        return f'[OK] Re-registered {dll_success}/{len(self.DLLS)} DLLs'
+    
+    def _reset_winsock(self) -> str:
         result = self._runner.run(['netsh', 'winsock', 'reset'])
         if result.success:
-            operations.append('[OK] Winsock reset')
-        
-        # Start services
-        for service in services:
+            return '[OK] Winsock reset'
+        return ''
+    
+    def _start_services(self) -> str:
+        operations = []
+        for service in self.SERVICES:
             result = self._runner.run(['net', 'start', service])
             if result.success:
                 operations.append(f'[OK] Started {service}')
             else:
                 operations.append(f'[WARN] Could not start {service}')
-        
-        details = '\n'.join(operations)
+        return '\n'.join(operations)
+    
+    def _compensate(self, run: JournalRun) -> str:
+        # Services stopped by an interrupted run must not stay down
+        if 'stop_services' in run.started_steps and 'start_services' not in run.committed_steps:
+            return self._start_services()
+        return ''
+    
+    def verify(self) -> ExecutionResult:
+        """Post-restart check that the update services came back up."""
+        inventory = get_service_inventory(refresh=True)
+        operations = []
+        for service in self.SERVICES:
+            record = inventory.get(service)
+            if record and record.is_running:
+                operations.append(f'[OK] {service} running')
+            else:
+                operations.append(f'[INFO] {service} not running (may start on demand)')
         
         return ExecutionResult(
             status=ExecutionStatus.SUCCESS,
-            message='Windows Update soft-reset completed. Restart recommended.',
-            details=details
+            message=f'{self.info.name} verified after restart',
+            details='\n'.join(operations)
         )
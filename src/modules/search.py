@@ -0,0 +1,79 @@
+"""
+Module search index.
+Precomputed lookup of modules by the words in their name and category.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.modules.base import ModuleInfo
+
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+
+class ModuleIndex:
+    """
+    Word-prefix index over module names and categories.
+    
+    Every prefix of every word is stored when the index is built, so a query
+    costs one dictionary lookup and set intersection per search term,
+    however many modules there are.
+    """
+    
+    def __init__(self, entries: Iterable[Tuple[str, ModuleInfo]]) -> None:
+        """
+        Args:
+            entries: (module id, metadata) pairs in display order
+        """
+        self._order: Dict[str, int] = {}
+        self._categories: Dict[str, Set[str]] = {}
+        self._category_names: Dict[str, str] = {}
+        self._prefixes: Dict[str, Set[str]] = {}
+        
+        for position, (module_id, info) in enumerate(entries):
+            self._order[module_id] = position
+            
+            category = info.category.lower()
+            self._categories.setdefault(category, set()).add(module_id)
+            self._category_names.setdefault(category, info.category)
+            
+            for word in set(_WORD.findall(f'{info.name} {info.category}'.lower())):
+                for end in range(1, len(word) + 1):
+                    self._prefixes.setdefault(word[:end], set()).add(module_id)
+    
+    def __len__(self) -> int:
+        return len(self._order)
+    
+    @property
+    def categories(self) -> List[str]:
+        """Category names in order of first appearance."""
+        return list(self._category_names.values())
+    
+    def search(self, query: str = '', category: Optional[str] = None) -> Set[str]:
+        """
+        Find modules by name or category.
+        
+        Args:
+            query: Each word must start a word of the module's name or
+                category ('dns fl' matches 'DNS Cache Flush')
+            category: Only modules in this category (case-insensitive)
+        
+        Returns:
+            Matching module ids
+        """
+        matches = set(self._order)
+        
+        if category:
+            matches &= self._categories.get(category.lower(), set())
+        
+        for term in _WORD.findall(query.lower()):
+            if not matches:
+                break
+            matches &= self._prefixes.get(term, set())
+        
+        return matches
+    
+    def ordered(self, module_ids: Iterable[str]) -> List[str]:
+        """Sort module ids into display order."""
+        return sorted(module_ids, key=self._order.__getitem__)
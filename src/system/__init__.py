@@ -3,8 +3,10 @@
 from src.system.admin import AdminPrivileges, is_admin, request_admin
 from src.system.platform_check import PlatformCheck
 from src.system.commands import CommandRunner, CommandResult
+from src.system.snapshot import SystemSnapshot, get_snapshot, refresh_snapshot
 
 __all__ = [
     'AdminPrivileges', 'is_admin', 'request_admin',
-    'PlatformCheck', 'CommandRunner', 'CommandResult'
+    'PlatformCheck', 'CommandRunner', 'CommandResult',
+    'SystemSnapshot', 'get_snapshot', 'refresh_snapshot'
 ]
@@ -0,0 +1,214 @@
+"""
+Child process resource accounting.
+CPU time, peak memory and I/O of commands started by CommandRunner.
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+from src.system.platform_check import PlatformCheck
+from src.utils.logger import get_logger
+from src.utils.memory import windows_memory_counters
+
+
+JOB_OBJECT_BASIC_AND_IO_ACCOUNTING = 8    # JOBOBJECTINFOCLASS
+FILETIME_TICKS_PER_MS = 10000
+BLOCK_SIZE = 512                          # Unit of ru_inblock and ru_oublock
+
+
+@dataclass
+class ResourceUsage:
+    """Resources used by a command, or by all commands of a module run."""
+    user_cpu_ms: float = 0.0
+    system_cpu_ms: float = 0.0
+    peak_memory_bytes: int = 0
+    read_bytes: int = 0
+    write_bytes: int = 0
+    
+    @property
+    def cpu_ms(self) -> float:
+        return round(self.user_cpu_ms + self.system_cpu_ms, 1)
+    
+    def add(self, other: 'ResourceUsage') -> None:
+        """Accumulate another command; peak memory keeps the largest."""
+        self.user_cpu_ms = round(self.user_cpu_ms + other.user_cpu_ms, 1)
+        self.system_cpu_ms = round(self.system_cpu_ms + other.system_cpu_ms, 1)
+        self.peak_memory_bytes = max(self.peak_memory_bytes, other.peak_memory_bytes)
+        self.read_bytes += other.read_bytes
+        self.write_bytes += other.write_bytes
+    
+    def to_dict(self) -> Dict[str, float]:
+        return {'cpu_ms': self.cpu_ms, **asdict(self)}
+
+
+def has_wait_hook() -> bool:
+    """Check that Popen still reaps children through its private _try_wait()."""
+    return hasattr(subprocess.Popen, '_try_wait')
+
+
+class AccountedPopen(subprocess.Popen):
+    """
+    Popen that keeps the rusage of the child when it is reaped.
+    
+    On POSIX the child is reaped with wait4() instead of waitpid(), which
+    returns its resource usage, including that of descendants it waited for.
+    Elsewhere rusage stays None.
+    
+    This overrides Popen._try_wait(), a private CPython method that wait()
+    calls on POSIX in the supported versions, 3.10 to 3.13. Where it is
+    missing, the override is never called and for_platform() returns the
+    ProcessAccounting fallback, so usage is reported as unknown.
+    """
+    
+    rusage = None
+    
+    def _try_wait(self, wait_flags):
+        try:
+            pid, status, rusage = os.wait4(self.pid, wait_flags)
+        except ChildProcessError:
+            return self.pid, 0
+        if pid:
+            self.rusage = rusage
+        return pid, status
+
+
+class ProcessAccounting:
+    """
+    Measures the resources of one child process.
+    
+    attach() is called right after the process starts and collect() after it
+    has exited. This base class measures nothing, for platforms without
+    support; use for_platform() to get the right implementation.
+    """
+    
+    def attach(self, process: subprocess.Popen) -> None:
+        pass
+    
+    def collect(self, process: subprocess.Popen) -> Optional[ResourceUsage]:
+        return None
+    
+    def close(self) -> None:
+        pass
+    
+    @staticmethod
+    def for_platform() -> 'ProcessAccounting':
+        if PlatformCheck.is_windows():
+            return JobObjectAccounting()
+        if hasattr(os, 'wait4') and has_wait_hook():
+            return RusageAccounting()
+        return ProcessAccounting()
+
+
+class RusageAccounting(ProcessAccounting):
+    """
+    POSIX accounting from the rusage kept by AccountedPopen.
+    
+    I/O is counted in filesystem blocks, so it includes only reads and
+    writes that reached the disk, not those served from the page cache.
+    """
+    
+    def collect(self, process: subprocess.Popen) -> Optional[ResourceUsage]:
+        rusage = getattr(process, 'rusage', None)
+        if rusage is None:
+            return None
+        
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        scale = 1 if sys.platform == 'darwin' else 1024
+        return ResourceUsage(
+            user_cpu_ms=round(rusage.ru_utime * 1000, 1),
+            system_cpu_ms=round(rusage.ru_stime * 1000, 1),
+            peak_memory_bytes=rusage.ru_maxrss * scale,
+            read_bytes=rusage.ru_inblock * BLOCK_SIZE,
+            write_bytes=rusage.ru_oublock * BLOCK_SIZE
+        )
+
+
+class JobObjectAccounting(ProcessAccounting):
+    """
+    Windows accounting through a job object.
+    
+    The command is assigned to a fresh job, so CPU time and I/O include
+    every process it starts afterwards, e.g. the children of a PowerShell
+    script. Processes it starts before being assigned are not counted; like
+    the I/O priority in apply_to_process, that window is negligible. Peak
+    memory is the peak working set of the command process itself.
+    """
+    
+    def __init__(self) -> None:
+        self._logger = get_logger()
+        self._job = None
+        
+        try:
+            import ctypes
+            from ctypes import wintypes
+        except ImportError:
+            return
+        
+        self._ctypes = ctypes
+        self._kernel32 = ctypes.windll.kernel32
+        self._kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+        self._kernel32.CreateJobObjectW.argtypes = [ctypes.c_void_p, wintypes.LPCWSTR]
+        self._kernel32.AssignProcessToJobObject.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+        self._kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        self._job = self._kernel32.CreateJobObjectW(None, None) or None
+    
+    def attach(self, process: subprocess.Popen) -> None:
+        if self._job is None:
+            return
+        if not self._kernel32.AssignProcessToJobObject(self._job, int(process._handle)):
+            self._logger.debug(f'Could not assign process {process.pid} to a job object')
+            self.close()
+    
+    def collect(self, process: subprocess.Popen) -> Optional[ResourceUsage]:
+        if self._job is None:
+            return None
+        
+        ctypes = self._ctypes
+        
+        class IoCounters(ctypes.Structure):
+            _fields_ = [
+                ('ReadOperationCount', ctypes.c_ulonglong),
+                ('WriteOperationCount', ctypes.c_ulonglong),
+                ('OtherOperationCount', ctypes.c_ulonglong),
+                ('ReadTransferCount', ctypes.c_ulonglong),
+                ('WriteTransferCount', ctypes.c_ulonglong),
+                ('OtherTransferCount', ctypes.c_ulonglong),
+            ]
+        
+        class BasicAndIoAccounting(ctypes.Structure):
+            _fields_ = [
+                ('TotalUserTime', ctypes.c_longlong),
+                ('TotalKernelTime', ctypes.c_longlong),
+                ('ThisPeriodTotalUserTime', ctypes.c_longlong),
+                ('ThisPeriodTotalKernelTime', ctypes.c_longlong),
+                ('TotalPageFaultCount', ctypes.c_ulong),
+                ('TotalProcesses', ctypes.c_ulong),
+                ('ActiveProcesses', ctypes.c_ulong),
+                ('TotalTerminatedProcesses', ctypes.c_ulong),
+                ('IoInfo', IoCounters),
+            ]
+        
+        info = BasicAndIoAccounting()
+        if not self._kernel32.QueryInformationJobObject(
+            ctypes.c_void_p(self._job), JOB_OBJECT_BASIC_AND_IO_ACCOUNTING,
+            ctypes.byref(info), ctypes.sizeof(info), None
+        ):
+            return None
+        
+        memory = windows_memory_counters(int(process._handle))
+        
+        return ResourceUsage(
+            user_cpu_ms=round(info.TotalUserTime / FILETIME_TICKS_PER_MS, 1),
+            system_cpu_ms=round(info.TotalKernelTime / FILETIME_TICKS_PER_MS, 1),
+            peak_memory_bytes=memory[1] if memory else 0,
+            read_bytes=info.IoInfo.ReadTransferCount,
+            write_bytes=info.IoInfo.WriteTransferCount
+        )
+    
+    def close(self) -> None:
+        if self._job is not None:
+            self._kernel32.CloseHandle(self._job)
+            self._job = None
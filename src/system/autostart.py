@@ -0,0 +1,57 @@
+"""
+Post-reboot autostart registration.
+Uses the RunOnce registry key so the toolkit relaunches after a restart.
+"""
+
+import sys
+from pathlib import Path
+from typing import List
+
+from src.system.commands import CommandRunner
+from src.utils.logger import get_logger
+
+
+RUN_ONCE_KEY = r'HKLM\Software\Microsoft\Windows\CurrentVersion\RunOnce'
+RUN_ONCE_VALUE = 'IWS-WinCare'
+
+
+def get_launch_command() -> str:
+    """Build the command line that relaunches the toolkit."""
+    parts: List[str] = [sys.executable]
+    
+    if not getattr(sys, 'frozen', False):
+        run_script = Path(__file__).parent.parent.parent / 'run.py'
+        parts.append(str(run_script))
+    
+    return ' '.join(f'"{part}"' for part in parts)
+
+
+class AutoStart:
+    """Registers and clears one-shot launches at next logon."""
+    
+    def __init__(self) -> None:
+        self._logger = get_logger()
+        self._runner = CommandRunner()
+    
+    def register_run_once(self) -> bool:
+        """Relaunch the toolkit once at the next logon."""
+        result = self._runner.run([
+            'reg', 'add', RUN_ONCE_KEY,
+            '/v', RUN_ONCE_VALUE,
+            '/t', 'REG_SZ',
+            '/d', get_launch_command(),
+            '/f'
+        ])
+        
+        if not result.success:
+            self._logger.warning(f'Could not register post-reboot launch: {result.stderr}')
+        return result.success
+    
+    def clear_run_once(self) -> bool:
+        """Remove a pending one-shot launch entry."""
+        result = self._runner.run([
+            'reg', 'delete', RUN_ONCE_KEY,
+            '/v', RUN_ONCE_VALUE,
+            '/f'
+        ])
+        return result.success
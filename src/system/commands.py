@@ -5,11 +5,17 @@ Provides controlled subprocess execution without shell injection vulnerabilities
 
 import subprocess
 import shutil
+import time
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from pathlib import Path
 
+from src.system.accounting import AccountedPopen, ProcessAccounting, ResourceUsage
+from src.system.throttle import ThrottlePolicy, apply_to_process, creation_flags
+from src.utils.events import argv_signature, bound, get_event_log
 from src.utils.logger import get_logger
+from src.utils.timings import CommandTiming, current_timings
+from src.utils.tracing import get_tracer
 
 
 @dataclass
@@ -20,6 +26,7 @@ class CommandResult:
     stdout: str
     stderr: str
     command: str
+    usage: Optional[ResourceUsage] = None
     
     @property
     def output(self) -> str:
@@ -51,11 +58,18 @@ class CommandRunner:
         'reg': 'reg.exe',
         'taskkill': 'taskkill.exe',
         'rundll32': 'rundll32.exe',
+        'shutdown': 'shutdown.exe',
+        'ping': 'ping.exe',
     }
     
-    def __init__(self) -> None:
+    def __init__(self, policy: Optional[ThrottlePolicy] = None) -> None:
+        """
+        Args:
+            policy: Priority applied to spawned commands (defaults to normal)
+        """
         self._logger = get_logger()
         self._system32 = Path(r'C:\Windows\System32')
+        self.policy = policy or ThrottlePolicy()
     
     def _resolve_command(self, command: str) -> Optional[str]:
         """
@@ -97,6 +111,50 @@ class CommandRunner:
         Returns:
             CommandResult with execution details
         """
+        phases: Dict[str, float] = {}
+        signature = argv_signature(args)
+        
+        with get_tracer().span('command', argv=signature) as span:
+            started = time.perf_counter()
+            result = self._run_command(args, timeout, env, capture_output, phases)
+            duration_ms = round((time.perf_counter() - started) * 1000, 1)
+            if span is not None:
+                span.set(exit_code=result.return_code, **phases)
+        
+        get_event_log().emit(
+            'command',
+            argv=signature,
+            exit_code=result.return_code,
+            duration_ms=duration_ms,
+            spawn_ms=phases.get('spawn_ms'),
+            stdout_bytes=len(result.stdout.encode('utf-8', 'replace')),
+            stderr_bytes=len(result.stderr.encode('utf-8', 'replace')),
+            **(result.usage.to_dict() if result.usage else {})
+        )
+        
+        timings = current_timings()
+        if timings is not None:
+            # Resolution and refused commands count as spawn time
+            spawn_ms = phases.get('spawn_ms', duration_ms)
+            timings.add_command(CommandTiming(
+                argv=signature,
+                exit_code=result.return_code,
+                spawn_ms=spawn_ms,
+                run_ms=phases.get('run_ms', round(duration_ms - spawn_ms, 1)),
+                step=bound('step'),
+                usage=result.usage
+            ))
+        return result
+    
+    def _run_command(
+        self,
+        args: List[str],
+        timeout: int,
+        env: Optional[Dict[str, str]],
+        capture_output: bool,
+        phases: Dict[str, float]
+    ) -> CommandResult:
+        """Resolve and execute a command; see run()."""
         if not args:
             return CommandResult(
                 success=False,
@@ -125,14 +183,7 @@ class CommandRunner:
         self._logger.debug(f'Executing: {command_str}')
         
         try:
-            result = subprocess.run(
-                full_args,
-                capture_output=capture_output,
-                text=True,
-                timeout=timeout,
-                env=env,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
+            result, usage = self._run_process(full_args, timeout, env, capture_output, phases)
             
             success = result.returncode == 0
             
@@ -146,7 +197,8 @@ class CommandRunner:
                 return_code=result.returncode,
                 stdout=result.stdout or '',
                 stderr=result.stderr or '',
-                command=command_str
+                command=command_str,
+                usage=usage
             )
             
         except subprocess.TimeoutExpired:
@@ -177,6 +229,50 @@ class CommandRunner:
                 command=command_str
             )
     
+    def _run_process(
+        self,
+        full_args: List[str],
+        timeout: int,
+        env: Optional[Dict[str, str]],
+        capture_output: bool,
+        phases: Dict[str, float]
+    ) -> Tuple[subprocess.CompletedProcess, Optional[ResourceUsage]]:
+        """
+        Start the process under the throttle policy and wait for it, recording
+        spawn_ms and run_ms in phases.
+        
+        Returns:
+            The completed process and its resource usage, if the platform reports it
+        """
+        pipe = subprocess.PIPE if capture_output else None
+        accounting = ProcessAccounting.for_platform()
+        
+        started = time.perf_counter()
+        with AccountedPopen(
+            full_args,
+            stdout=pipe,
+            stderr=pipe,
+            text=True,
+            env=env,
+            creationflags=creation_flags(self.policy)
+        ) as process:
+            apply_to_process(process, self.policy)
+            accounting.attach(process)
+            spawned = time.perf_counter()
+            phases['spawn_ms'] = round((spawned - started) * 1000, 1)
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+            finally:
+                phases['run_ms'] = round((time.perf_counter() - spawned) * 1000, 1)
+                usage = accounting.collect(process)
+                accounting.close()
+        
+        return subprocess.CompletedProcess(full_args, process.returncode, stdout, stderr), usage
+    
     def run_powershell(
         self,
         script: str,
@@ -0,0 +1,174 @@
+"""
+Throttled file deletion.
+Removes directory contents in-process under a ThrottlePolicy's rate limits.
+"""
+
+import os
+import stat
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Union
+
+from src.system.throttle import ThrottlePolicy, TokenBucket
+
+
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+
+@dataclass
+class DeletionStats:
+    """Measured outcome of a throttled deletion."""
+    files: int = 0
+    directories: int = 0
+    bytes: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+    throttled: float = 0.0
+    
+    def add(self, other: 'DeletionStats') -> None:
+        self.files += other.files
+        self.directories += other.directories
+        self.bytes += other.bytes
+        self.skipped += other.skipped
+        self.elapsed += other.elapsed
+        self.throttled += other.throttled
+    
+    @property
+    def megabytes(self) -> float:
+        return self.bytes / (1024 * 1024)
+    
+    def summary(self) -> str:
+        """Deletion totals and the time spent waiting on rate limits."""
+        rate = self.files / self.elapsed if self.elapsed > 0 else 0.0
+        return (
+            f'Deleted {self.files} files, freed {self.megabytes:.2f} MB, '
+            f'skipped {self.skipped} in use; {self.elapsed:.1f}s elapsed, '
+            f'{self.throttled:.1f}s throttled ({rate:.0f} files/s)'
+        )
+
+
+def _is_link(entry: os.DirEntry) -> bool:
+    """Symlinks and junctions are removed, never followed."""
+    if entry.is_symlink():
+        return True
+    try:
+        attributes = getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0)
+    except OSError:
+        return False
+    return bool(attributes & FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+class ThrottledDeleter:
+    """
+    Rate-limited recursive deleter.
+    
+    Files are admitted through token buckets for file count and bytes, so a
+    large purge is spread out instead of saturating the disk. Files that are
+    in use or access-denied are skipped and counted.
+    """
+    
+    def __init__(
+        self,
+        policy: ThrottlePolicy,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> None:
+        self._clock = clock
+        self._files = TokenBucket(policy.max_files_per_second, clock=clock, sleep=sleep)
+        self._bytes = TokenBucket(policy.max_mb_per_second * 1024 * 1024, clock=clock, sleep=sleep)
+    
+    def clear_directory(
+        self,
+        path: Union[str, Path],
+        recursive: bool = True,
+        remove_root: bool = False
+    ) -> DeletionStats:
+        """
+        Delete the contents of a directory.
+        
+        Args:
+            path: Directory to clear
+            recursive: Also delete subdirectories; otherwise only top-level files
+            remove_root: Remove the directory itself once empty
+        
+        Returns:
+            DeletionStats for this call
+        """
+        stats = DeletionStats()
+        root = Path(path)
+        if not root.is_dir():
+            return stats
+        
+        started = self._clock()
+        # Post-order walk: (directory, visited) pairs on an explicit stack
+        stack = [(root, False)]
+        while stack:
+            directory, visited = stack.pop()
+            if visited:
+                if directory != root or remove_root:
+                    self._remove_dir(directory, stats)
+                continue
+            
+            stack.append((directory, True))
+            for entry in self._scan(directory, stats):
+                if entry.is_dir(follow_symlinks=False) and not _is_link(entry):
+                    if recursive:
+                        stack.append((Path(entry.path), False))
+                elif _is_link(entry) and entry.is_dir():
+                    if recursive:
+                        self._remove_dir(Path(entry.path), stats)
+                else:
+                    self._remove_file(entry, stats)
+        
+        stats.elapsed = self._clock() - started
+        return stats
+    
+    def _scan(self, directory: Path, stats: DeletionStats) -> List[os.DirEntry]:
+        try:
+            with os.scandir(directory) as entries:
+                return list(entries)
+        except OSError:
+            stats.skipped += 1
+            return []
+    
+    def _remove_file(self, entry: os.DirEntry, stats: DeletionStats) -> None:
+        try:
+            size = entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            size = 0
+        
+        stats.throttled += self._files.consume(1)
+        stats.throttled += self._bytes.consume(size)
+        
+        try:
+            os.unlink(entry.path)
+        except PermissionError:
+            # Read-only files need their attribute cleared first
+            try:
+                os.chmod(entry.path, stat.S_IWRITE)
+                os.unlink(entry.path)
+            except OSError:
+                stats.skipped += 1
+                return
+        except OSError:
+            stats.skipped += 1
+            return
+        
+        stats.files += 1
+        stats.bytes += size
+    
+    def _remove_dir(self, path: Path, stats: DeletionStats) -> None:
+        try:
+            os.rmdir(path)
+        except NotADirectoryError:
+            # Directory symlink on POSIX
+            try:
+                os.unlink(path)
+            except OSError:
+                stats.skipped += 1
+                return
+        except OSError:
+            # Not empty because something inside was in use
+            return
+        stats.directories += 1
@@ -0,0 +1,211 @@
+"""
+Idle signal sources.
+Reports CPU and disk utilisation, time since last user input and power
+source, used to decide when background maintenance may run.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional, Tuple
+
+from src.system.platform_check import PlatformCheck
+
+
+class IdleSignals(ABC):
+    """
+    Interface for idle signal sources.
+    Utilisation readings are measured since the previous call.
+    """
+    
+    @abstractmethod
+    def cpu_percent(self) -> float:
+        """CPU utilisation in percent."""
+        pass
+    
+    @abstractmethod
+    def disk_percent(self) -> float:
+        """Busiest disk utilisation in percent."""
+        pass
+    
+    @abstractmethod
+    def input_idle_seconds(self) -> float:
+        """Seconds since the last keyboard or mouse input."""
+        pass
+    
+    @abstractmethod
+    def on_ac_power(self) -> bool:
+        """Whether the machine runs on mains power."""
+        pass
+
+
+class WindowsIdleSignals(IdleSignals):
+    """Idle signals from Win32 APIs and the PDH disk counters."""
+    
+    PDH_FMT_DOUBLE = 0x00000200
+    
+    def __init__(self) -> None:
+        import ctypes
+        from ctypes import wintypes
+        
+        self._ctypes = ctypes
+        self._wintypes = wintypes
+        self._kernel32 = ctypes.windll.kernel32
+        self._user32 = ctypes.windll.user32
+        self._last_cpu: Optional[Tuple[int, int, int]] = None
+        self._pdh_query = None
+        self._pdh_counter = None
+        self._init_disk_counter()
+    
+    def _init_disk_counter(self) -> None:
+        ctypes = self._ctypes
+        try:
+            pdh = ctypes.windll.pdh
+            query = ctypes.c_void_p()
+            counter = ctypes.c_void_p()
+            if pdh.PdhOpenQueryW(None, None, ctypes.byref(query)) != 0:
+                return
+            path = '\\PhysicalDisk(_Total)\\% Idle Time'
+            if pdh.PdhAddEnglishCounterW(query, path, None, ctypes.byref(counter)) != 0:
+                pdh.PdhCloseQuery(query)
+                return
+            pdh.PdhCollectQueryData(query)
+            self._pdh = pdh
+            self._pdh_query = query
+            self._pdh_counter = counter
+        except (AttributeError, OSError):
+            self._pdh_query = None
+    
+    def cpu_percent(self) -> float:
+        ctypes = self._ctypes
+        idle, kernel, user = (self._wintypes.FILETIME() for _ in range(3))
+        self._kernel32.GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user))
+        
+        def ticks(ft) -> int:
+            return (ft.dwHighDateTime << 32) | ft.dwLowDateTime
+        
+        sample = (ticks(idle), ticks(kernel), ticks(user))
+        previous, self._last_cpu = self._last_cpu, sample
+        if previous is None:
+            return 0.0
+        
+        idle_delta = sample[0] - previous[0]
+        # Kernel time includes idle time
+        total_delta = (sample[1] - previous[1]) + (sample[2] - previous[2])
+        if total_delta <= 0:
+            return 0.0
+        return max(0.0, min(100.0, 100.0 * (1 - idle_delta / total_delta)))
+    
+    def disk_percent(self) -> float:
+        if self._pdh_query is None:
+            return 0.0
+        
+        ctypes = self._ctypes
+        
+        class PdhFmtCounterValue(ctypes.Structure):
+            _fields_ = [('CStatus', ctypes.c_ulong), ('doubleValue', ctypes.c_double)]
+        
+        value = PdhFmtCounterValue()
+        self._pdh.PdhCollectQueryData(self._pdh_query)
+        status = self._pdh.PdhGetFormattedCounterValue(
+            self._pdh_counter, self.PDH_FMT_DOUBLE, None, ctypes.byref(value)
+        )
+        if status != 0:
+            return 0.0
+        return max(0.0, min(100.0, 100.0 - value.doubleValue))
+    
+    def input_idle_seconds(self) -> float:
+        ctypes = self._ctypes
+        
+        class LastInputInfo(ctypes.Structure):
+            _fields_ = [('cbSize', ctypes.c_uint), ('dwTime', ctypes.c_uint32)]
+        
+        info = LastInputInfo()
+        info.cbSize = ctypes.sizeof(info)
+        if not self._user32.GetLastInputInfo(ctypes.byref(info)):
+            return 0.0
+        # Both values are 32-bit tick counts, so the difference wraps
+        now = self._kernel32.GetTickCount() & 0xFFFFFFFF
+        return ((now - info.dwTime) & 0xFFFFFFFF) / 1000.0
+    
+    def on_ac_power(self) -> bool:
+        ctypes = self._ctypes
+        
+        class SystemPowerStatus(ctypes.Structure):
+            _fields_ = [
+                ('ACLineStatus', ctypes.c_ubyte),
+                ('BatteryFlag', ctypes.c_ubyte),
+                ('BatteryLifePercent', ctypes.c_ubyte),
+                ('SystemStatusFlag', ctypes.c_ubyte),
+                ('BatteryLifeTime', ctypes.c_uint32),
+                ('BatteryFullLifeTime', ctypes.c_uint32),
+            ]
+        
+        status = SystemPowerStatus()
+        if not self._kernel32.GetSystemPowerStatus(ctypes.byref(status)):
+            return True
+        # 0 = battery, 1 = AC, 255 = unknown (treated as AC, e.g. desktops)
+        return status.ACLineStatus != 0
+
+
+class ProcIdleSignals(IdleSignals):
+    """Idle signals from /proc and /sys on Linux."""
+    
+    def __init__(self) -> None:
+        self._last_cpu: Optional[Tuple[int, int]] = None
+        self._last_disk: Optional[Tuple[float, dict]] = None
+    
+    def cpu_percent(self) -> float:
+        try:
+            fields = Path('/proc/stat').read_text(encoding='ascii').splitlines()[0].split()[1:]
+        except (OSError, IndexError):
+            return 0.0
+        
+        values = [int(v) for v in fields]
+        idle = values[3] + (values[4] if len(values) > 4 else 0)
+        sample = (idle, sum(values))
+        previous, self._last_cpu = self._last_cpu, sample
+        if previous is None or sample[1] <= previous[1]:
+            return 0.0
+        return 100.0 * (1 - (sample[0] - previous[0]) / (sample[1] - previous[1]))
+    
+    def disk_percent(self) -> float:
+        try:
+            lines = Path('/proc/diskstats').read_text(encoding='ascii').splitlines()
+        except OSError:
+            return 0.0
+        
+        busy_ms = {}
+        for line in lines:
+            fields = line.split()
+            if len(fields) > 12 and not fields[2].startswith(('loop', 'ram')):
+                busy_ms[fields[2]] = int(fields[12])
+        
+        now = time.monotonic()
+        previous, self._last_disk = self._last_disk, (now, busy_ms)
+        if previous is None or now <= previous[0]:
+            return 0.0
+        
+        elapsed_ms = (now - previous[0]) * 1000
+        deltas = [busy_ms[d] - previous[1].get(d, busy_ms[d]) for d in busy_ms]
+        return max([0.0] + [min(100.0, 100.0 * d / elapsed_ms) for d in deltas])
+    
+    def input_idle_seconds(self) -> float:
+        # No portable source for desktop input; headless hosts count as idle
+        return float('inf')
+    
+    def on_ac_power(self) -> bool:
+        for supply in Path('/sys/class/power_supply').glob('*'):
+            try:
+                if (supply / 'type').read_text().strip() == 'Mains':
+                    return (supply / 'online').read_text().strip() == '1'
+            except OSError:
+                continue
+        return True
+
+
+def get_idle_signals() -> IdleSignals:
+    """Return the idle signal source for the current platform."""
+    if PlatformCheck.is_windows():
+        return WindowsIdleSignals()
+    return ProcIdleSignals()
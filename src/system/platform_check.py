@@ -5,6 +5,7 @@ Validates Windows version and system requirements.
 
 import platform
 import sys
+import time
 from dataclasses import dataclass
 from typing import Tuple, Optional
 
@@ -67,8 +68,47 @@ class PlatformCheck:
         except AttributeError:
             return 'Unknown'
     
+    @staticmethod
+    def get_boot_time() -> float:
+        """
+        Get the system boot time as a Unix timestamp.
+        Returns 0.0 if the uptime cannot be determined.
+        """
+        try:
+            if PlatformCheck.is_windows():
+                import ctypes
+                ctypes.windll.kernel32.GetTickCount64.restype = ctypes.c_uint64
+                uptime = ctypes.windll.kernel32.GetTickCount64() / 1000.0
+            else:
+                with open('/proc/uptime', 'r', encoding='ascii') as f:
+                    uptime = float(f.read().split()[0])
+            return time.time() - uptime
+        except (AttributeError, OSError, ValueError, IndexError):
+            return 0.0
+    
+    @staticmethod
+    def has_rebooted_since(boot_time: float) -> bool:
+        """Check if the system has restarted since the given boot time."""
+        # Boot time is derived from uptime, so allow for clock jitter between reads
+        return PlatformCheck.get_boot_time() > boot_time + 30.0
+    
     @staticmethod
     def check_system() -> SystemInfo:
+        """
+        Return the system compatibility check for this session.
+        Served from the session snapshot; call refresh() to re-probe.
+        """
+        from src.system.snapshot import get_snapshot
+        return get_snapshot().system_info
+    
+    @staticmethod
+    def refresh() -> SystemInfo:
+        """Re-probe the system and update the session snapshot."""
+        from src.system.snapshot import refresh_snapshot
+        return refresh_snapshot().system_info
+    
+    @staticmethod
+    def probe_system() -> SystemInfo:
         """Perform full system compatibility check."""
         os_name = platform.system()
         os_version = platform.release()
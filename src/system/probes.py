@@ -0,0 +1,204 @@
+"""
+Network connectivity probes.
+Fast DNS, TCP and gateway checks used to decide whether a repair worked.
+"""
+
+import re
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from src.system.commands import CommandRunner
+from src.system.platform_check import PlatformCheck
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of a single connectivity probe."""
+    kind: str
+    target: str
+    success: bool
+    latency_ms: float
+    message: str
+
+
+@dataclass
+class ConnectivityReport:
+    """Combined outcome of a probe round."""
+    results: List[ProbeResult]
+    
+    def _of_kind(self, kind: str) -> List[ProbeResult]:
+        return [r for r in self.results if r.kind == kind]
+    
+    @property
+    def healthy(self) -> bool:
+        """All names resolve, the gateway answers and at least one TCP target connects."""
+        dns = self._of_kind('dns')
+        tcp = self._of_kind('tcp')
+        gateway = self._of_kind('gateway')
+        
+        return (
+            all(r.success for r in dns)
+            and all(r.success for r in gateway)
+            and (not tcp or any(r.success for r in tcp))
+        )
+    
+    def summary(self) -> str:
+        """Human readable probe lines."""
+        return '\n'.join(
+            f'[{"OK" if r.success else "FAIL"}] {r.kind} {r.target} '
+            f'({r.latency_ms:.0f} ms) {r.message}'.rstrip()
+            for r in self.results
+        )
+
+
+def parse_target(target: str, default_port: int = 0) -> Tuple[str, int]:
+    """Split 'host:port' (or '[v6]:port') into host and port."""
+    match = re.match(r'^\[(.+)\]:(\d+)$', target) or re.match(r'^([^:]+):(\d+)$', target)
+    if match:
+        return match.group(1), int(match.group(2))
+    return target.strip('[]'), default_port
+
+
+def detect_default_gateway() -> Optional[str]:
+    """Best-effort lookup of the IPv4 default gateway."""
+    if PlatformCheck.is_windows():
+        result = CommandRunner().run(['ipconfig'], timeout=10)
+        match = re.search(r'Default Gateway[ .]*:\s*(\d+\.\d+\.\d+\.\d+)', result.stdout)
+        return match.group(1) if match else None
+    
+    try:
+        lines = Path('/proc/net/route').read_text(encoding='ascii').splitlines()[1:]
+    except OSError:
+        return None
+    
+    for line in lines:
+        fields = line.split()
+        if len(fields) > 2 and fields[1] == '00000000':
+            raw = int(fields[2], 16)
+            return socket.inet_ntoa(raw.to_bytes(4, 'little'))
+    return None
+
+
+def has_network_adapter() -> bool:
+    """Check for at least one network adapter other than loopback."""
+    try:
+        return any(
+            name != 'lo' and 'loopback' not in name.lower()
+            for _, name in socket.if_nameindex()
+        )
+    except OSError:
+        return False
+
+
+class ConnectivityProbe:
+    """
+    Runs DNS, TCP and gateway probes concurrently.
+    Targets are configurable so tests can point them at local stand-in servers.
+    """
+    
+    def __init__(
+        self,
+        dns_names: Optional[List[str]] = None,
+        tcp_targets: Optional[List[str]] = None,
+        gateway: Optional[str] = None,
+        timeout: float = 2.0,
+        gateway_resolver: Callable[[], Optional[str]] = detect_default_gateway
+    ) -> None:
+        """
+        Args:
+            dns_names: Host names that must resolve
+            tcp_targets: 'host:port' targets, at least one must accept a connection
+            gateway: Gateway 'host' (ICMP) or 'host:port' (TCP); empty to detect, None to skip
+            timeout: Per-probe timeout in seconds
+            gateway_resolver: Used to detect the gateway when gateway is empty
+        """
+        self._dns_names = dns_names or []
+        self._tcp_targets = tcp_targets or []
+        self._gateway = gateway
+        self._timeout = timeout
+        self._gateway_resolver = gateway_resolver
+        self._runner = CommandRunner()
+    
+    @classmethod
+    def from_config(cls, config) -> 'ConnectivityProbe':
+        """Build a probe from the application Config."""
+        return cls(
+            dns_names=list(config.network_probe_dns),
+            tcp_targets=list(config.network_probe_tcp),
+            gateway=config.network_probe_gateway,
+            timeout=config.network_probe_timeout
+        )
+    
+    def _timed(self, kind: str, target: str, check: Callable[[], str]) -> ProbeResult:
+        start = time.perf_counter()
+        try:
+            message = check()
+            success = True
+        except (OSError, FutureTimeout, ValueError) as e:
+            message = str(e) or type(e).__name__
+            success = False
+        latency = (time.perf_counter() - start) * 1000
+        return ProbeResult(kind, target, success, latency, message)
+    
+    def probe_dns(self, name: str) -> ProbeResult:
+        """Resolve a host name (bounded by the probe timeout)."""
+        def check() -> str:
+            # getaddrinfo has no timeout of its own; don't wait for a hung lookup
+            pool = ThreadPoolExecutor(max_workers=1)
+            try:
+                infos = pool.submit(socket.getaddrinfo, name, None).result(self._timeout)
+            finally:
+                pool.shutdown(wait=False)
+            return infos[0][4][0]
+        
+        return self._timed('dns', name, check)
+    
+    def probe_tcp(self, target: str) -> ProbeResult:
+        """Open and close a TCP connection."""
+        def check() -> str:
+            host, port = parse_target(target, 80)
+            with socket.create_connection((host, port), timeout=self._timeout):
+                return ''
+        
+        return self._timed('tcp', target, check)
+    
+    def probe_gateway(self, gateway: str) -> ProbeResult:
+        """Check the gateway answers ICMP echo, or a TCP port if one is given."""
+        host, port = parse_target(gateway)
+        if port:
+            result = self.probe_tcp(gateway)
+            result.kind = 'gateway'
+            return result
+        
+        def check() -> str:
+            wait_ms = str(int(self._timeout * 1000))
+            result = self._runner.run(['ping', '-n', '1', '-w', wait_ms, host], timeout=int(self._timeout) + 2)
+            if not result.success:
+                raise OSError('No echo reply')
+            return ''
+        
+        return self._timed('gateway', host, check)
+    
+    def run(self) -> ConnectivityReport:
+        """Run all configured probes concurrently."""
+        jobs: List[Callable[[], ProbeResult]] = []
+        jobs.extend(lambda name=name: self.probe_dns(name) for name in self._dns_names)
+        jobs.extend(lambda target=target: self.probe_tcp(target) for target in self._tcp_targets)
+        
+        gateway = self._gateway
+        if gateway == '':
+            gateway = self._gateway_resolver()
+        if gateway:
+            jobs.append(lambda: self.probe_gateway(gateway))
+        
+        if not jobs:
+            return ConnectivityReport(results=[])
+        
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            results = list(pool.map(lambda job: job(), jobs))
+        
+        return ConnectivityReport(results=results)
@@ -0,0 +1,310 @@
+"""
+Windows service inventory.
+Enumerates every service once and serves lookups from an in-memory table.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.system.platform_check import PlatformCheck
+from src.utils.logger import get_logger
+
+
+SERVICE_STATES = {
+    1: 'STOPPED',
+    2: 'START_PENDING',
+    3: 'STOP_PENDING',
+    4: 'RUNNING',
+    5: 'CONTINUE_PENDING',
+    6: 'PAUSE_PENDING',
+    7: 'PAUSED',
+}
+
+START_TYPES = {
+    0: 'BOOT',
+    1: 'SYSTEM',
+    2: 'AUTO',
+    3: 'DEMAND',
+    4: 'DISABLED',
+}
+
+
+@dataclass(frozen=True)
+class ServiceRecord:
+    """One row of the service table."""
+    name: str
+    display_name: str
+    state: str
+    start_type: str = ''
+    pid: int = 0
+    dependencies: Tuple[str, ...] = ()
+    
+    @property
+    def is_running(self) -> bool:
+        return self.state == 'RUNNING'
+
+
+class ServiceInventory:
+    """
+    Snapshot of all installed services keyed by case-insensitive name.
+    
+    Built from a single in-process SCM enumeration, falling back to parsing
+    one `sc queryex` call. The fallback cannot report start types or
+    dependencies, so those fields are left empty.
+    """
+    
+    def __init__(self, records: Iterable[ServiceRecord], source: str = '') -> None:
+        self._records: Dict[str, ServiceRecord] = {r.name.lower(): r for r in records}
+        self.source = source
+        self.captured_at = time.time()
+    
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._records
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def get(self, name: str) -> Optional[ServiceRecord]:
+        """Look up a service by name."""
+        return self._records.get(name.lower())
+    
+    def missing(self, names: Iterable[str]) -> List[str]:
+        """
+        Names from the list that are not installed.
+        
+        An unavailable inventory knows nothing about what is installed, so it
+        reports nothing missing rather than disabling every service check.
+        """
+        if self.source == 'unavailable':
+            return []
+        return [name for name in names if name.lower() not in self._records]
+    
+    def records(self) -> List[ServiceRecord]:
+        return list(self._records.values())
+    
+    @classmethod
+    def load(cls) -> 'ServiceInventory':
+        """Enumerate services, preferring the SCM API over sc.exe."""
+        logger = get_logger()
+        if not PlatformCheck.is_windows():
+            return cls([], source='unavailable')
+        
+        try:
+            return cls(_enumerate_scm(), source='scm')
+        except (AttributeError, OSError) as e:
+            logger.debug(f'SCM enumeration failed, falling back to sc queryex: {e}')
+        
+        from src.system.commands import CommandRunner
+        result = CommandRunner().run(['sc', 'queryex', 'type=', 'service', 'state=', 'all'])
+        if not result.success:
+            logger.warning('Could not enumerate services')
+            return cls([], source='unavailable')
+        return cls(parse_sc_queryex(result.stdout), source='sc')
+
+
+def parse_sc_queryex(output: str) -> List[ServiceRecord]:
+    """
+    Parse the output of `sc queryex`.
+    
+    Args:
+        output: Text with one SERVICE_NAME block per service
+    
+    Returns:
+        Service records without start type or dependencies
+    """
+    records: List[ServiceRecord] = []
+    fields: Dict[str, str] = {}
+    
+    def flush() -> None:
+        if 'SERVICE_NAME' in fields:
+            state = fields.get('STATE', '').split()
+            pid = fields.get('PID', '0')
+            records.append(ServiceRecord(
+                name=fields['SERVICE_NAME'],
+                display_name=fields.get('DISPLAY_NAME', ''),
+                state=state[1] if len(state) > 1 else '',
+                pid=int(pid) if pid.isdigit() else 0
+            ))
+        fields.clear()
+    
+    for line in output.splitlines():
+        key, sep, value = line.partition(':')
+        if not sep:
+            continue
+        key = key.strip()
+        if key == 'SERVICE_NAME':
+            flush()
+        fields[key] = value.strip()
+    
+    flush()
+    return records
+
+
+def _enumerate_scm() -> List[ServiceRecord]:
+    """Enumerate services and their configuration through advapi32."""
+    import ctypes
+    from ctypes import wintypes
+    
+    SC_MANAGER_CONNECT = 0x0001
+    SC_MANAGER_ENUMERATE_SERVICE = 0x0004
+    SERVICE_QUERY_CONFIG = 0x0001
+    SC_ENUM_PROCESS_INFO = 0
+    SERVICE_WIN32 = 0x00000030
+    SERVICE_STATE_ALL = 0x00000003
+    ERROR_MORE_DATA = 234
+    ERROR_INSUFFICIENT_BUFFER = 122
+    
+    class ServiceStatusProcess(ctypes.Structure):
+        _fields_ = [
+            ('dwServiceType', wintypes.DWORD),
+            ('dwCurrentState', wintypes.DWORD),
+            ('dwControlsAccepted', wintypes.DWORD),
+            ('dwWin32ExitCode', wintypes.DWORD),
+            ('dwServiceSpecificExitCode', wintypes.DWORD),
+            ('dwCheckPoint', wintypes.DWORD),
+            ('dwWaitHint', wintypes.DWORD),
+            ('dwProcessId', wintypes.DWORD),
+            ('dwServiceFlags', wintypes.DWORD),
+        ]
+    
+    class EnumServiceStatusProcess(ctypes.Structure):
+        _fields_ = [
+            ('lpServiceName', wintypes.LPWSTR),
+            ('lpDisplayName', wintypes.LPWSTR),
+            ('ServiceStatusProcess', ServiceStatusProcess),
+        ]
+    
+    class QueryServiceConfig(ctypes.Structure):
+        _fields_ = [
+            ('dwServiceType', wintypes.DWORD),
+            ('dwStartType', wintypes.DWORD),
+            ('dwErrorControl', wintypes.DWORD),
+            ('lpBinaryPathName', wintypes.LPWSTR),
+            ('lpLoadOrderGroup', wintypes.LPWSTR),
+            ('dwTagId', wintypes.DWORD),
+            ('lpDependencies', ctypes.c_void_p),
+            ('lpServiceStartName', wintypes.LPWSTR),
+            ('lpDisplayName', wintypes.LPWSTR),
+        ]
+    
+    advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+    # Handles are pointer-sized, so every signature is declared explicitly
+    advapi32.OpenSCManagerW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD]
+    advapi32.OpenSCManagerW.restype = wintypes.HANDLE
+    advapi32.OpenServiceW.argtypes = [wintypes.HANDLE, wintypes.LPCWSTR, wintypes.DWORD]
+    advapi32.OpenServiceW.restype = wintypes.HANDLE
+    advapi32.CloseServiceHandle.argtypes = [wintypes.HANDLE]
+    advapi32.QueryServiceConfigW.argtypes = [
+        wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)
+    ]
+    advapi32.EnumServicesStatusExW.argtypes = [
+        wintypes.HANDLE, ctypes.c_int, wintypes.DWORD, wintypes.DWORD,
+        ctypes.c_void_p, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD),
+        ctypes.POINTER(wintypes.DWORD), ctypes.POINTER(wintypes.DWORD), wintypes.LPCWSTR
+    ]
+    
+    manager = advapi32.OpenSCManagerW(None, None, SC_MANAGER_CONNECT | SC_MANAGER_ENUMERATE_SERVICE)
+    if not manager:
+        raise ctypes.WinError(ctypes.get_last_error())
+    
+    def read_dependencies(address: Optional[int]) -> Tuple[str, ...]:
+        # Double-null-terminated list of wide strings
+        names = []
+        while address:
+            name = ctypes.wstring_at(address)
+            if not name:
+                break
+            names.append(name)
+            address += (len(name) + 1) * ctypes.sizeof(ctypes.c_wchar)
+        return tuple(names)
+    
+    def query_config(name: str) -> Tuple[str, Tuple[str, ...]]:
+        handle = advapi32.OpenServiceW(manager, name, SERVICE_QUERY_CONFIG)
+        if not handle:
+            return '', ()
+        try:
+            needed = wintypes.DWORD(0)
+            advapi32.QueryServiceConfigW(handle, None, 0, ctypes.byref(needed))
+            if ctypes.get_last_error() != ERROR_INSUFFICIENT_BUFFER:
+                return '', ()
+            buffer = ctypes.create_string_buffer(needed.value)
+            if not advapi32.QueryServiceConfigW(handle, buffer, needed, ctypes.byref(needed)):
+                return '', ()
+            config = ctypes.cast(buffer, ctypes.POINTER(QueryServiceConfig)).contents
+            return (
+                START_TYPES.get(config.dwStartType, str(config.dwStartType)),
+                read_dependencies(config.lpDependencies)
+            )
+        finally:
+            advapi32.CloseServiceHandle(handle)
+    
+    records: List[ServiceRecord] = []
+    try:
+        resume = wintypes.DWORD(0)
+        needed = wintypes.DWORD(0)
+        returned = wintypes.DWORD(0)
+        size = 64 * 1024
+        
+        while True:
+            buffer = ctypes.create_string_buffer(size)
+            ok = advapi32.EnumServicesStatusExW(
+                manager, SC_ENUM_PROCESS_INFO, SERVICE_WIN32, SERVICE_STATE_ALL,
+                buffer, size, ctypes.byref(needed), ctypes.byref(returned),
+                ctypes.byref(resume), None
+            )
+            error = ctypes.get_last_error()
+            if not ok and error != ERROR_MORE_DATA:
+                raise ctypes.WinError(error)
+            
+            entries = ctypes.cast(buffer, ctypes.POINTER(EnumServiceStatusProcess * returned.value)).contents
+            for entry in entries:
+                status = entry.ServiceStatusProcess
+                start_type, dependencies = query_config(entry.lpServiceName)
+                records.append(ServiceRecord(
+                    name=entry.lpServiceName,
+                    display_name=entry.lpDisplayName or '',
+                    state=SERVICE_STATES.get(status.dwCurrentState, str(status.dwCurrentState)),
+                    start_type=start_type,
+                    pid=status.dwProcessId,
+                    dependencies=dependencies
+                ))
+            
+            if ok:
+                break
+            size = max(size, needed.value)
+    finally:
+        advapi32.CloseServiceHandle(manager)
+    
+    return records
+
+
+_inventory: Optional[ServiceInventory] = None
+_lock = threading.Lock()
+
+# A failed enumeration is kept only this long before it is retried
+UNAVAILABLE_RETRY_SECONDS = 30.0
+
+
+def get_service_inventory(refresh: bool = False) -> ServiceInventory:
+    """
+    Return the shared service inventory.
+    
+    Args:
+        refresh: Re-enumerate, e.g. to read current service states
+    
+    Returns:
+        ServiceInventory built on first use or on refresh, and rebuilt
+        once an unavailable inventory is older than the retry interval
+    """
+    global _inventory
+    with _lock:
+        stale = (
+            _inventory is not None
+            and _inventory.source == 'unavailable'
+            and time.time() - _inventory.captured_at >= UNAVAILABLE_RETRY_SECONDS
+        )
+        if _inventory is None or refresh or stale:
+            _inventory = ServiceInventory.load()
+        return _inventory
@@ -0,0 +1,89 @@
+"""
+Session-wide system snapshot.
+Captures platform facts and the admin token once and shares them read-only.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from src.system.admin import is_admin
+from src.system.platform_check import PlatformCheck, SystemInfo
+
+
+@dataclass(frozen=True)
+class SystemSnapshot:
+    """Immutable platform facts for the current session."""
+    os_name: str
+    os_version: str
+    os_build: str
+    windows_version: Tuple[int, int, int]
+    edition: str
+    architecture: str
+    python_version: str
+    is_windows: bool
+    is_admin: bool
+    is_compatible: bool
+    compatibility_message: str
+    captured_at: float
+    
+    @classmethod
+    def capture(cls) -> 'SystemSnapshot':
+        """Probe the system. Prefer get_snapshot() over calling this directly."""
+        info = PlatformCheck.probe_system()
+        is_windows = PlatformCheck.is_windows()
+        
+        return cls(
+            os_name=info.os_name,
+            os_version=info.os_version,
+            os_build=info.os_build,
+            windows_version=PlatformCheck.get_windows_version() if is_windows else (0, 0, 0),
+            edition=PlatformCheck.get_windows_edition() if is_windows else 'Unknown',
+            architecture=info.architecture,
+            python_version=info.python_version,
+            is_windows=is_windows,
+            is_admin=is_admin(),
+            is_compatible=info.is_compatible,
+            compatibility_message=info.compatibility_message,
+            captured_at=time.time()
+        )
+    
+    @property
+    def system_info(self) -> SystemInfo:
+        """The snapshot as the SystemInfo returned by PlatformCheck.check_system."""
+        return SystemInfo(
+            os_name=self.os_name,
+            os_version=self.os_version,
+            os_build=self.os_build,
+            architecture=self.architecture,
+            python_version=self.python_version,
+            is_compatible=self.is_compatible,
+            compatibility_message=self.compatibility_message
+        )
+
+
+_snapshot: Optional[SystemSnapshot] = None
+_lock = threading.Lock()
+
+
+def get_snapshot() -> SystemSnapshot:
+    """Return the session snapshot, capturing it on first use."""
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is not None:
+        return snapshot
+    
+    with _lock:
+        if _snapshot is None:
+            _snapshot = SystemSnapshot.capture()
+        return _snapshot
+
+
+def refresh_snapshot() -> SystemSnapshot:
+    """Re-probe the system, e.g. after elevation or an OS upgrade."""
+    global _snapshot
+    snapshot = SystemSnapshot.capture()
+    with _lock:
+        _snapshot = snapshot
+    return snapshot
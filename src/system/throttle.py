@@ -0,0 +1,194 @@
+"""
+Resource throttling for maintenance work.
+Process priority, I/O priority and rate limits applied to module execution.
+"""
+
+import os
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from typing import Callable, Iterator, Optional
+
+from src.system.platform_check import PlatformCheck
+from src.utils.logger import get_logger
+from src.utils.tracing import get_tracer
+
+
+# Windows priority classes passed as process creation flags
+PRIORITY_CLASSES = {
+    'normal': 0x00000020,
+    'below_normal': 0x00004000,
+    'idle': 0x00000040,
+}
+
+# Equivalent nice levels on other platforms
+NICE_LEVELS = {
+    'normal': 0,
+    'below_normal': 10,
+    'idle': 19,
+}
+
+PROCESS_IO_PRIORITY = 33          # PROCESSINFOCLASS.ProcessIoPriority
+IO_PRIORITY_VERY_LOW = 0
+THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+THREAD_MODE_BACKGROUND_END = 0x00020000
+
+
+@dataclass
+class ThrottlePolicy:
+    """
+    Resource limits for a module.
+    Rates of 0 mean unlimited.
+    """
+    priority: str = 'normal'
+    low_io: bool = False
+    max_files_per_second: float = 0.0
+    max_mb_per_second: float = 0.0
+    
+    def __post_init__(self) -> None:
+        if self.priority not in PRIORITY_CLASSES:
+            get_logger().warning(f'Unknown throttle priority {self.priority!r}, using normal')
+            self.priority = 'normal'
+    
+    @classmethod
+    def from_config(cls, config, module_id: str) -> 'ThrottlePolicy':
+        """
+        Build the policy for a module from Config.throttle.
+        Module settings override the 'default' entry; unknown keys are ignored.
+        """
+        names = {f.name for f in fields(cls)}
+        settings = {}
+        for key in ('default', module_id):
+            entry = config.throttle.get(key) or {}
+            settings.update({k: v for k, v in entry.items() if k in names})
+        return cls(**settings)
+    
+    @property
+    def is_throttled(self) -> bool:
+        return (
+            self.priority != 'normal' or self.low_io
+            or self.max_files_per_second > 0 or self.max_mb_per_second > 0
+        )
+    
+    def describe(self) -> str:
+        """Short human-readable summary."""
+        if not self.is_throttled:
+            return 'unthrottled'
+        parts = [f'{self.priority} priority']
+        if self.low_io:
+            parts.append('low I/O')
+        if self.max_files_per_second > 0:
+            parts.append(f'{self.max_files_per_second:g} files/s')
+        if self.max_mb_per_second > 0:
+            parts.append(f'{self.max_mb_per_second:g} MB/s')
+        return ', '.join(parts)
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+    
+    A request larger than the available tokens is admitted immediately and
+    the bucket goes into debt, so the caller sleeps for the time needed to
+    pay it back. Large single files are therefore never refused, only
+    followed by a proportionally longer pause.
+    """
+    
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> None:
+        """
+        Args:
+            rate: Tokens added per second; 0 disables limiting
+            capacity: Burst size (defaults to one second of tokens)
+            clock: Monotonic clock returning seconds
+            sleep: Sleep function
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._last = clock()
+        self._lock = threading.Lock()
+    
+    def consume(self, amount: float = 1.0) -> float:
+        """
+        Take tokens, sleeping if the bucket is in debt.
+        
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+        
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            with get_tracer().span('throttle.wait', rate=self.rate):
+                self._sleep(wait)
+        return wait
+
+
+def creation_flags(policy: ThrottlePolicy) -> int:
+    """Process creation flags for a command started under the policy."""
+    if not PlatformCheck.is_windows():
+        return 0
+    return getattr(subprocess, 'CREATE_NO_WINDOW', 0) | PRIORITY_CLASSES[policy.priority]
+
+
+def apply_to_process(process: subprocess.Popen, policy: ThrottlePolicy) -> None:
+    """
+    Lower the I/O priority (Windows) or niceness (elsewhere) of a child.
+    
+    The child runs briefly at normal I/O priority before this is applied;
+    that window is negligible next to the commands being throttled.
+    """
+    try:
+        if PlatformCheck.is_windows():
+            if policy.low_io:
+                import ctypes
+                priority = ctypes.c_ulong(IO_PRIORITY_VERY_LOW)
+                ctypes.windll.ntdll.NtSetInformationProcess(
+                    int(process._handle), PROCESS_IO_PRIORITY,
+                    ctypes.byref(priority), ctypes.sizeof(priority)
+                )
+        elif NICE_LEVELS[policy.priority]:
+            os.setpriority(os.PRIO_PROCESS, process.pid, NICE_LEVELS[policy.priority])
+    except (AttributeError, OSError):
+        get_logger().debug(f'Could not lower priority of process {process.pid}')
+
+
+@contextmanager
+def background_mode(policy: ThrottlePolicy) -> Iterator[None]:
+    """
+    Run in-process work on the current thread at background priority.
+    
+    On Windows, background mode lowers CPU, I/O and memory priority of the
+    calling thread. Elsewhere this is a no-op, because a thread cannot raise
+    its niceness back without privileges.
+    """
+    if not (policy.low_io and PlatformCheck.is_windows()):
+        yield
+        return
+    
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    thread = kernel32.GetCurrentThread()
+    entered = bool(kernel32.SetThreadPriority(thread, THREAD_MODE_BACKGROUND_BEGIN))
+    try:
+        yield
+    finally:
+        if entered:
+            kernel32.SetThreadPriority(thread, THREAD_MODE_BACKGROUND_END)
@@ -2,34 +2,34 @@
 IWS-WinCare main application window.
 """
 
-from typing import Dict, Optional, Type
+from typing import Dict, List, Optional, Set, Tuple
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QScrollArea, QLabel, QProgressBar,
-    QTextEdit, QMessageBox, QMenuBar, QMenu, QStatusBar,
+    QTabWidget, QLabel, QProgressBar,
+    QMessageBox, QMenuBar, QMenu, QStatusBar,
     QSplitter, QFrame, QSizePolicy, QGraphicsDropShadowEffect
 )
-from PySide6.QtCore import Qt, QThread, Signal, Slot, QSize, QByteArray
+from PySide6.QtCore import Qt, QThread, QTimer, Signal, Slot, QSize, QByteArray
 from PySide6.QtGui import QAction, QFont, QIcon, QPixmap, QColor
 
 from src.ui.styles import Styles
 from src.ui.icon import get_icon_data
-from src.ui.widgets import ActionCard, StatusIndicator
+from src.ui.widgets import LogBrowser, ModuleBrowser, ModuleListModel, OutputConsole, StatusIndicator
+from src.ui.widgets.module_list import STATE_IDLE, STATE_QUEUED, STATE_RUNNING
+from src.core.capabilities import Capability, CapabilityProbe
 from src.core.executor import ModuleExecutor, ExecutionResult, ExecutionStatus
+from src.core.journal import RunState, get_journal
+from src.core.reboot import RebootManager
+from src.core.scheduler import MaintenanceScheduler, create_scheduler
 from src.modules.base import BaseModule
-from src.modules.bugfix import (
-    DNSFlushModule, WinsockResetModule, NetworkAdapterModule,
-    UpdateCacheModule, ExplorerCacheModule, TempCleanupModule,
-    EnvironmentRefreshModule
-)
-from src.modules.reset import (
-    NetworkResetModule, PowerPlanResetModule, DefaultAppsResetModule,
-    SearchIndexModule, StartMenuResetModule, UpdateResetModule
-)
-from src.system.admin import is_admin
-from src.system.platform_check import PlatformCheck
+from src.modules.registry import ModuleRegistry
+from src.system.idle import get_idle_signals
+from src.system.services import get_service_inventory
+from src.system.snapshot import get_snapshot, refresh_snapshot
 from src.utils.logger import get_logger
 from src.utils.config import Config
+from src.utils.transcript import SessionTranscript
+from src.utils.watchdog import StallWatchdog
 
 
 class ExecutionWorker(QThread):
@@ -52,6 +52,11 @@ class ExecutionWorker(QThread):
 class MainWindow(QMainWindow):
     """Main application window with tabbed interface."""
     
+    recovery_finished = Signal(str, ExecutionResult)
+    verification_finished = Signal(str, ExecutionResult)
+    capability_ready = Signal(Capability)
+    scheduled_run_requested = Signal(str)
+    
     def __init__(self) -> None:
         super().__init__()
         
@@ -60,37 +65,41 @@ class MainWindow(QMainWindow):
         self._executor = ModuleExecutor()
         self._current_worker: Optional[ExecutionWorker] = None
         self._is_dark_mode = self._config.theme == 'dark'
+        self._applied_stylesheet: Optional[str] = None
+        
+        self._modules = ModuleRegistry()
+        self._module_model = ModuleListModel(self._modules, self)
+        self._browsers: List[ModuleBrowser] = []
+        self._pending_tabs: Dict[QWidget, Tuple[str, QVBoxLayout, QLabel]] = {}
+        self._queue: List[str] = []
+        # Modules with a recovery or verification on the executor, and how
+        # many; they share the registry's instance, so they cannot run twice
+        self._recovering: Dict[str, int] = {}
+        # Modules with a run parked for a restart; their journal
+        # continuation, not verify(), checks them after the restart
+        self._continued: Set[str] = set()
+        self._reboot_manager = RebootManager()
+        self._scheduler: Optional[MaintenanceScheduler] = None
+        self._log_browser: Optional[LogBrowser] = None
+        self._watchdog: Optional[StallWatchdog] = None
         
-        self._modules: Dict[str, BaseModule] = {}
-        self._cards: Dict[str, ActionCard] = {}
-        
-        self._init_modules()
         self._setup_ui()
         self._apply_theme()
         self._check_system()
-    
-    def _init_modules(self) -> None:
-        """Initialize all available modules."""
-        module_classes: list[Type[BaseModule]] = [
-            DNSFlushModule,
-            WinsockResetModule,
-            NetworkAdapterModule,
-            UpdateCacheModule,
-            ExplorerCacheModule,
-            TempCleanupModule,
-            EnvironmentRefreshModule,
-            NetworkResetModule,
-            PowerPlanResetModule,
-            DefaultAppsResetModule,
-            SearchIndexModule,
-            StartMenuResetModule,
-            UpdateResetModule,
-        ]
-        
-        for cls in module_classes:
-            module = cls()
-            module_id = cls.__name__
-            self._modules[module_id] = module
+        
+        self.recovery_finished.connect(self._on_recovery_finished)
+        self.verification_finished.connect(self._on_verification_finished)
+        self._recover_interrupted_runs()
+        self._verify_after_reboot()
+        self._start_scheduler()
+        self._start_watchdog()
+        
+        # Probe once the event loop runs, so the window is shown first
+        self.capability_ready.connect(self._on_capability_ready)
+        QTimer.singleShot(0, self._probe_capabilities)
+        
+        # The visible tab is populated after the first frame as well
+        QTimer.singleShot(0, lambda: self._on_tab_changed(self._tabs.currentIndex()))
     
     def _setup_ui(self) -> None:
         """Initialize main window UI."""
@@ -125,8 +134,9 @@ class MainWindow(QMainWindow):
         
         # Tab widget
         self._tabs = QTabWidget()
-        self._tabs.addTab(self._create_bugfix_tab(), 'Bug Fixes')
-        self._tabs.addTab(self._create_reset_tab(), 'System Reset')
+        self._tabs.addTab(self._create_tab_shell('bugfix'), 'Bug Fixes')
+        self._tabs.addTab(self._create_tab_shell('reset'), 'System Reset')
+        self._tabs.currentChanged.connect(self._on_tab_changed)
         splitter.addWidget(self._tabs)
         
         # Output console
@@ -137,13 +147,19 @@ class MainWindow(QMainWindow):
         
         console_header = QHBoxLayout()
         console_label = QLabel('Output')
-        console_label.setStyleSheet('font-weight: 600;')
+        console_label.setObjectName('consoleLabel')
         console_header.addWidget(console_label)
         console_header.addStretch()
         console_layout.addLayout(console_header)
         
-        self._console = QTextEdit()
-        self._console.setReadOnly(True)
+        self._console = OutputConsole(
+            max_lines=self._config.console_max_lines,
+            transcript=SessionTranscript(
+                self._logger.log_file.parent,
+                keep_files=self._config.log_keep_files,
+                keep_bytes=int(self._config.log_keep_mb * 1024 * 1024)
+            )
+        )
         self._console.setMinimumHeight(120)
         self._console.setMaximumHeight(200)
         console_layout.addWidget(self._console)
@@ -192,6 +208,15 @@ class MainWindow(QMainWindow):
         clear_console.triggered.connect(self._console.clear)
         view_menu.addAction(clear_console)
         
+        log_browser = QAction('Log Browser...', self)
+        log_browser.setShortcut('Ctrl+Shift+L')
+        log_browser.triggered.connect(self._show_log_browser)
+        view_menu.addAction(log_browser)
+        
+        refresh_system = QAction('Refresh System Info', self)
+        refresh_system.triggered.connect(self._refresh_system_info)
+        view_menu.addAction(refresh_system)
+        
         # Help menu
         help_menu = menubar.addMenu('Help')
         
@@ -207,24 +232,13 @@ class MainWindow(QMainWindow):
         self._status_indicator = StatusIndicator()
         status_bar.addPermanentWidget(self._status_indicator)
         
-        self._status_indicator.set_admin_status(is_admin())
+        self._status_indicator.set_admin_status(get_snapshot().is_admin)
         self._status_indicator.set_status('Ready')
     
     def _create_header(self) -> QWidget:
         """Create application header with logo and title."""
         header = QFrame()
         header.setObjectName('appHeader')
-        header.setStyleSheet('''
-            QFrame#appHeader {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(59, 130, 246, 0.15),
-                    stop:0.5 rgba(139, 92, 246, 0.1),
-                    stop:1 rgba(59, 130, 246, 0.15)
-                );
-                border-bottom: 1px solid rgba(59, 130, 246, 0.3);
-            }
-        ''')
         
         layout = QHBoxLayout(header)
         layout.setContentsMargins(20, 16, 20, 16)
@@ -242,17 +256,12 @@ class MainWindow(QMainWindow):
         title_section.setSpacing(2)
         
         title = QLabel('IWS-WinCare')
+        title.setObjectName('appTitle')
         title.setProperty('heading', True)
-        title.setStyleSheet('''
-            font-size: 24px;
-            font-weight: bold;
-            color: #3b82f6;
-        ''')
         title_section.addWidget(title)
         
         subtitle = QLabel('Professional Windows 10/11 repair and maintenance toolkit')
         subtitle.setProperty('subheading', True)
-        subtitle.setStyleSheet('font-size: 13px; opacity: 0.8;')
         title_section.addWidget(subtitle)
         
         layout.addLayout(title_section)
@@ -260,112 +269,62 @@ class MainWindow(QMainWindow):
         
         # Version badge
         version_badge = QLabel('v1.0.0')
-        version_badge.setStyleSheet('''
-            background: qlineargradient(
-                x1:0, y1:0, x2:1, y2:1,
-                stop:0 #3b82f6, stop:1 #8b5cf6
-            );
-            color: white;
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-size: 11px;
-            font-weight: 600;
-        ''')
+        version_badge.setProperty('badge', 'version')
         layout.addWidget(version_badge)
         
         return header
     
-    def _create_bugfix_tab(self) -> QWidget:
-        """Create bug-fix modules tab."""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(12)
-        
-        bugfix_modules = [
-            'DNSFlushModule', 'WinsockResetModule', 'NetworkAdapterModule',
-            'UpdateCacheModule', 'ExplorerCacheModule', 'TempCleanupModule',
-            'EnvironmentRefreshModule'
-        ]
-        
-        for module_id in bugfix_modules:
-            if module_id in self._modules:
-                card = self._create_module_card(module_id)
-                layout.addWidget(card)
-        
-        layout.addStretch()
-        scroll.setWidget(container)
-        
-        return scroll
+    def _create_tab_shell(self, tab: str) -> QWidget:
+        """Create an empty module tab; its module list is built on first activation."""
+        shell = QWidget()
+        layout = QVBoxLayout(shell)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        placeholder = QLabel('Loading modules...')
+        placeholder.setProperty('subheading', True)
+        placeholder.setAlignment(Qt.AlignCenter)
+        layout.addWidget(placeholder)
+        
+        self._pending_tabs[shell] = (tab, layout, placeholder)
+        return shell
     
-    def _create_reset_tab(self) -> QWidget:
-        """Create reset modules tab."""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(12)
-        
-        # Warning notice
+    def _create_reset_warning(self) -> QLabel:
+        """Create the notice shown above the reset modules."""
         warning = QLabel(
             'Warning: Reset operations may cause temporary disruption. '
             'Create a system restore point before proceeding.'
         )
         warning.setWordWrap(True)
-        warning.setStyleSheet(
-            'background-color: rgba(240, 173, 78, 0.2); '
-            'border: 1px solid #f0ad4e; '
-            'border-radius: 4px; '
-            'padding: 12px; '
-            'color: #f0ad4e;'
-        )
-        layout.addWidget(warning)
-        
-        reset_modules = [
-            'NetworkResetModule', 'PowerPlanResetModule', 'DefaultAppsResetModule',
-            'SearchIndexModule', 'StartMenuResetModule', 'UpdateResetModule'
-        ]
-        
-        for module_id in reset_modules:
-            if module_id in self._modules:
-                card = self._create_module_card(module_id)
-                layout.addWidget(card)
-        
-        layout.addStretch()
-        scroll.setWidget(container)
-        
-        return scroll
+        warning.setProperty('notice', 'warning')
+        return warning
     
-    def _create_module_card(self, module_id: str) -> ActionCard:
-        """Create action card for a module."""
-        module = self._modules[module_id]
-        info = module.info
-        
-        card = ActionCard(
-            module_id=module_id,
-            name=info.name,
-            description=info.description,
-            category=info.category,
-            is_critical=info.is_critical,
-            requires_reboot=info.requires_reboot
-        )
+    @Slot(int)
+    def _on_tab_changed(self, index: int) -> None:
+        """Populate a tab the first time it is shown."""
+        pending = self._pending_tabs.pop(self._tabs.widget(index), None)
+        if pending is None:
+            return
         
-        card.execute_requested.connect(self._on_execute_requested)
-        self._cards[module_id] = card
+        tab, layout, placeholder = pending
+        layout.removeWidget(placeholder)
+        placeholder.deleteLater()
         
-        return card
+        header = self._create_reset_warning() if tab == 'reset' else None
+        browser = ModuleBrowser(self._module_model, tab, header)
+        browser.set_dark_mode(self._is_dark_mode)
+        browser.execute_requested.connect(self._on_execute_requested)
+        layout.addWidget(browser)
+        self._browsers.append(browser)
     
     def _apply_theme(self) -> None:
-        """Apply current theme stylesheet."""
+        """Apply current theme stylesheet to the window; children inherit it."""
         stylesheet = Styles.get_theme(self._is_dark_mode)
-        self.setStyleSheet(stylesheet)
+        if stylesheet is not self._applied_stylesheet:
+            self.setStyleSheet(stylesheet)
+            self._applied_stylesheet = stylesheet
+        
+        for browser in self._browsers:
+            browser.set_dark_mode(self._is_dark_mode)
     
     def _set_window_icon(self) -> None:
         """Set application window icon."""
@@ -385,7 +344,7 @@ class MainWindow(QMainWindow):
     
     def _check_system(self) -> None:
         """Check system compatibility on startup."""
-        info = PlatformCheck.check_system()
+        info = get_snapshot()
         
         if not info.is_compatible:
             QMessageBox.warning(
@@ -394,28 +353,243 @@ class MainWindow(QMainWindow):
                 info.compatibility_message
             )
         
-        if not is_admin():
+        if not get_snapshot().is_admin:
             self._log_output(
                 'Running without administrator privileges. '
                 'Some functions will not be available.'
             )
     
+    @Slot()
+    def _refresh_system_info(self) -> None:
+        """Re-probe the session snapshot and update the status bar."""
+        info = refresh_snapshot()
+        self._status_indicator.set_admin_status(info.is_admin)
+        self._log_output(
+            f'System: {info.os_name} {info.os_version} build {info.os_build} '
+            f'({info.edition}, {info.architecture})'
+        )
+        get_service_inventory(refresh=True)
+        self._probe_capabilities()
+    
+    def _probe_capabilities(self) -> None:
+        """Check module requirements in the background and annotate the module list."""
+        CapabilityProbe(self._modules.specs()).start(on_result=self.capability_ready.emit)
+    
+    @Slot(Capability)
+    def _on_capability_ready(self, capability: Capability) -> None:
+        """Enable or disable a module as its capability result arrives."""
+        self._module_model.set_capability(capability.module_id, capability.available, capability.tooltip)
+    
+    def _recover_interrupted_runs(self) -> None:
+        """Resume or roll back runs left behind by a crash or restart."""
+        runs = [r for r in get_journal().pending_runs() if r.module_id in self._modules]
+        self._continued = {r.module_id for r in runs if r.state == RunState.AWAITING_REBOOT}
+        if not runs:
+            return
+        
+        if not get_snapshot().is_admin:
+            self._log_output(
+                f'{len(runs)} interrupted operation(s) pending. '
+                'Restart as administrator to complete them.'
+            )
+            return
+        
+        compensate_only = False
+        interrupted = [r for r in runs if r.state == RunState.RUNNING]
+        if interrupted:
+            names = '\n'.join(f'- {self._modules.info(r.module_id).name}' for r in interrupted)
+            reply = QMessageBox.question(
+                self,
+                'Interrupted Operations',
+                'The following operations did not finish last time:\n\n'
+                f'{names}\n\n'
+                'Yes completes them, No rolls back their partial changes.',
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes
+            )
+            compensate_only = reply != QMessageBox.Yes
+        
+        recovered = self._executor.recover(
+            self._modules,
+            runs=runs,
+            on_complete=self.recovery_finished.emit,
+            compensate_only=compensate_only
+        )
+        
+        for module_id in recovered:
+            self._log_output(f'Recovering: {self._modules.info(module_id).name}')
+            self._mark_recovering(module_id)
+    
+    def _verify_after_reboot(self) -> None:
+        """Verify modules whose restart was pending in a previous session."""
+        due = self._reboot_manager.restore()
+        
+        for requirement in due:
+            module = self._modules.get(requirement.module_id)
+            if module is None:
+                continue
+            if requirement.module_id in self._continued:
+                self._logger.info(f'{requirement.module_id} is checked by its journal continuation')
+                continue
+            self._log_output(f'Verifying after restart: {requirement.module_name}')
+            self._mark_recovering(requirement.module_id)
+            self._executor.execute(
+                module.verify,
+                on_complete=lambda result, module_id=requirement.module_id:
+                    self.verification_finished.emit(module_id, result)
+            )
+        
+        if self._reboot_manager.has_pending:
+            self._status_indicator.set_status('Restart pending')
+    
+    def _mark_recovering(self, module_id: str) -> None:
+        """Show a module as running until its recovery_finished arrives."""
+        self._recovering[module_id] = self._recovering.get(module_id, 0) + 1
+        self._module_model.set_state(module_id, STATE_RUNNING)
+    
+    def _is_busy(self) -> bool:
+        """Check for a running, queued or recovering module."""
+        return bool(self._queue) or bool(self._recovering) or (
+            self._current_worker is not None and self._current_worker.isRunning()
+        )
+    
+    def _start_watchdog(self) -> None:
+        """Measure event loop latency and log stalls of the UI thread."""
+        if self._config.ui_stall_threshold_ms <= 0:
+            return
+        
+        self._watchdog = StallWatchdog(threshold_ms=self._config.ui_stall_threshold_ms)
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setTimerType(Qt.PreciseTimer)
+        self._heartbeat.setInterval(int(self._watchdog.interval_ms))
+        self._heartbeat.timeout.connect(self._watchdog.beat)
+        self._heartbeat.start()
+        self._watchdog.start()
+    
+    def _start_scheduler(self) -> None:
+        """Start idle-aware background maintenance if jobs are configured."""
+        if not self._config.scheduled_jobs:
+            return
+        
+        self.scheduled_run_requested.connect(self._on_scheduled_run)
+        self._scheduler = create_scheduler(
+            self._config,
+            dispatch=self._dispatch_scheduled,
+            signals=get_idle_signals(),
+            is_busy=self._is_busy
+        )
+        self._scheduler.start()
+        self._logger.info(f'Maintenance scheduler started with {len(self._scheduler.jobs)} job(s)')
+    
+    def _dispatch_scheduled(self, module_id: str) -> bool:
+        """
+        Accept a scheduled run and hand it to the UI thread.
+        
+        Called on the scheduler thread. Jobs are pre-approved by configuration,
+        but one that cannot run now is refused so the scheduler retries it
+        instead of recording it as done.
+        
+        Args:
+            module_id: Module the scheduler wants to run
+        
+        Returns:
+            True if the run was accepted
+        """
+        if module_id not in self._modules:
+            self._logger.warning(f'Scheduled module not found: {module_id}')
+            return False
+        
+        if self._modules.info(module_id).requires_admin and not get_snapshot().is_admin:
+            self._logger.warning(f'Skipping scheduled {module_id}: administrator required')
+            return False
+        
+        if module_id in self._recovering:
+            self._logger.info(f'Skipping scheduled {module_id}: recovery in progress')
+            return False
+        
+        self.scheduled_run_requested.emit(module_id)
+        return True
+    
+    @Slot(str)
+    def _on_scheduled_run(self, module_id: str) -> None:
+        """Run a scheduled module accepted by _dispatch_scheduled."""
+        # Recovery may have started between acceptance and delivery
+        if module_id in self._recovering:
+            self._logger.info(f'Skipping scheduled {module_id}: recovery in progress')
+            return
+        
+        self._log_output(f'Scheduled maintenance: {self._modules.info(module_id).name}')
+        
+        if self._current_worker and self._current_worker.isRunning():
+            if module_id not in self._queue:
+                self._queue.append(module_id)
+                self._module_model.set_state(module_id, STATE_QUEUED)
+            return
+        
+        self._execute_module(module_id)
+    
+    @Slot(str, ExecutionResult)
+    def _on_recovery_finished(self, module_id: str, result: ExecutionResult) -> None:
+        """Report a recovered run and collect the restart it needs, as for a user run."""
+        self._report_recovery(module_id, result, 'Recovery')
+        
+        # A continued run has had its restart; it only needs another if it parked again
+        info = self._modules.info(module_id)
+        requires_reboot = info.requires_reboot and module_id not in self._continued
+        self._continued.discard(module_id)
+        if not (requires_reboot or result.reboot_required):
+            return
+        
+        if not result.success:
+            self._reboot_manager.forget(module_id)
+            return
+        
+        self._reboot_manager.require(module_id, info.name)
+        if not self._is_busy():
+            self._offer_restart()
+    
+    @Slot(str, ExecutionResult)
+    def _on_verification_finished(self, module_id: str, result: ExecutionResult) -> None:
+        """Report the post-restart verification of a module."""
+        self._report_recovery(module_id, result, 'Verification')
+    
+    def _report_recovery(self, module_id: str, result: ExecutionResult, kind: str) -> None:
+        """Release a recovering module and log the outcome of its run."""
+        remaining = self._recovering.get(module_id, 0) - 1
+        if remaining > 0:
+            self._recovering[module_id] = remaining
+        else:
+            self._recovering.pop(module_id, None)
+            self._module_model.set_state(module_id, STATE_IDLE)
+        
+        prefix = '[SUCCESS]' if result.success else '[FAILED]'
+        self._log_output(f'{prefix} {result.message}')
+        
+        if result.details:
+            self._log_output(result.details)
+        
+        if result.timings is not None:
+            self._log_output(result.timings.summary())
+        
+        self._logger.info(
+            f'{kind} of {module_id} completed: '
+            f'{result.status.value} - {result.message}'
+        )
+    
     @Slot(str)
     def _on_execute_requested(self, module_id: str) -> None:
         """Handle module execution request."""
-        if self._current_worker and self._current_worker.isRunning():
-            QMessageBox.information(
-                self,
-                'Operation in Progress',
-                'Please wait for the current operation to complete.'
-            )
+        if module_id in self._queue:
             return
         
-        module = self._modules.get(module_id)
-        if not module:
+        if module_id not in self._modules:
             return
         
-        info = module.info
+        info = self._modules.info(module_id)
+        
+        if module_id in self._recovering:
+            self._log_output(f'{info.name} is still completing an earlier operation')
+            return
         
         # Confirmation for critical actions
         if info.is_critical:
@@ -434,7 +608,7 @@ class MainWindow(QMainWindow):
                 return
         
         # Check admin requirements
-        if info.requires_admin and not is_admin():
+        if info.requires_admin and not get_snapshot().is_admin:
             QMessageBox.critical(
                 self,
                 'Administrator Required',
@@ -443,17 +617,22 @@ class MainWindow(QMainWindow):
             )
             return
         
+        if info.requires_reboot:
+            self._reboot_manager.expect(module_id)
+        
+        if self._current_worker and self._current_worker.isRunning():
+            self._queue.append(module_id)
+            self._module_model.set_state(module_id, STATE_QUEUED)
+            self._log_output(f'Queued: {info.name}')
+            return
+        
         self._execute_module(module_id)
     
     def _execute_module(self, module_id: str) -> None:
         """Execute a module in background thread."""
         module = self._modules[module_id]
-        card = self._cards.get(module_id)
-        
-        if card:
-            card.set_executing(True)
+        self._module_model.set_state(module_id, STATE_RUNNING)
         
-        self._set_all_cards_enabled(False)
         self._progress.show()
         self._status_indicator.set_status(f'Executing {module.info.name}...')
         
@@ -469,12 +648,8 @@ class MainWindow(QMainWindow):
     @Slot(str, ExecutionResult)
     def _on_execution_finished(self, module_id: str, result: ExecutionResult) -> None:
         """Handle module execution completion."""
-        card = self._cards.get(module_id)
+        self._module_model.set_state(module_id, STATE_IDLE)
         
-        if card:
-            card.set_executing(False)
-        
-        self._set_all_cards_enabled(True)
         self._progress.hide()
         
         if result.success:
@@ -487,44 +662,79 @@ class MainWindow(QMainWindow):
         if result.details:
             self._log_output(result.details)
         
+        if result.timings is not None:
+            self._log_output(result.timings.summary())
+        
         self._logger.info(
             f'Execution of {module_id} completed: '
             f'{result.status.value} - {result.message}'
         )
         
-        # Offer restart if required
         module = self._modules.get(module_id)
-        if module and module.info.requires_reboot and result.success:
+        if module and (module.info.requires_reboot or result.reboot_required):
+            if result.success:
+                self._reboot_manager.require(module_id, module.info.name)
+            else:
+                self._reboot_manager.forget(module_id)
+        
+        if self._queue:
+            next_id = self._queue.pop(0)
+            self._execute_module(next_id)
+            return
+        
+        # One restart prompt for the whole batch
+        if self._reboot_manager.has_pending:
             self._offer_restart()
     
-    def _set_all_cards_enabled(self, enabled: bool) -> None:
-        """Enable or disable all action cards."""
-        for card in self._cards.values():
-            card.set_enabled(enabled)
-    
     def _log_output(self, message: str) -> None:
-        """Append message to output console."""
-        self._console.append(message)
-        scrollbar = self._console.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        """Queue message for the output console."""
+        self._console.append_line(message)
     
     def _offer_restart(self) -> None:
-        """Offer to restart the computer."""
-        reply = QMessageBox.question(
-            self,
-            'Restart Required',
-            'A system restart is required to complete this operation.\n'
-            'Would you like to restart now?',
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
+        """Offer a single restart covering every module in the batch."""
+        names = '\n'.join(f'- {r.module_name}' for r in self._reboot_manager.requirements)
+        window = self._config.restart_window
+        
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Question)
+        box.setWindowTitle('Restart Required')
+        box.setText(
+            'A system restart is required to complete these operations:\n\n'
+            f'{names}\n\n'
+            'Would you like to restart now?'
         )
+        now_button = box.addButton('Restart Now', QMessageBox.AcceptRole)
+        window_button = None
+        if window:
+            window_button = box.addButton(f'Restart at {window}', QMessageBox.ActionRole)
+        later_button = box.addButton('Later', QMessageBox.RejectRole)
+        box.setDefaultButton(later_button)
+        box.exec()
+        
+        clicked = box.clickedButton()
+        if clicked == now_button:
+            result = self._reboot_manager.schedule_restart(delay_seconds=30)
+            message = 'System will restart in 30 seconds...'
+        elif window_button is not None and clicked == window_button:
+            result = self._reboot_manager.schedule_restart(window=window)
+            message = f'System restart scheduled for {window}'
+        else:
+            self._status_indicator.set_status('Restart pending')
+            return
         
-        if reply == QMessageBox.Yes:
-            from ..system.commands import CommandRunner
-            runner = CommandRunner()
-            runner.run(['shutdown', '/r', '/t', '30', '/c', 
-                       'IWS-WinCare: Restarting to complete repairs'])
-            self._log_output('System will restart in 30 seconds...')
+        if result.success:
+            self._log_output(message)
+        else:
+            self._log_output(f'[FAILED] Could not schedule restart: {result.stderr}')
+    
+    def _show_log_browser(self) -> None:
+        """Open the log browser, keeping its state between openings."""
+        if self._log_browser is None:
+            log_file = self._logger.log_file
+            self._log_browser = LogBrowser(log_file.parent, log_file, self)
+        self._log_browser.show()
+        self._log_browser.raise_()
+        self._log_browser.activateWindow()
     
     def _show_about(self) -> None:
         """Show about dialog."""
@@ -548,10 +758,21 @@ class MainWindow(QMainWindow):
         self._config.window_height = self.height()
         self._config.save()
         
+        if self._scheduler:
+            self._scheduler.stop()
+        
+        if self._watchdog is not None:
+            self._heartbeat.stop()
+            self._watchdog.stop()
+        
         # Cancel running operations
         if self._current_worker and self._current_worker.isRunning():
             self._current_worker.terminate()
             self._current_worker.wait(1000)
         
+        if self._log_browser is not None:
+            self._log_browser.close()
+        
         self._executor.shutdown()
+        self._console.close_transcript()
         event.accept()
@@ -2,10 +2,47 @@
 Application styles and themes.
 """
 
+from typing import Dict
+
 
 class Styles:
     """Application stylesheet provider."""
     
+    CATEGORY_COLORS = {
+        'Network': '#3b82f6',
+        'System': '#8b5cf6',
+        'Cleanup': '#22c55e',
+    }
+    
+    # Colours the module list delegate paints with, keyed by dark mode
+    CARD_PALETTES = {
+        True: {
+            'card': '#1c1c1e',
+            'card_hover': '#1f1f23',
+            'border': '#27272a',
+            'accent': '#3b82f6',
+            'title': '#fafafa',
+            'text': '#71717a',
+            'disabled': '#27272a',
+            'disabled_text': '#52525b',
+        },
+        False: {
+            'card': '#ffffff',
+            'card_hover': '#fafafa',
+            'border': '#e4e4e7',
+            'accent': '#3b82f6',
+            'title': '#18181b',
+            'text': '#71717a',
+            'disabled': '#e4e4e7',
+            'disabled_text': '#a1a1aa',
+        },
+    }
+    
+    BADGE_COLORS = {
+        'reboot': '#f59e0b',
+        'critical': '#ef4444',
+    }
+    
     DARK_THEME = """
         * {
             font-family: 'Segoe UI', 'SF Pro Display', sans-serif;
@@ -134,6 +171,22 @@ class Styles:
                 stop:0 #1f1f23, stop:1 #1a1a1e);
         }
         
+        QLineEdit, QComboBox {
+            background: #18181b;
+            border: 1px solid #3f3f46;
+            border-radius: 8px;
+            padding: 8px 12px;
+        }
+        
+        QLineEdit:focus, QComboBox:focus {
+            border-color: #3b82f6;
+        }
+        
+        QListView {
+            border: none;
+            background: transparent;
+        }
+        
         QTabWidget::pane {
             border: none;
             background-color: transparent;
@@ -179,7 +232,7 @@ class Styles:
             border-radius: 4px;
         }
         
-        QTextEdit {
+        QTextEdit, QPlainTextEdit {
             background-color: #0a0a0a;
             border: 1px solid #27272a;
             border-radius: 8px;
@@ -401,6 +454,22 @@ class Styles:
             background: #fafafa;
         }
         
+        QLineEdit, QComboBox {
+            background: #ffffff;
+            border: 1px solid #e4e4e7;
+            border-radius: 8px;
+            padding: 8px 12px;
+        }
+        
+        QLineEdit:focus, QComboBox:focus {
+            border-color: #3b82f6;
+        }
+        
+        QListView {
+            border: none;
+            background: transparent;
+        }
+        
         QTabWidget::pane {
             border: none;
             background-color: transparent;
@@ -446,7 +515,7 @@ class Styles:
             border-radius: 4px;
         }
         
-        QTextEdit {
+        QTextEdit, QPlainTextEdit {
             background-color: #ffffff;
             border: 1px solid #e4e4e7;
             border-radius: 8px;
@@ -542,7 +611,58 @@ class Styles:
         }
     """
     
+    # Header, badge and notice rules shared by both themes. Widgets select them
+    # through dynamic properties rather than carrying their own stylesheets,
+    # so Qt parses one sheet for the whole window.
+    COMPONENTS = """
+        QFrame#appHeader {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:0,
+                stop:0 rgba(59, 130, 246, 0.15),
+                stop:0.5 rgba(139, 92, 246, 0.1),
+                stop:1 rgba(59, 130, 246, 0.15)
+            );
+            border-bottom: 1px solid rgba(59, 130, 246, 0.3);
+        }
+        
+        QLabel#appTitle {
+            font-size: 24px;
+            font-weight: bold;
+            color: #3b82f6;
+        }
+        
+        QLabel#consoleLabel {
+            font-weight: 600;
+        }
+        
+        QLabel[badge="version"] {
+            background: qlineargradient(
+                x1:0, y1:0, x2:1, y2:1,
+                stop:0 #3b82f6, stop:1 #8b5cf6
+            );
+            color: white;
+            padding: 4px 12px;
+            border-radius: 12px;
+            font-size: 11px;
+            font-weight: 600;
+        }
+        
+        QLabel[notice="warning"] {
+            background-color: rgba(240, 173, 78, 0.2);
+            border: 1px solid #f0ad4e;
+            border-radius: 4px;
+            padding: 12px;
+            color: #f0ad4e;
+        }
+    """
+    
+    # Built once, so get_theme hands back the same object for each theme
+    _SHEETS: Dict[bool, str] = {
+        True: DARK_THEME + COMPONENTS,
+        False: LIGHT_THEME + COMPONENTS,
+    }
+    
     @classmethod
     def get_theme(cls, dark_mode: bool = True) -> str:
         """Return stylesheet for specified theme."""
-        return cls.DARK_THEME if dark_mode else cls.LIGHT_THEME
+        return cls._SHEETS[bool(dark_mode)]
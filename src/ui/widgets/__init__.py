@@ -1,6 +1,8 @@
 """UI widgets package."""
 
-from src.ui.widgets.action_card import ActionCard
+from src.ui.widgets.log_browser import LogBrowser
+from src.ui.widgets.module_list import ModuleBrowser, ModuleListModel
+from src.ui.widgets.output_console import OutputConsole
 from src.ui.widgets.status_bar import StatusIndicator
 
-__all__ = ['ActionCard', 'StatusIndicator']
+__all__ = ['LogBrowser', 'ModuleBrowser', 'ModuleListModel', 'OutputConsole', 'StatusIndicator']
@@ -0,0 +1,216 @@
+"""
+Log browser dialog.
+Searches past session logs and follows the current one without blocking the UI.
+"""
+
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox, QPushButton, QLabel
+)
+from PySide6.QtCore import QThread, QTimer, Signal
+
+from src.ui.widgets.output_console import OutputConsole
+from src.utils.log_search import LEVELS, log_files, parse_time, read_from, search_files, tail
+
+
+class LogSearchWorker(QThread):
+    """
+    Runs a search on a background thread and hands results to the UI in
+    batches, so the first matches appear while the rest of the files are
+    still being read.
+    """
+    
+    results = Signal(list)
+    completed = Signal(int, bool)
+    
+    BATCH_LINES = 500
+    BATCH_SECONDS = 0.1
+    
+    def __init__(self, files: List[Path], filters: dict, limit: int, parent=None) -> None:
+        super().__init__(parent)
+        self._files = files
+        self._filters = filters
+        self._limit = limit
+    
+    def run(self) -> None:
+        batch: List[str] = []
+        found = 0
+        sent = time.monotonic()
+        show_names = len(self._files) > 1
+        
+        matches = search_files(
+            self._files, should_stop=self.isInterruptionRequested, **self._filters
+        )
+        for match in matches:
+            batch.append(f'{match.path.name}: {match.text}' if show_names else match.text)
+            found += 1
+            
+            if len(batch) >= self.BATCH_LINES or time.monotonic() - sent >= self.BATCH_SECONDS:
+                self.results.emit(batch)
+                batch = []
+                sent = time.monotonic()
+            if found >= self._limit:
+                break
+        
+        if batch:
+            self.results.emit(batch)
+        self.completed.emit(found, found >= self._limit)
+
+
+class LogBrowser(QDialog):
+    """Search across session logs, or follow the current log file."""
+    
+    ALL_LEVELS = 'All levels'
+    MAX_RESULTS = 20000
+    FOLLOW_INTERVAL_MS = 1000
+    
+    def __init__(self, log_dir: Path, current_log: Optional[Path] = None, parent=None) -> None:
+        """
+        Args:
+            log_dir: Folder containing toolkit_*.log files
+            current_log: This session's log file, shown when following
+        """
+        super().__init__(parent)
+        
+        self._log_dir = log_dir
+        self._current_log = current_log
+        self._worker: Optional[LogSearchWorker] = None
+        self._follow_offset = 0
+        
+        self._follow_timer = QTimer(self)
+        self._follow_timer.setInterval(self.FOLLOW_INTERVAL_MS)
+        self._follow_timer.timeout.connect(self._read_new_lines)
+        
+        self.setWindowTitle('Log Browser')
+        self.resize(900, 600)
+        self._setup_ui()
+    
+    def _setup_ui(self) -> None:
+        layout = QVBoxLayout(self)
+        layout.setSpacing(8)
+        
+        filters = QHBoxLayout()
+        filters.setSpacing(8)
+        
+        self._query = QLineEdit()
+        self._query.setPlaceholderText('Search text')
+        self._query.setClearButtonEnabled(True)
+        self._query.returnPressed.connect(self.start_search)
+        filters.addWidget(self._query, 1)
+        
+        self._level = QComboBox()
+        self._level.addItem(self.ALL_LEVELS)
+        self._level.addItems([f'{level} and above' for level in LEVELS[1:]])
+        filters.addWidget(self._level)
+        
+        self._run_id = QLineEdit()
+        self._run_id.setPlaceholderText('Run id')
+        self._run_id.setMaximumWidth(130)
+        filters.addWidget(self._run_id)
+        
+        self._since = QLineEdit()
+        self._since.setPlaceholderText('From (YYYY-MM-DD HH:MM)')
+        filters.addWidget(self._since)
+        
+        self._until = QLineEdit()
+        self._until.setPlaceholderText('To')
+        filters.addWidget(self._until)
+        
+        self._search_button = QPushButton('Search')
+        self._search_button.clicked.connect(self.start_search)
+        filters.addWidget(self._search_button)
+        
+        self._follow_button = QPushButton('Follow Current Log')
+        self._follow_button.setCheckable(True)
+        self._follow_button.setEnabled(self._current_log is not None)
+        self._follow_button.toggled.connect(self._set_following)
+        filters.addWidget(self._follow_button)
+        
+        layout.addLayout(filters)
+        
+        self._output = OutputConsole(max_lines=self.MAX_RESULTS)
+        layout.addWidget(self._output, 1)
+        
+        self._status = QLabel()
+        layout.addWidget(self._status)
+    
+    def start_search(self) -> None:
+        """Search all session logs with the current filters."""
+        self._follow_button.setChecked(False)
+        self._stop_worker()
+        
+        try:
+            filters = {
+                'query': self._query.text(),
+                'min_level': self._min_level(),
+                'run_id': self._run_id.text().strip() or None,
+                'since': parse_time(self._since.text()) if self._since.text().strip() else None,
+                'until': parse_time(self._until.text()) if self._until.text().strip() else None,
+            }
+        except ValueError:
+            self._status.setText('Times must look like 2026-10-19 14:00')
+            return
+        
+        self._output.clear()
+        self._status.setText('Searching...')
+        
+        self._worker = LogSearchWorker(log_files(self._log_dir), filters, self.MAX_RESULTS, self)
+        self._worker.results.connect(self._on_search_results)
+        self._worker.completed.connect(self._on_search_completed)
+        self._worker.start()
+    
+    def _min_level(self) -> Optional[str]:
+        index = self._level.currentIndex()
+        return LEVELS[index] if index > 0 else None
+    
+    def _show_results(self, lines: List[str]) -> None:
+        for line in lines:
+            self._output.append_line(line)
+    
+    def _on_search_results(self, lines: List[str]) -> None:
+        # Batches still queued from a cancelled search are dropped
+        if self.sender() is self._worker:
+            self._show_results(lines)
+    
+    def _on_search_completed(self, found: int, truncated: bool) -> None:
+        if self.sender() is not self._worker:
+            return
+        if truncated:
+            self._status.setText(f'Showing the first {found} matches')
+        else:
+            self._status.setText(f'{found} matches')
+    
+    def _set_following(self, following: bool) -> None:
+        if not following:
+            self._follow_timer.stop()
+            return
+        
+        self._stop_worker()
+        self._output.clear()
+        if self._current_log is None or not self._current_log.exists():
+            self._follow_offset = 0
+        else:
+            lines, self._follow_offset = tail(self._current_log, 200)
+            self._show_results(lines)
+        self._status.setText(f'Following {self._current_log.name}')
+        self._follow_timer.start()
+    
+    def _read_new_lines(self) -> None:
+        if self._current_log is None or not self._current_log.exists():
+            return
+        lines, self._follow_offset = read_from(self._current_log, self._follow_offset)
+        self._show_results(lines)
+    
+    def _stop_worker(self) -> None:
+        if self._worker is not None:
+            self._worker.requestInterruption()
+            self._worker.wait()
+            self._worker = None
+    
+    def closeEvent(self, event) -> None:
+        self._follow_timer.stop()
+        self._stop_worker()
+        super().closeEvent(event)
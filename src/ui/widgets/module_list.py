@@ -0,0 +1,390 @@
+"""
+Virtualized module list.
+Model, filter proxy and card-painting delegate for the module tabs.
+"""
+
+from typing import Dict, List, Optional, Set
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QListView, QLineEdit, QComboBox,
+    QStyledItemDelegate, QStyleOptionViewItem, QStyle, QAbstractItemView, QFrame
+)
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractListModel, QSortFilterProxyModel, QModelIndex,
+    QRect, QSize, QEvent
+)
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+
+from src.modules.registry import ModuleRegistry
+from src.modules.search import ModuleIndex
+from src.ui.styles import Styles
+
+
+STATE_IDLE = 'idle'
+STATE_QUEUED = 'queued'
+STATE_RUNNING = 'running'
+
+
+class ModuleListModel(QAbstractListModel):
+    """
+    Module metadata and run state for every registered module.
+    Built from the registry's specs, so no module code is imported.
+    """
+    
+    ModuleIdRole = Qt.UserRole + 1
+    InfoRole = Qt.UserRole + 2
+    StateRole = Qt.UserRole + 3
+    AvailableRole = Qt.UserRole + 4
+    
+    def __init__(self, registry: ModuleRegistry, parent=None) -> None:
+        super().__init__(parent)
+        
+        self._ids = registry.ids()
+        self._rows = {module_id: row for row, module_id in enumerate(self._ids)}
+        self._infos = [registry.info(module_id) for module_id in self._ids]
+        self._tabs = [registry.spec(module_id).tab for module_id in self._ids]
+        self._states = [STATE_IDLE] * len(self._ids)
+        self._unavailable: Dict[str, str] = {}
+        self._index = ModuleIndex(zip(self._ids, self._infos))
+    
+    @property
+    def search_index(self) -> ModuleIndex:
+        return self._index
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        module_id = self._ids[row]
+        
+        if role == Qt.DisplayRole:
+            return self._infos[row].name
+        if role == Qt.ToolTipRole:
+            return self._unavailable.get(module_id) or self._infos[row].description
+        if role == self.ModuleIdRole:
+            return module_id
+        if role == self.InfoRole:
+            return self._infos[row]
+        if role == self.StateRole:
+            return self._states[row]
+        if role == self.AvailableRole:
+            return module_id not in self._unavailable
+        return None
+    
+    def module_id_at(self, row: int) -> str:
+        return self._ids[row]
+    
+    def tab_at(self, row: int) -> str:
+        return self._tabs[row]
+    
+    def categories(self, tab: str) -> List[str]:
+        """Categories used on a tab, in order of first appearance."""
+        seen: Dict[str, None] = {}
+        for info, module_tab in zip(self._infos, self._tabs):
+            if module_tab == tab:
+                seen.setdefault(info.category)
+        return list(seen)
+    
+    def set_state(self, module_id: str, state: str) -> None:
+        """Set a module's run state (idle, queued or running)."""
+        row = self._rows.get(module_id)
+        if row is None or self._states[row] == state:
+            return
+        self._states[row] = state
+        self._changed(row, [self.StateRole])
+    
+    def set_capability(self, module_id: str, available: bool, tooltip: str = '') -> None:
+        """Mark whether a module can run on this machine."""
+        row = self._rows.get(module_id)
+        if row is None:
+            return
+        if available:
+            self._unavailable.pop(module_id, None)
+        else:
+            self._unavailable[module_id] = tooltip
+        self._changed(row, [self.AvailableRole, Qt.ToolTipRole])
+    
+    def _changed(self, row: int, roles: List[int]) -> None:
+        index = self.index(row)
+        self.dataChanged.emit(index, index, roles)
+
+
+class ModuleFilterProxy(QSortFilterProxyModel):
+    """Shows one tab's modules, narrowed by search text and category."""
+    
+    def __init__(self, tab: str, parent=None) -> None:
+        super().__init__(parent)
+        self._tab = tab
+        self._allowed: Optional[Set[str]] = None
+    
+    def set_filter(self, query: str = '', category: Optional[str] = None) -> None:
+        """Filter by search text and category; empty values show everything."""
+        if query.strip() or category:
+            self._allowed = self.sourceModel().search_index.search(query, category)
+        else:
+            self._allowed = None
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+        model = self.sourceModel()
+        if model.tab_at(source_row) != self._tab:
+            return False
+        return self._allowed is None or model.module_id_at(source_row) in self._allowed
+
+
+class ModuleCardDelegate(QStyledItemDelegate):
+    """
+    Paints each module as a card with category bar, badges and a run button.
+    No widget exists per row; only rows in view are painted.
+    """
+    
+    execute_requested = Signal(str)
+    
+    ROW_HEIGHT = 122
+    MARGIN = 6
+    BUTTON_SIZE = QSize(90, 38)
+    
+    BUTTON_TEXT = {
+        STATE_IDLE: 'Run',
+        STATE_QUEUED: 'Queued',
+        STATE_RUNNING: 'Running...',
+    }
+    
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._palette = Styles.CARD_PALETTES[True]
+        self._fonts: Dict[tuple, QFont] = {}
+    
+    def set_dark_mode(self, dark_mode: bool) -> None:
+        self._palette = Styles.CARD_PALETTES[dark_mode]
+    
+    def sizeHint(self, option: QStyleOptionViewItem, index) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+    
+    def _card_rect(self, rect: QRect) -> QRect:
+        return rect.adjusted(16, self.MARGIN, -16, -self.MARGIN)
+    
+    def _button_rect(self, rect: QRect) -> QRect:
+        card = self._card_rect(rect)
+        size = self.BUTTON_SIZE
+        return QRect(
+            card.right() - 20 - size.width(),
+            card.center().y() - size.height() // 2,
+            size.width(),
+            size.height()
+        )
+    
+    @staticmethod
+    def _is_enabled(index) -> bool:
+        return (
+            index.data(ModuleListModel.AvailableRole)
+            and index.data(ModuleListModel.StateRole) == STATE_IDLE
+        )
+    
+    def _font(self, base: QFont, pixel_size: int, weight: QFont.Weight = QFont.Normal) -> QFont:
+        key = (base.family(), pixel_size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = QFont(base)
+            font.setPixelSize(pixel_size)
+            font.setWeight(weight)
+        return font
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index) -> None:
+        info = index.data(ModuleListModel.InfoRole)
+        state = index.data(ModuleListModel.StateRole)
+        available = index.data(ModuleListModel.AvailableRole)
+        palette = self._palette
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        # Keyboard focus highlights the card like hovering does
+        focused = bool(option.state & QStyle.State_HasFocus)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Card background
+        card = self._card_rect(option.rect)
+        painter.setPen(QPen(
+            QColor(palette['accent'] if hovered or focused else palette['border']),
+            2 if focused else 1
+        ))
+        painter.setBrush(QColor(palette['card_hover'] if hovered else palette['card']))
+        painter.drawRoundedRect(card, 12, 12)
+        
+        # Category indicator bar
+        category_color = QColor(Styles.CATEGORY_COLORS.get(info.category, '#3b82f6'))
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(category_color)
+        painter.drawRoundedRect(QRect(card.left() + 20, card.top() + 16, 4, card.height() - 32), 2, 2)
+        
+        button = self._button_rect(option.rect)
+        left = card.left() + 40
+        top = card.top() + 16
+        
+        # Title
+        title_font = self._font(option.font, 15, QFont.DemiBold)
+        title_metrics = QFontMetrics(title_font)
+        painter.setFont(title_font)
+        painter.setPen(QColor(palette['title']))
+        title_width = title_metrics.horizontalAdvance(info.name)
+        painter.drawText(QRect(left, top, title_width, 22), Qt.AlignLeft | Qt.AlignVCenter, info.name)
+        
+        # Badges
+        badges = [(info.category, category_color)]
+        if info.requires_reboot:
+            badges.append(('Restart', QColor(Styles.BADGE_COLORS['reboot'])))
+        if info.is_critical:
+            badges.append(('Critical', QColor(Styles.BADGE_COLORS['critical'])))
+        
+        badge_font = self._font(option.font, 11, QFont.DemiBold)
+        badge_metrics = QFontMetrics(badge_font)
+        painter.setFont(badge_font)
+        x = left + title_width + 12
+        for text, color in badges:
+            width = badge_metrics.horizontalAdvance(text) + 24
+            badge = QRect(x, top + 1, width, 20)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+            painter.drawRoundedRect(badge, 10, 10)
+            painter.setPen(QColor('#ffffff'))
+            painter.drawText(badge, Qt.AlignCenter, text)
+            x += width + 12
+        
+        # Description, clipped to the space left of the button
+        painter.setFont(self._font(option.font, 13))
+        painter.setPen(QColor(palette['text']))
+        description = QRect(left, top + 30, button.left() - 16 - left, card.bottom() - 16 - (top + 30))
+        painter.drawText(description, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, info.description)
+        
+        # Run button
+        if not available:
+            text = 'Unavailable'
+        else:
+            text = self.BUTTON_TEXT.get(state, 'Run')
+        if self._is_enabled(index):
+            painter.setBrush(QColor(Styles.BADGE_COLORS['critical'] if info.is_critical else palette['accent']))
+            text_color = QColor('#ffffff')
+        else:
+            painter.setBrush(QColor(palette['disabled']))
+            text_color = QColor(palette['disabled_text'])
+        painter.setPen(Qt.NoPen)
+        painter.drawRoundedRect(button, 8, 8)
+        painter.setFont(self._font(option.font, 13, QFont.DemiBold))
+        painter.setPen(text_color)
+        painter.drawText(button, Qt.AlignCenter, text)
+        
+        painter.restore()
+    
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index) -> bool:
+        """Emit execute_requested when the run button is clicked."""
+        if (
+            event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+            and self._button_rect(option.rect).contains(event.position().toPoint())
+        ):
+            self.activate(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+    
+    def activate(self, index) -> None:
+        """Emit execute_requested for index if its run button is enabled."""
+        if index.isValid() and self._is_enabled(index):
+            self.execute_requested.emit(index.data(ModuleListModel.ModuleIdRole))
+
+
+class ModuleBrowser(QWidget):
+    """Search bar plus virtualized card list for one tab."""
+    
+    execute_requested = Signal(str)
+    
+    ALL_CATEGORIES = 'All categories'
+    
+    ACTIVATE_KEYS = (Qt.Key_Return, Qt.Key_Enter, Qt.Key_Space)
+    
+    def __init__(
+        self,
+        model: ModuleListModel,
+        tab: str,
+        header: Optional[QWidget] = None,
+        parent=None
+    ) -> None:
+        super().__init__(parent)
+        
+        self._proxy = ModuleFilterProxy(tab, self)
+        self._proxy.setSourceModel(model)
+        
+        self._delegate = ModuleCardDelegate(self)
+        self._delegate.execute_requested.connect(self.execute_requested)
+        
+        self._setup_ui(model.categories(tab), header)
+    
+    def _setup_ui(self, categories: List[str], header: Optional[QWidget]) -> None:
+        """Initialize filter bar and list view."""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 16, 0, 0)
+        layout.setSpacing(12)
+        
+        if header is not None:
+            header_layout = QHBoxLayout()
+            header_layout.setContentsMargins(16, 0, 16, 0)
+            header_layout.addWidget(header)
+            layout.addLayout(header_layout)
+        
+        filter_layout = QHBoxLayout()
+        filter_layout.setContentsMargins(16, 0, 16, 0)
+        filter_layout.setSpacing(12)
+        
+        self._search = QLineEdit()
+        self._search.setPlaceholderText('Search modules by name or category')
+        self._search.setClearButtonEnabled(True)
+        self._search.textChanged.connect(self._apply_filter)
+        filter_layout.addWidget(self._search, 1)
+        
+        self._category = QComboBox()
+        self._category.addItem(self.ALL_CATEGORIES)
+        self._category.addItems(categories)
+        self._category.currentIndexChanged.connect(self._apply_filter)
+        filter_layout.addWidget(self._category)
+        
+        layout.addLayout(filter_layout)
+        
+        self._view = QListView()
+        self._view.setModel(self._proxy)
+        self._view.setItemDelegate(self._delegate)
+        self._view.setUniformItemSizes(True)
+        self._view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self._view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self._view.setSelectionMode(QAbstractItemView.NoSelection)
+        self._view.setFocusPolicy(Qt.StrongFocus)
+        self._view.installEventFilter(self)
+        self._view.setFrameShape(QFrame.NoFrame)
+        self._view.setMouseTracking(True)
+        self._view.viewport().setAttribute(Qt.WA_Hover)
+        layout.addWidget(self._view, 1)
+    
+    def eventFilter(self, watched, event) -> bool:
+        """Run the current module on Enter or Space."""
+        if (
+            watched is self._view
+            and event.type() == QEvent.KeyPress
+            and event.key() in self.ACTIVATE_KEYS
+        ):
+            self._delegate.activate(self._view.currentIndex())
+            return True
+        return super().eventFilter(watched, event)
+    
+    def _apply_filter(self) -> None:
+        category = self._category.currentText()
+        self._proxy.set_filter(
+            self._search.text(),
+            None if category == self.ALL_CATEGORIES else category
+        )
+    
+    def set_dark_mode(self, dark_mode: bool) -> None:
+        """Switch the delegate palette and repaint visible rows."""
+        self._delegate.set_dark_mode(dark_mode)
+        self._view.viewport().update()
@@ -0,0 +1,119 @@
+"""
+Output console widget.
+Plain-text log view with batched appends and bounded history.
+"""
+
+from typing import List, Optional
+
+from PySide6.QtWidgets import QPlainTextEdit
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QTextCursor
+
+from src.utils.transcript import SessionTranscript
+
+
+class OutputConsole(QPlainTextEdit):
+    """
+    Read-only console for module output.
+    
+    Lines are queued and inserted once per frame as a single edit. When the
+    history exceeds max_lines, the oldest lines are moved to the session
+    transcript. The view follows new output only while scrolled to the bottom.
+    """
+    
+    FLUSH_INTERVAL_MS = 16
+    
+    # Trim to this fraction of the cap, so trimming doesn't run on every flush
+    TRIM_TARGET = 0.9
+    
+    def __init__(
+        self,
+        max_lines: int = 5000,
+        transcript: Optional[SessionTranscript] = None,
+        parent=None
+    ) -> None:
+        super().__init__(parent)
+        
+        self._max_lines = max(max_lines, 1)
+        self._transcript = transcript
+        self._pending: List[str] = []
+        
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+    
+    def append_line(self, message: str) -> None:
+        """Queue a message (which may span several lines) for display."""
+        self._pending.extend(message.splitlines() or [''])
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def flush(self) -> None:
+        """Insert queued lines now."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        
+        lines, self._pending = self._pending, []
+        
+        # Lines that would be trimmed straight away skip the document. The
+        # batch alone fills the view, so the lines on screen are spilled
+        # first to keep the transcript in order.
+        overflow = len(lines) - self._max_lines
+        if overflow > 0:
+            if not self.document().isEmpty():
+                self._spill(self.toPlainText().splitlines())
+                super().clear()
+            self._spill(lines[:overflow])
+            lines = lines[overflow:]
+        
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.End)
+        if not self.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText('\n'.join(lines))
+        
+        self._trim()
+        
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+    
+    def _trim(self) -> None:
+        """Move the oldest lines to the transcript once past the cap."""
+        document = self.document()
+        if document.blockCount() <= self._max_lines:
+            return
+        
+        excess = document.blockCount() - int(self._max_lines * self.TRIM_TARGET)
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.Start)
+        cursor.movePosition(QTextCursor.NextBlock, QTextCursor.KeepAnchor, excess)
+        
+        # selectedText separates blocks with U+2029
+        self._spill(cursor.selectedText().split('\u2029')[:excess])
+        cursor.removeSelectedText()
+    
+    def _spill(self, lines: List[str]) -> None:
+        if self._transcript is not None:
+            self._transcript.write(lines)
+    
+    def clear(self) -> None:
+        """Clear the view; its contents are kept in the transcript."""
+        self.flush()
+        if not self.document().isEmpty():
+            self._spill(self.toPlainText().splitlines())
+        super().clear()
+    
+    def close_transcript(self) -> None:
+        """Write out everything still on screen and close the transcript."""
+        self.flush()
+        if self._transcript is not None and self._transcript.lines_written:
+            self._spill(self.toPlainText().splitlines())
+            self._transcript.close()
@@ -4,9 +4,9 @@ Handles settings persistence and theme configuration.
 """
 
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -18,6 +18,73 @@ class Config:
     log_level: str = 'INFO'
     window_width: int = 1000
     window_height: int = 700
+    restart_window: str = ''
+    
+    # Output console history; older lines move to logs/console_*.log
+    console_max_lines: int = 5000
+    
+    # Log records wait in a bounded queue for the writer thread. When it is
+    # full: 'block' waits, 'drop_debug' drops DEBUG, 'sample' keeps one in
+    # log_sample_every DEBUG/INFO records.
+    log_queue_size: int = 10000
+    log_overflow: str = 'drop_debug'
+    log_sample_every: int = 10
+    
+    # Log files rotate at this size or age; rotated and earlier session logs
+    # are gzipped and the oldest removed beyond the file count or total size
+    log_rotate_mb: float = 10.0
+    log_rotate_hours: float = 24.0
+    log_keep_files: int = 20
+    log_keep_mb: float = 100.0
+    
+    # Timings of module runs and commands, written to logs/events_*.jsonl
+    event_log: bool = True
+    
+    # Per-phase and per-command breakdown attached to each ExecutionResult
+    collect_timings: bool = True
+    
+    # Fraction of module runs traced to logs/trace_*.json (0 = off)
+    trace_sample_rate: float = 0.1
+    
+    # tracemalloc probe around each module run, reported as 'memory' events
+    memory_probe: bool = False
+    memory_probe_top: int = 10
+    
+    # UI event loop delay logged as a stall, with the main thread's stack (0 = off)
+    ui_stall_threshold_ms: int = 250
+    
+    # Connectivity probes used by the network repair pipeline.
+    # An empty gateway means auto-detect; 'host:port' probes TCP instead of ICMP.
+    network_probe_dns: List[str] = field(default_factory=lambda: ['www.msftconnecttest.com'])
+    network_probe_tcp: List[str] = field(default_factory=lambda: [
+        'www.msftconnecttest.com:80', '1.1.1.1:443'
+    ])
+    network_probe_gateway: str = ''
+    network_probe_timeout: float = 2.0
+    
+    # Background maintenance, e.g. [{"module": "TempCleanupModule", "interval_hours": 24}]
+    scheduled_jobs: List[dict] = field(default_factory=list)
+    idle_max_cpu_percent: float = 20.0
+    idle_max_disk_percent: float = 25.0
+    idle_min_input_minutes: float = 10.0
+    idle_require_ac_power: bool = True
+    
+    # Resource limits keyed by module id, with 'default' applying to all modules.
+    # Keys: priority (normal/below_normal/idle), low_io, max_files_per_second, max_mb_per_second.
+    throttle: Dict[str, dict] = field(default_factory=lambda: {
+        'TempCleanupModule': {
+            'priority': 'below_normal', 'low_io': True,
+            'max_files_per_second': 500, 'max_mb_per_second': 50
+        },
+        'UpdateCacheModule': {
+            'priority': 'below_normal', 'low_io': True,
+            'max_files_per_second': 500, 'max_mb_per_second': 50
+        },
+        'UpdateResetModule': {
+            'priority': 'below_normal', 'low_io': True,
+            'max_files_per_second': 500, 'max_mb_per_second': 50
+        },
+    })
     
     _config_path: Optional[Path] = None
     
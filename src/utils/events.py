@@ -0,0 +1,315 @@
+"""
+Structured event log.
+JSON-lines record of module runs and commands, with timings, for later analysis.
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import math
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path, PureWindowsPath
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from src.utils.config import Config
+from src.utils.log_rotation import LogArchiver
+
+
+DEFAULT_EVENT_DIR = Path(__file__).parent.parent.parent / 'logs'
+EVENT_PREFIX = 'events'
+
+# Fields added to every event emitted in the current context, e.g. run_id
+_context: ContextVar[Dict[str, Any]] = ContextVar('event_context', default={})
+
+# Arguments kept verbatim in a command signature; everything else becomes '*'
+_SIGNATURE_WORD = re.compile(r'^[A-Za-z][A-Za-z_-]{0,31}$')
+
+
+def argv_signature(args: List[str]) -> str:
+    """
+    Stable form of a command line for grouping.
+    
+    Switches and short words are kept, values such as paths, numbers and
+    scripts are replaced by '*', and '/key:value' switches keep their key:
+    ['dism', '/Online', '/Cleanup-Image', '/Source:D:\\sxs'] gives
+    'dism /online /cleanup-image /source:*'.
+    """
+    if not args:
+        return ''
+    
+    parts = [PureWindowsPath(args[0]).stem.lower()]
+    for arg in args[1:]:
+        if arg[:1] in ('-', '/') and _SIGNATURE_WORD.match(arg[1:].split(':', 1)[0]):
+            key, colon, _ = arg.partition(':')
+            parts.append(f'{key.lower()}:*' if colon else key.lower())
+        elif _SIGNATURE_WORD.match(arg):
+            parts.append(arg.lower())
+        else:
+            parts.append('*')
+    return ' '.join(parts)
+
+
+@contextmanager
+def bind(**fields: Any) -> Iterator[None]:
+    """Add fields to every event emitted by this thread inside the block."""
+    token = _context.set({**_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+def bound(name: str, default: Any = None) -> Any:
+    """Value of a field bound on this thread, e.g. the current step."""
+    return _context.get().get(name, default)
+
+
+class ContextFilter(logging.Filter):
+    """
+    Copies the bound run id onto log records as 'run_id'.
+    
+    Attached to the logger, so it runs on the logging thread before records
+    are queued for the writer thread.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.run_id = _context.get().get('run_id', '')
+        return True
+
+
+class EventLog:
+    """
+    Buffered, append-only JSON-lines event file.
+    
+    The file is created by the first event. Lines are buffered and flushed
+    once per flush interval, on request, and at exit.
+    """
+    
+    ARCHIVE_WAIT_SECONDS = 2.0
+    
+    def __init__(
+        self,
+        directory: Path = DEFAULT_EVENT_DIR,
+        enabled: bool = True,
+        flush_interval: float = 1.0,
+        keep_files: int = 20,
+        keep_bytes: int = 100 * 1024 * 1024
+    ) -> None:
+        """
+        Args:
+            directory: Folder for events_<timestamp>.jsonl
+            enabled: When False, events are discarded
+            flush_interval: Longest time in seconds an event stays buffered
+                while others are being written
+            keep_files: Most earlier event files kept (0 = no limit)
+            keep_bytes: Most bytes kept over earlier event files (0 = no limit)
+        """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self._path = Path(directory) / f'{EVENT_PREFIX}_{timestamp}.jsonl'
+        self._enabled = enabled
+        self._flush_interval = flush_interval
+        self._archiver = LogArchiver(
+            directory,
+            prefix=EVENT_PREFIX,
+            max_files=keep_files,
+            max_total_bytes=keep_bytes,
+            active=lambda: self._path,
+            suffix='.jsonl'
+        )
+        self._file: Optional[TextIO] = None
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+    
+    @property
+    def path(self) -> Path:
+        return self._path
+    
+    def emit(self, event: str, flush: bool = False, **fields: Any) -> None:
+        """
+        Append an event.
+        
+        Args:
+            event: Event type, e.g. 'command'
+            flush: Write the buffer out now
+            fields: Event data; fields bound in the current context are added
+        """
+        if not self._enabled:
+            return
+        
+        record = {'ts': round(time.time(), 3), 'event': event, **_context.get(), **fields}
+        line = json.dumps(record, separators=(',', ':'), default=str) + '\n'
+        
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self._file.write(line)
+            
+            now = time.monotonic()
+            if flush or now - self._last_flush >= self._flush_interval:
+                self._file.flush()
+                self._last_flush = now
+    
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                self._last_flush = time.monotonic()
+    
+    def close(self) -> None:
+        """Close the file and stop the archiver, whose sweep walks the folder."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        
+        # Compression is resumed by the next session if it doesn't finish
+        self._archiver.wait(self.ARCHIVE_WAIT_SECONDS)
+    
+    def _open(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._path, 'a', encoding='utf-8', buffering=64 * 1024)
+        atexit.register(self.close)
+        # Earlier sessions' files are compressed and pruned in the background
+        self._archiver.sweep()
+
+
+_event_log: Optional[EventLog] = None
+_event_log_lock = threading.Lock()
+
+
+def get_event_log() -> EventLog:
+    """Get the shared event log."""
+    global _event_log
+    if _event_log is None:
+        with _event_log_lock:
+            if _event_log is None:
+                config = Config.load()
+                _event_log = EventLog(
+                    enabled=config.event_log,
+                    keep_files=config.log_keep_files,
+                    keep_bytes=int(config.log_keep_mb * 1024 * 1024)
+                )
+    return _event_log
+
+
+def read_events(paths: Iterable[Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Read events from .jsonl and .jsonl.gz files.
+    Lines that don't parse, such as one torn by a crash, are skipped.
+    """
+    for path in paths:
+        opener = gzip.open if path.suffix == '.gz' else open
+        try:
+            with opener(path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+        except OSError:
+            continue
+
+
+def event_files(directory: Path = DEFAULT_EVENT_DIR) -> List[Path]:
+    """Event files in a folder, oldest first."""
+    return sorted(
+        list(directory.glob(f'{EVENT_PREFIX}_*.jsonl')) +
+        list(directory.glob(f'{EVENT_PREFIX}_*.jsonl.gz'))
+    )
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+# Event type and grouping field per summary
+SUMMARY_KEYS = {
+    'module': ('module_end', 'module_id'),
+    'command': ('command', 'argv'),
+    'stall': ('ui_stall', 'site'),
+}
+
+# Order of the summary groups, most expensive first
+SUMMARY_SORTS = {
+    'duration': lambda g: g['total_ms'],
+    'cpu': lambda g: g['cpu_ms'],
+    'memory': lambda g: g['peak_memory_bytes'],
+    'io': lambda g: g['read_bytes'] + g['write_bytes'],
+}
+
+# Resource fields of command events (and module_end totals) summed per group
+_USAGE_SUMS = ('cpu_ms', 'read_bytes', 'write_bytes')
+
+
+def summarize(
+    events: Iterable[Dict[str, Any]],
+    by: str = 'module',
+    module_id: Optional[str] = None,
+    sort: str = 'duration'
+) -> List[Dict[str, Any]]:
+    """
+    Aggregate durations and child process resources per module or per
+    command signature.
+    
+    Args:
+        events: Events as returned by read_events
+        by: 'module' (module_end events), 'command' (command events) or
+            'stall' (UI stalls, by the code that blocked the event loop)
+        module_id: Only events of this module
+        sort: Key of SUMMARY_SORTS to order the groups by
+    
+    Returns:
+        One entry per group with count, failures, duration percentiles in
+        milliseconds, total CPU time and I/O and the largest peak memory,
+        most expensive first
+    """
+    event_type, key_field = SUMMARY_KEYS[by]
+    durations: Dict[str, List[float]] = {}
+    failures: Dict[str, int] = {}
+    usage: Dict[str, Dict[str, float]] = {}
+    
+    for event in events:
+        if event.get('event') != event_type:
+            continue
+        if module_id and event.get('module_id') != module_id:
+            continue
+        key = event.get(key_field, '')
+        durations.setdefault(key, []).append(float(event.get('duration_ms', 0.0)))
+        failed = event.get('status', 'success') != 'success' or event.get('exit_code', 0) != 0
+        failures[key] = failures.get(key, 0) + int(failed)
+        
+        totals = usage.setdefault(key, dict.fromkeys(_USAGE_SUMS + ('peak_memory_bytes',), 0))
+        for name in _USAGE_SUMS:
+            totals[name] += event.get(name, 0)
+        totals['peak_memory_bytes'] = max(totals['peak_memory_bytes'], event.get('peak_memory_bytes', 0))
+    
+    groups = []
+    for key, values in durations.items():
+        values.sort()
+        groups.append({
+            by: key,
+            'count': len(values),
+            'failures': failures[key],
+            'total_ms': round(sum(values), 1),
+            'p50_ms': round(percentile(values, 0.5), 1),
+            'p90_ms': round(percentile(values, 0.9), 1),
+            'p99_ms': round(percentile(values, 0.99), 1),
+            'max_ms': round(values[-1], 1),
+            'cpu_ms': round(usage[key]['cpu_ms'], 1),
+            'peak_memory_bytes': usage[key]['peak_memory_bytes'],
+            'read_bytes': usage[key]['read_bytes'],
+            'write_bytes': usage[key]['write_bytes'],
+        })
+    
+    groups.sort(key=SUMMARY_SORTS[sort], reverse=True)
+    return groups
@@ -0,0 +1,192 @@
+"""
+Asynchronous logging pipeline.
+Bounded queue between logging callers and a background writer thread.
+"""
+
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+
+OVERFLOW_BLOCK = 'block'
+OVERFLOW_DROP_DEBUG = 'drop_debug'
+OVERFLOW_SAMPLE = 'sample'
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_DEBUG, OVERFLOW_SAMPLE)
+
+
+class BatchFlushMixin:
+    """
+    Handler mixin that skips the flush after every record.
+    
+    While deferred, the listener calls flush_batch() once per batch instead.
+    """
+    
+    deferred = True
+    
+    def flush(self) -> None:
+        if not self.deferred:
+            super().flush()
+    
+    def flush_batch(self) -> None:
+        super().flush()
+
+
+class BatchedFileHandler(BatchFlushMixin, logging.FileHandler):
+    """FileHandler flushed once per listener batch."""
+
+
+class BatchedStreamHandler(BatchFlushMixin, logging.StreamHandler):
+    """StreamHandler flushed once per listener batch."""
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler with a configurable policy for a full queue.
+    
+    block: wait for room, nothing is lost.
+    drop_debug: DEBUG records are dropped, INFO and above wait.
+    sample: one in sample_every DEBUG/INFO records is kept, WARNING and above wait.
+    
+    Records are only ever dropped while the queue is full, so a
+    keeping-up listener sees every record.
+    """
+    
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        policy: str = OVERFLOW_DROP_DEBUG,
+        sample_every: int = 10
+    ) -> None:
+        """
+        Args:
+            log_queue: Bounded queue shared with the listener
+            policy: One of OVERFLOW_POLICIES
+            sample_every: Keep rate of the sample policy
+        """
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f'Unknown overflow policy: {policy}')
+        super().__init__(log_queue)
+        
+        self.policy = policy
+        self.sample_every = max(sample_every, 1)
+        self._keep_level = logging.INFO if policy == OVERFLOW_DROP_DEBUG else logging.WARNING
+        self._counter_lock = threading.Lock()
+        self._overflowed = 0
+        self._dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue never leaves the process, so the record is not copied or
+        # formatted here; only the message is fixed in case args change later
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == OVERFLOW_BLOCK:
+            self.queue.put(record)
+            return
+        
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        
+        if record.levelno >= self._keep_level:
+            self.queue.put(record)
+            return
+        
+        with self._counter_lock:
+            self._overflowed += 1
+            keep = self.policy == OVERFLOW_SAMPLE and self._overflowed % self.sample_every == 0
+            if not keep:
+                self._dropped += 1
+        if keep:
+            self.queue.put(record)
+    
+    def take_dropped(self) -> int:
+        """Return and reset the number of records dropped so far."""
+        with self._counter_lock:
+            dropped, self._dropped = self._dropped, 0
+        return dropped
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    QueueListener that handles queued records in batches.
+    
+    Waits for one record, then takes whatever else is already queued (up to
+    batch_size) and flushes the handlers once for the whole batch. Dropped
+    records are reported with a single warning per batch.
+    """
+    
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        *handlers: logging.Handler,
+        batch_size: int = 256,
+        source: Optional[BoundedQueueHandler] = None
+    ) -> None:
+        """
+        Args:
+            log_queue: Queue filled by the BoundedQueueHandler
+            handlers: Handlers that write the records
+            batch_size: Most records handled between two flushes
+            source: Queue handler to collect dropped record counts from
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = max(batch_size, 1)
+        self._source = source
+        self.batches = 0
+    
+    def enqueue_sentinel(self) -> None:
+        # Wait for room: the sentinel must not be lost to a full queue
+        self.queue.put(self._sentinel)
+    
+    def _monitor(self) -> None:
+        log_queue = self.queue
+        while True:
+            batch: List[Optional[logging.LogRecord]] = [log_queue.get()]
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(log_queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            stop = False
+            for record in batch:
+                if record is self._sentinel:
+                    stop = True
+                else:
+                    self.handle(record)
+            self._report_dropped()
+            self._flush()
+            self.batches += 1
+            
+            for _ in batch:
+                log_queue.task_done()
+            if stop:
+                break
+    
+    def _report_dropped(self) -> None:
+        if self._source is None:
+            return
+        dropped = self._source.take_dropped()
+        if dropped:
+            self.handle(logging.makeLogRecord({
+                'name': 'WinRepairToolkit',
+                'levelno': logging.WARNING,
+                'levelname': 'WARNING',
+                'msg': f'Log queue full: dropped {dropped} record(s)',
+            }))
+    
+    def _flush(self) -> None:
+        for handler in self.handlers:
+            flush = getattr(handler, 'flush_batch', handler.flush)
+            try:
+                flush()
+            except (OSError, ValueError):
+                # Stream closed underneath us, e.g. stderr at interpreter exit
+                pass
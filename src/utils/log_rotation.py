@@ -0,0 +1,305 @@
+"""
+Log rotation and retention.
+Size- and age-based rotation with background compression of old log files.
+"""
+
+import gzip
+import logging
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Union
+
+from src.utils.log_pipeline import BatchedFileHandler
+
+
+# Windows: background mode lowers CPU, I/O and memory priority of a thread
+THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+BACKGROUND_NICE = 19
+
+# Plain log files untouched for this long belong to finished sessions
+STALE_SECONDS = 3600
+
+_SWEEP = 'sweep'
+_STOP = 'stop'
+
+# Child of the application logger, so archiver failures reach the log file
+_logger = logging.getLogger('WinRepairToolkit.archiver')
+
+
+def lower_thread_priority() -> None:
+    """Run the calling thread at background priority, where supported."""
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_MODE_BACKGROUND_BEGIN)
+        elif sys.platform.startswith('linux'):
+            # Linux applies niceness per thread
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), BACKGROUND_NICE)
+    except (AttributeError, OSError):
+        pass
+
+
+class LogArchiver:
+    """
+    Compresses rotated log files and enforces retention.
+    
+    Work runs on one daemon thread at background priority, started on the
+    first request. Files are written to a temporary name and renamed once
+    complete, so an interrupted compression leaves the plain file behind to
+    be picked up by the next sweep.
+    """
+    
+    def __init__(
+        self,
+        directory: Path,
+        prefix: str = 'toolkit',
+        max_files: int = 20,
+        max_total_bytes: int = 100 * 1024 * 1024,
+        active: Optional[Callable[[], Path]] = None,
+        suffix: str = '.log'
+    ) -> None:
+        """
+        Args:
+            directory: Log folder
+            prefix: Only files named '<prefix>_*' are managed
+            max_files: Most archived files kept (0 = no limit)
+            max_total_bytes: Most bytes kept over all archived files (0 = no limit)
+            active: Returns the file currently written to, which is never touched
+            suffix: Extension of uncompressed files
+        """
+        self._directory = Path(directory)
+        self._prefix = prefix
+        self._max_files = max_files
+        self._max_total_bytes = max_total_bytes
+        self._active = active
+        self._suffix = suffix
+        self._queue: 'queue.Queue[Union[Path, str]]' = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def submit(self, path: Path) -> None:
+        """Compress a rotated file, then apply retention."""
+        self._start()
+        self._queue.put(path)
+    
+    def sweep(self) -> None:
+        """
+        Compress plain log files left by earlier sessions, then apply
+        retention. Files written to within STALE_SECONDS are skipped, since
+        another process may still be using them.
+        """
+        self._start()
+        self._queue.put(_SWEEP)
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued work to finish.
+        
+        Returns:
+            False if the timeout expired first
+        """
+        thread = self._thread
+        # A stop left in the queue would end the next thread before its work
+        if thread is None or not thread.is_alive():
+            return True
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        return not thread.is_alive()
+    
+    def archived(self) -> List[Path]:
+        """Managed files other than the active one, newest first."""
+        active = self._active() if self._active else None
+        files = []
+        for path in self._managed():
+            if path == active or path.name.endswith('.tmp'):
+                continue
+            try:
+                files.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        return [path for _, path in sorted(files, reverse=True)]
+    
+    def enforce_retention(self) -> None:
+        """Delete the oldest archived files beyond the count and size caps."""
+        total = 0
+        for index, path in enumerate(self.archived()):
+            try:
+                total += path.stat().st_size
+                over_count = self._max_files and index >= self._max_files
+                over_size = self._max_total_bytes and total > self._max_total_bytes
+                if over_count or over_size:
+                    path.unlink()
+            except OSError:
+                continue
+    
+    @staticmethod
+    def compress(path: Path) -> Optional[Path]:
+        """
+        Gzip a file next to itself and remove the original.
+        
+        Returns:
+            The compressed file, or None if the file could not be read
+        """
+        target = path.with_name(path.name + '.gz')
+        partial = path.with_name(path.name + '.gz.tmp')
+        try:
+            with open(path, 'rb') as source, gzip.open(partial, 'wb') as sink:
+                shutil.copyfileobj(source, sink, 1024 * 1024)
+            stat = path.stat()
+            os.utime(partial, (stat.st_atime, stat.st_mtime))
+            os.replace(partial, target)
+            path.unlink()
+        except OSError:
+            try:
+                partial.unlink()
+            except OSError:
+                pass
+            return None
+        return target
+    
+    def _managed(self) -> List[Path]:
+        """Files named '<prefix>_*', none if the folder cannot be listed."""
+        try:
+            return list(self._directory.glob(f'{self._prefix}_*'))
+        except OSError as e:
+            _logger.warning(f'Could not list {self._directory}: {e}')
+            return []
+    
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='LogArchiver', daemon=True
+                )
+                self._thread.start()
+    
+    def _stale_files(self) -> List[Path]:
+        active = self._active() if self._active else None
+        cutoff = time.time() - STALE_SECONDS
+        stale = []
+        for path in self._managed():
+            try:
+                if path.name.endswith('.gz.tmp'):
+                    # Left by a compression interrupted at exit
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                elif path.suffix == self._suffix and path != active and path.stat().st_mtime < cutoff:
+                    stale.append(path)
+            except OSError:
+                continue
+        return sorted(stale)
+    
+    def _run(self) -> None:
+        lower_thread_priority()
+        while True:
+            item = self._queue.get()
+            stop = item == _STOP
+            # A failure must not end the thread, or later work queues up forever
+            try:
+                if item == _SWEEP:
+                    for path in self._stale_files():
+                        self.compress(path)
+                elif not stop:
+                    self.compress(item)
+                # A stop queued behind work would otherwise skip its retention
+                if stop or self._queue.empty():
+                    self.enforce_retention()
+            except Exception:
+                _logger.exception(f'Log archiving failed in {self._directory}')
+            if stop:
+                break
+
+
+class RotatingLogHandler(BatchedFileHandler):
+    """
+    Log file handler that rotates by size and age.
+    
+    The file and its folder are created on the first record. A full or
+    expired file is renamed to '<name>.<n>.log' and handed to the archiver,
+    and writing continues in a fresh file under the original name.
+    """
+    
+    def __init__(
+        self,
+        filename: Path,
+        max_bytes: int = 10 * 1024 * 1024,
+        max_age_seconds: float = 24 * 3600,
+        archiver: Optional[LogArchiver] = None
+    ) -> None:
+        """
+        Args:
+            filename: Active log file
+            max_bytes: Rotate once the file reaches this size (0 = never)
+            max_age_seconds: Rotate once the file is this old (0 = never)
+            archiver: Receives rotated files; swept when the first file opens
+        """
+        super().__init__(filename, encoding='utf-8', delay=True)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._archiver = archiver
+        self._size = 0
+        self._opened_at = 0.0
+        self._segment = 0
+        self._swept = False
+    
+    def format(self, record) -> str:
+        text = super().format(record)
+        # Characters rather than encoded bytes, which is close enough and
+        # avoids tell(), which would flush the batched stream
+        self._size += len(text) + 1
+        return text
+    
+    def emit(self, record) -> None:
+        if self.stream is not None and self._due():
+            try:
+                self.rotate()
+            except OSError:
+                self.handleError(record)
+        super().emit(record)
+    
+    def rotate(self) -> Path:
+        """
+        Close the current file and move it aside.
+        
+        Returns:
+            The rotated file
+        """
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+        
+        current = Path(self.baseFilename)
+        self._segment += 1
+        rotated = current.with_name(f'{current.stem}.{self._segment}{current.suffix}')
+        os.replace(current, rotated)
+        
+        if self._archiver is not None:
+            self._archiver.submit(rotated)
+        return rotated
+    
+    def _due(self) -> bool:
+        if self.max_bytes and self._size >= self.max_bytes:
+            return True
+        return bool(self.max_age_seconds) and time.time() - self._opened_at >= self.max_age_seconds
+    
+    def _open(self):
+        path = Path(self.baseFilename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stream = super()._open()
+        
+        try:
+            self._size = path.stat().st_size
+        except OSError:
+            self._size = 0
+        self._opened_at = time.time()
+        
+        if not self._swept and self._archiver is not None:
+            self._swept = True
+            self._archiver.sweep()
+        return stream
@@ -0,0 +1,405 @@
+"""
+Log search.
+Memory-mapped tail and search over the text logs, with a sparse per-file index.
+"""
+
+import gzip
+import mmap
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+
+DEFAULT_LOG_DIR = Path(__file__).parent.parent.parent / 'logs'
+LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# '2026-10-19 04:48:31 | WARNING  | WinRepairToolkit | [3f2a9c0d1b2e] message';
+# lines without this header continue the previous record (tracebacks)
+_HEADER = re.compile(
+    rb'(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d) \| ([A-Z]+) *\| [^|\n]*\| (?:\[([0-9a-f]{12})\] )?'
+)
+_HEADER_START = re.compile(rb'^\d{4}-\d\d-\d\d \d\d:\d\d:\d\d \| ', re.M)
+_RUN_IDS = re.compile(rb'\| \[([0-9a-f]{12})\] ')
+
+# A traceback line is attributed to a header at most this many lines up
+_MAX_CONTINUATION = 200
+
+
+def parse_time(value: str) -> str:
+    """
+    Normalise a user-supplied time ('2026-10-19', '2026-10-19 14:05' or ISO
+    format) to the log timestamp format, which compares as a string.
+    """
+    return datetime.fromisoformat(value.strip()).strftime(TIMESTAMP_FORMAT)
+
+
+def _level_mask(levels: Iterable[str]) -> int:
+    mask = 0
+    for level in levels:
+        if level in LEVELS:
+            mask |= 1 << LEVELS.index(level)
+    return mask
+
+
+@dataclass
+class IndexBlock:
+    """Summary of a run of whole lines in a log file."""
+    offset: int
+    end: int
+    first_time: str
+    last_time: str
+    levels: int
+    run_ids: FrozenSet[str] = field(default_factory=frozenset)
+
+
+@dataclass
+class LogMatch:
+    """One log line found by a search."""
+    path: Path
+    offset: int
+    timestamp: str
+    level: str
+    run_id: str
+    text: str
+
+
+class LogIndex:
+    """
+    Sparse index of a text log: per block of about BLOCK_SIZE bytes, the
+    time range, the levels present and the run ids present.
+    
+    Searches use it to skip blocks outside a time range or without a wanted
+    level or run id. refresh() indexes only what was appended since the
+    last call. The file is mapped only while it is being read, so rotation
+    and retention can still rename or delete it.
+    """
+    
+    BLOCK_SIZE = 64 * 1024
+    
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.blocks: List[IndexBlock] = []
+        self._indexed = 0
+        self._identity: Optional[Tuple[int, int]] = None
+    
+    @property
+    def indexed_bytes(self) -> int:
+        return self._indexed
+    
+    def refresh(self) -> None:
+        """Index complete lines appended since the last refresh."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            self.blocks, self._indexed = [], 0
+            return
+        
+        # A rotated-away and recreated file starts over
+        identity = (stat.st_ino, stat.st_dev) if stat.st_ino else None
+        if stat.st_size < self._indexed or identity != self._identity:
+            self.blocks, self._indexed = [], 0
+        self._identity = identity
+        
+        if stat.st_size == self._indexed:
+            return
+        
+        with _mapped(self.path) as data:
+            if data is None:
+                return
+            position = self._indexed
+            last_time = self.blocks[-1].last_time if self.blocks else ''
+            while position < len(data):
+                end = data.find(b'\n', min(position + self.BLOCK_SIZE, len(data)) - 1)
+                if end < 0:
+                    # An incomplete last line is indexed once it is finished
+                    end = data.rfind(b'\n', position)
+                    if end < 0:
+                        break
+                block = self._summarize(data, position, end + 1, last_time)
+                self.blocks.append(block)
+                last_time = block.last_time
+                position = end + 1
+            self._indexed = position
+    
+    def candidates(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        levels: int = 0,
+        run_id: Optional[str] = None
+    ) -> Iterator[IndexBlock]:
+        """Blocks that may contain lines matching the filters."""
+        for block in self.blocks:
+            if since and block.last_time and block.last_time < since:
+                continue
+            if until and block.first_time and block.first_time > until:
+                break
+            if levels and not block.levels & levels:
+                continue
+            if run_id and run_id not in block.run_ids:
+                continue
+            yield block
+    
+    @staticmethod
+    def _summarize(data, start: int, end: int, previous_time: str) -> IndexBlock:
+        first = _HEADER_START.search(data, start, end)
+        first_time = first.group(0)[:19].decode() if first else previous_time
+        
+        last_time = first_time
+        line_end = end - 1
+        while line_end > start:
+            line_start = data.rfind(b'\n', start, line_end) + 1 or start
+            if _HEADER_START.match(data, line_start, end):
+                last_time = data[line_start:line_start + 19].decode()
+                break
+            line_end = line_start - 1
+        
+        levels = 0
+        for bit, level in enumerate(LEVELS):
+            if data.find(b'| ' + level.encode(), start, end) >= 0:
+                levels |= 1 << bit
+        
+        run_ids = frozenset(m.decode() for m in _RUN_IDS.findall(data, start, end))
+        return IndexBlock(start, end, first_time, last_time, levels, run_ids)
+
+
+class _mapped:
+    """Read-only mapping of a whole file, None for an empty file."""
+    
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+    
+    def __enter__(self) -> Optional[mmap.mmap]:
+        self._file = open(self._path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._map = None
+        return self._map
+    
+    def __exit__(self, *exc) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+_indexes: Dict[Path, LogIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(path: Path) -> LogIndex:
+    """Shared, refreshed index of a log file."""
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            index = _indexes[path] = LogIndex(path)
+        index.refresh()
+        return index
+
+
+def log_files(directory: Path = DEFAULT_LOG_DIR, prefix: str = 'toolkit') -> List[Path]:
+    """Text logs and rotated segments in a folder, oldest first."""
+    files = []
+    for path in directory.glob(f'{prefix}_*'):
+        if path.name.endswith(('.log', '.log.gz')):
+            try:
+                files.append((path.stat().st_mtime, path.name, path))
+            except OSError:
+                continue
+    return [path for *_, path in sorted(files)]
+
+
+def _header_before(data, line_start: int, floor: int) -> Optional[re.Match]:
+    """Header of the record a line belongs to."""
+    for _ in range(_MAX_CONTINUATION):
+        header = _HEADER.match(data, line_start)
+        if header or line_start <= floor:
+            return header
+        line_start = data.rfind(b'\n', floor, line_start - 1) + 1 or floor
+    return None
+
+
+def _line_filter(
+    since: Optional[str],
+    until: Optional[str],
+    min_level: Optional[str],
+    run_id: Optional[str]
+):
+    allowed = set(LEVELS[LEVELS.index(min_level):]) if min_level else None
+    
+    def accept(timestamp: str, level: str, line_run: str) -> bool:
+        if since and timestamp < since:
+            return False
+        if until and timestamp > until:
+            return False
+        if allowed is not None and level not in allowed:
+            return False
+        return not run_id or line_run == run_id
+    
+    return accept
+
+
+def search(
+    path: Path,
+    query: str = '',
+    min_level: Optional[str] = None,
+    run_id: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    should_stop: Optional[Callable[[], bool]] = None
+) -> Iterator[LogMatch]:
+    """
+    Find lines in a log file, in file order.
+    
+    Matches are produced as they are found, so a caller can show the first
+    results of a long search at once and stop early by not iterating further.
+    
+    Args:
+        path: Text log, plain or gzipped
+        query: Case-insensitive text the line must contain ('' matches every record)
+        min_level: Lowest level to include, e.g. 'WARNING'
+        run_id: Only lines logged during this journal run
+        since: Earliest timestamp, as returned by parse_time
+        until: Latest timestamp, as returned by parse_time
+        should_stop: Polled between blocks; the search ends once it returns True
+    """
+    should_stop = should_stop or (lambda: False)
+    accept = _line_filter(since, until, min_level, run_id)
+    pattern = re.compile(re.escape(query.encode('utf-8')), re.I) if query else _HEADER
+    
+    if path.suffix == '.gz':
+        yield from _search_gzip(path, pattern, accept, should_stop)
+        return
+    
+    index = get_index(path)
+    levels = _level_mask(LEVELS[LEVELS.index(min_level):]) if min_level else 0
+    blocks = list(index.candidates(since, until, levels, run_id))
+    if not blocks:
+        return
+    
+    with _mapped(path) as data:
+        if data is None:
+            return
+        for block in blocks:
+            if should_stop():
+                return
+            position = block.offset
+            while True:
+                found = pattern.search(data, position, block.end)
+                if found is None:
+                    break
+                line_start = data.rfind(b'\n', block.offset, found.start()) + 1 or block.offset
+                line_end = data.find(b'\n', found.start(), block.end)
+                if line_end < 0:
+                    line_end = block.end
+                position = line_end + 1
+                
+                header = _header_before(data, line_start, 0)
+                if header is None:
+                    continue
+                timestamp, level, line_run = (
+                    header.group(1).decode(), header.group(2).decode(),
+                    (header.group(3) or b'').decode()
+                )
+                if accept(timestamp, level, line_run):
+                    yield LogMatch(
+                        path, line_start, timestamp, level, line_run,
+                        data[line_start:line_end].decode('utf-8', 'replace').rstrip('\r')
+                    )
+
+
+def _search_gzip(
+    path: Path,
+    pattern: re.Pattern,
+    accept,
+    should_stop: Callable[[], bool]
+) -> Iterator[LogMatch]:
+    """Line-by-line search of a compressed segment, which has no index."""
+    offset = 0
+    header = None
+    try:
+        with gzip.open(path, 'rb') as f:
+            for number, raw in enumerate(f):
+                if number % 1000 == 0 and should_stop():
+                    return
+                line_header = _HEADER.match(raw)
+                if line_header:
+                    header = line_header
+                if header is not None and pattern.search(raw):
+                    timestamp, level, line_run = (
+                        header.group(1).decode(), header.group(2).decode(),
+                        (header.group(3) or b'').decode()
+                    )
+                    if accept(timestamp, level, line_run):
+                        yield LogMatch(
+                            path, offset, timestamp, level, line_run,
+                            raw.rstrip(b'\r\n').decode('utf-8', 'replace')
+                        )
+                offset += len(raw)
+    except (OSError, EOFError):
+        return
+
+
+def search_files(paths: Iterable[Path], **filters) -> Iterator[LogMatch]:
+    """search() over several files in order; see search() for the filters."""
+    should_stop = filters.get('should_stop') or (lambda: False)
+    for path in paths:
+        if should_stop():
+            return
+        try:
+            yield from search(path, **filters)
+        except OSError:
+            continue
+
+
+def tail(path: Path, count: int = 100) -> Tuple[List[str], int]:
+    """
+    Last lines of a log file.
+    
+    Returns:
+        The lines and the file offset after them, to continue with read_from()
+    """
+    with _mapped(path) as data:
+        if data is None:
+            return [], 0
+        end = len(data)
+        start = end
+        if end and data[end - 1:end] == b'\n':
+            start -= 1
+        for _ in range(count):
+            start = data.rfind(b'\n', 0, start)
+            if start < 0:
+                break
+        text = data[start + 1:end].decode('utf-8', 'replace')
+        return text.splitlines(), end
+
+
+def read_from(path: Path, offset: int) -> Tuple[List[str], int]:
+    """
+    Complete lines appended after an offset returned by tail() or an
+    earlier read_from(). A file that shrank (was rotated) is read from the start.
+    
+    Returns:
+        The new lines and the offset after them
+    """
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return [], offset
+    if size < offset:
+        offset = 0
+    if size == offset:
+        return [], offset
+    
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        data = f.read(size - offset)
+    end = data.rfind(b'\n') + 1
+    return data[:end].decode('utf-8', 'replace').splitlines(), offset + end
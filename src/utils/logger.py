@@ -3,15 +3,49 @@ Centralized logging system for Windows Repair Toolkit.
 Provides structured logging with file and console output.
 """
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from src.utils.config import Config
+from src.utils.events import ContextFilter
+from src.utils.log_pipeline import (
+    OVERFLOW_DROP_DEBUG, OVERFLOW_POLICIES, BatchedStreamHandler,
+    BatchingQueueListener, BoundedQueueHandler
+)
+from src.utils.log_rotation import LogArchiver, RotatingLogHandler
+
+
+class RunFormatter(logging.Formatter):
+    """Prefixes messages logged during a module run with '[<run id>] '."""
+    
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        run_id = getattr(record, 'run_id', '')
+        if not run_id:
+            return super().formatMessage(record)
+        
+        message = record.message
+        record.message = f'[{run_id}] {message}'
+        try:
+            return super().formatMessage(record)
+        finally:
+            record.message = message
+
 
 class Logger:
-    """Thread-safe singleton logger with file and console handlers."""
+    """
+    Thread-safe singleton logger with file and console handlers.
+    
+    Records pass through a bounded queue to a background thread that writes
+    them in batches, so logging never waits on disk or console I/O unless
+    the queue is full.
+    """
+    
+    ARCHIVE_WAIT_SECONDS = 2.0
     
     _instance: Optional['Logger'] = None
     _initialized: bool = False
@@ -34,37 +68,110 @@ class Logger:
         self._logger.setLevel(logging.DEBUG)
         self._logger.handlers.clear()
         
-        log_dir = Path(__file__).parent.parent.parent / 'logs'
-        log_dir.mkdir(exist_ok=True)
+        config = Config.load()
         
+        log_dir = Path(__file__).parent.parent.parent / 'logs'
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         log_file = log_dir / f'toolkit_{timestamp}.log'
         
-        file_formatter = logging.Formatter(
+        # The folder and file are created by the first record
+        archiver = LogArchiver(
+            log_dir,
+            prefix='toolkit',
+            max_files=config.log_keep_files,
+            max_total_bytes=int(config.log_keep_mb * 1024 * 1024),
+            active=lambda: log_file
+        )
+        
+        file_formatter = RunFormatter(
             '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = RotatingLogHandler(
+            log_file,
+            max_bytes=int(config.log_rotate_mb * 1024 * 1024),
+            max_age_seconds=config.log_rotate_hours * 3600,
+            archiver=archiver
+        )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(file_formatter)
         
         console_formatter = logging.Formatter(
             '%(levelname)-8s | %(message)s'
         )
-        console_handler = logging.StreamHandler()
+        console_handler = BatchedStreamHandler()
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(console_formatter)
         
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
+        # Callers only enqueue; formatting and I/O happen on the listener thread
+        policy = config.log_overflow
+        if policy not in OVERFLOW_POLICIES:
+            policy = OVERFLOW_DROP_DEBUG
+        log_queue: queue.Queue = queue.Queue(maxsize=max(config.log_queue_size, 1))
+        queue_handler = BoundedQueueHandler(log_queue, policy, config.log_sample_every)
+        listener = BatchingQueueListener(
+            log_queue, file_handler, console_handler, source=queue_handler
+        )
+        
+        self._logger.addFilter(ContextFilter())
+        self._logger.addHandler(queue_handler)
+        listener.start()
+        atexit.register(self.shutdown)
         
+        self._queue_handler = queue_handler
+        self._listener: Optional[BatchingQueueListener] = listener
+        self._archiver = archiver
+        self._file_handler = file_handler
+        self._console_handler = console_handler
         self._log_file = log_file
     
+    def shutdown(self) -> None:
+        """
+        Write out all queued records and stop the writer thread.
+        
+        Records logged afterwards are written directly by the calling thread.
+        Runs automatically at interpreter exit.
+        """
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        
+        listener.stop()
+        self._logger.removeHandler(self._queue_handler)
+        for handler in (self._file_handler, self._console_handler):
+            handler.deferred = False
+            self._logger.addHandler(handler)
+        
+        # Compression is resumed by the next session if it doesn't finish
+        self._archiver.wait(self.ARCHIVE_WAIT_SECONDS)
+    
     @property
     def log_file(self) -> Path:
-        """Return the current log file path."""
+        """
+        Return the current log file path.
+        
+        The file only exists once something has been logged; older parts of
+        the session are rotated to '<name>.<n>.log.gz'.
+        """
         return self._log_file
     
+    def add_handler(self, handler: logging.Handler) -> None:
+        """
+        Attach an additional handler, e.g. to forward records elsewhere.
+        
+        Unlike the file and console output, it runs on the logging thread,
+        so records reach it in order with the caller's other output.
+        """
+        self._logger.addHandler(handler)
+    
+    def remove_handler(self, handler: logging.Handler) -> None:
+        """Detach a handler added with add_handler."""
+        self._logger.removeHandler(handler)
+    
+    def set_console_level(self, level: int) -> None:
+        """Change the minimum level written to the console."""
+        self._console_handler.setLevel(level)
+    
     def info(self, message: str) -> None:
         """Log info level message."""
         self._logger.info(message)
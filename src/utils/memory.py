@@ -0,0 +1,191 @@
+"""
+Memory probe.
+Traced allocations and process RSS around a module run.
+"""
+
+import os
+import sys
+import threading
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Allocations made by the probe itself and by imports are not reported
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+# tracemalloc is process-wide; probes that turned it on turn it off once none is open
+_active = 0
+_started_tracing = False
+_active_lock = threading.Lock()
+
+
+def windows_memory_counters(handle: int) -> Optional[Tuple[int, int]]:
+    """
+    Working set of a Windows process, from K32GetProcessMemoryInfo.
+    
+    Args:
+        handle: Process handle with query access
+    
+    Returns:
+        (working set, peak working set) in bytes, or None if the query fails
+    """
+    import ctypes
+    
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ('cb', ctypes.c_ulong),
+            ('PageFaultCount', ctypes.c_ulong),
+            ('PeakWorkingSetSize', ctypes.c_size_t),
+            ('WorkingSetSize', ctypes.c_size_t),
+            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+            ('PagefileUsage', ctypes.c_size_t),
+            ('PeakPagefileUsage', ctypes.c_size_t),
+        ]
+    
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    if not ctypes.windll.kernel32.K32GetProcessMemoryInfo(
+        ctypes.c_void_p(handle), ctypes.byref(counters), counters.cb
+    ):
+        return None
+    return counters.WorkingSetSize, counters.PeakWorkingSetSize
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size (working set on Windows) of this process in bytes."""
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            
+            kernel32 = ctypes.windll.kernel32
+            kernel32.GetCurrentProcess.restype = ctypes.c_void_p
+            counters = windows_memory_counters(kernel32.GetCurrentProcess())
+            return counters[0] if counters else None
+        
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, OSError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class AllocationSite:
+    """Memory allocated at one source line during a run and still held after it."""
+    site: str
+    size_bytes: int
+    count: int
+
+
+@dataclass
+class MemoryReport:
+    """What a module run did to the memory of this process."""
+    traced_peak_bytes: int
+    traced_delta_bytes: int
+    rss_before_bytes: Optional[int] = None
+    rss_after_bytes: Optional[int] = None
+    top: List[AllocationSite] = field(default_factory=list)
+    
+    @property
+    def rss_delta_bytes(self) -> Optional[int]:
+        if self.rss_before_bytes is None or self.rss_after_bytes is None:
+            return None
+        return self.rss_after_bytes - self.rss_before_bytes
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), 'rss_delta_bytes': self.rss_delta_bytes}
+    
+    def describe(self) -> str:
+        """One-line summary for the text log."""
+        parts = [
+            f'traced peak {_mb(self.traced_peak_bytes)}',
+            f'retained {_mb(self.traced_delta_bytes, signed=True)}',
+        ]
+        if self.rss_delta_bytes is not None:
+            parts.append(f'RSS {_mb(self.rss_after_bytes)} ({_mb(self.rss_delta_bytes, signed=True)})')
+        if self.top:
+            parts.append(f'top site {self.top[0].site}')
+        return ', '.join(parts)
+
+
+def _mb(size: int, signed: bool = False) -> str:
+    return f'{size / (1024 * 1024):{"+" if signed else ""}.1f} MB'
+
+
+class MemoryProbe:
+    """
+    Measures memory around a block of work with tracemalloc snapshots.
+    
+    start() begins tracing if it is not already on, and stop() or close()
+    ends it again once no probe needs it. The peak covers everything allocated while the
+    probe was open, including by other threads. The top sites are the lines
+    whose allocations grew the most between the two snapshots, i.e. what
+    the work left behind.
+    """
+    
+    def __init__(self, top: int = 10) -> None:
+        """
+        Args:
+            top: Allocation sites listed in the report
+        """
+        self._top = top
+        self._before: Optional[tracemalloc.Snapshot] = None
+        self._rss_before: Optional[int] = None
+    
+    def start(self) -> None:
+        global _active, _started_tracing
+        with _active_lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _started_tracing = True
+            _active += 1
+            tracemalloc.reset_peak()
+        
+        self._rss_before = current_rss()
+        self._before = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+    
+    def stop(self) -> MemoryReport:
+        after = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        peak = tracemalloc.get_traced_memory()[1]
+        rss_after = current_rss()
+        
+        differences = after.compare_to(self._before, 'lineno')
+        grown = [d for d in differences if d.size_diff > 0][:self._top]
+        
+        self.close()
+        
+        return MemoryReport(
+            traced_peak_bytes=peak,
+            traced_delta_bytes=sum(d.size_diff for d in differences),
+            rss_before_bytes=self._rss_before,
+            rss_after_bytes=rss_after,
+            top=[
+                AllocationSite(
+                    site=f'{d.traceback[0].filename}:{d.traceback[0].lineno}',
+                    size_bytes=d.size_diff,
+                    count=d.count_diff
+                )
+                for d in grown
+            ]
+        )
+    
+    def close(self) -> None:
+        """Release tracemalloc without a report; does nothing once stopped."""
+        global _active, _started_tracing
+        if self._before is None:
+            return
+        self._before = None
+        
+        with _active_lock:
+            _active -= 1
+            if _active == 0 and _started_tracing:
+                tracemalloc.stop()
+                _started_tracing = False
@@ -0,0 +1,145 @@
+"""
+Execution timings.
+Per-phase and per-command durations collected while a module runs.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from src.system.accounting import ResourceUsage
+
+
+# Collector of the module run on this thread, None when timings are off
+_current: ContextVar[Optional['ExecutionTimings']] = ContextVar('execution_timings', default=None)
+
+
+@dataclass
+class CommandTiming:
+    """Durations of one CommandRunner call, in milliseconds."""
+    argv: str
+    exit_code: int
+    spawn_ms: float
+    run_ms: float
+    step: Optional[str] = None
+    usage: Optional['ResourceUsage'] = None
+    
+    @property
+    def total_ms(self) -> float:
+        return self.spawn_ms + self.run_ms
+
+
+@dataclass
+class ExecutionTimings:
+    """
+    Where a module run spent its time, in milliseconds.
+    
+    Phases are recorded in order: validation, journal, execute, finalize and
+    total. Each command run during the execute phase is listed with its
+    spawn time (resolving the executable, starting the process and applying
+    its priority) and run time (waiting for it to exit). usage totals the
+    resources of the commands whose platform reports them.
+    """
+    phases: Dict[str, float] = field(default_factory=dict)
+    commands: List[CommandTiming] = field(default_factory=list)
+    usage: Optional['ResourceUsage'] = None
+    
+    # Commands listed by summary(), slowest first
+    SUMMARY_COMMANDS = 5
+    
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block as the named phase."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round((time.perf_counter() - started) * 1000, 1)
+    
+    def add_command(self, timing: CommandTiming) -> None:
+        self.commands.append(timing)
+        if timing.usage is None:
+            return
+        if self.usage is None:
+            self.usage = replace(timing.usage)
+        else:
+            self.usage.add(timing.usage)
+    
+    @property
+    def command_ms(self) -> float:
+        """Time spent in commands, spawn included."""
+        return round(sum(c.total_ms for c in self.commands), 1)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'phases': dict(self.phases),
+            'command_ms': self.command_ms,
+            'commands': [asdict(c) for c in self.commands],
+            'usage': self.usage.to_dict() if self.usage else None,
+        }
+    
+    def summary(self) -> str:
+        """Human-readable breakdown for the output console."""
+        lines = ['Timings: ' + ', '.join(
+            f'{name} {_format_ms(ms)}' for name, ms in self.phases.items()
+        )]
+        
+        if self.commands:
+            line = f'  {len(self.commands)} command(s): {_format_ms(self.command_ms)}'
+            if self.usage is not None:
+                line += (
+                    f', CPU {_format_ms(self.usage.cpu_ms)}, '
+                    f'peak memory {_format_mb(self.usage.peak_memory_bytes)}, '
+                    f'read {_format_mb(self.usage.read_bytes)}, '
+                    f'written {_format_mb(self.usage.write_bytes)}'
+                )
+            lines.append(line)
+            slowest = sorted(self.commands, key=lambda c: c.total_ms, reverse=True)
+            for command in slowest[:self.SUMMARY_COMMANDS]:
+                lines.append(
+                    f'  {command.argv}: spawn {_format_ms(command.spawn_ms)}, '
+                    f'run {_format_ms(command.run_ms)} (exit {command.exit_code})'
+                )
+        
+        return '\n'.join(lines)
+
+
+class NullTimings(ExecutionTimings):
+    """
+    Collector used while timings are off.
+    Phases run untimed and commands are not recorded; only the total that
+    module_end reports is filled in.
+    """
+    
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        yield
+    
+    def add_command(self, timing: CommandTiming) -> None:
+        pass
+
+
+def _format_ms(ms: float) -> str:
+    return f'{ms / 1000:.1f} s' if ms >= 1000 else f'{ms:.0f} ms'
+
+
+def _format_mb(size: int) -> str:
+    return f'{size / (1024 * 1024):.1f} MB'
+
+
+def current_timings() -> Optional[ExecutionTimings]:
+    """Collector of the module run on this thread, if timings are on."""
+    return _current.get()
+
+
+@contextmanager
+def collect(timings: Optional[ExecutionTimings]) -> Iterator[Optional[ExecutionTimings]]:
+    """Make timings the collector for commands run by this thread in the block."""
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
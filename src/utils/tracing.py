@@ -0,0 +1,306 @@
+"""
+Tracing.
+Nested, context-propagated spans exported to a Chrome trace file.
+"""
+
+import atexit
+import functools
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO
+
+from src.utils.config import Config
+from src.utils.log_rotation import LogArchiver
+
+
+DEFAULT_TRACE_DIR = Path(__file__).parent.parent.parent / 'logs'
+TRACE_PREFIX = 'trace'
+
+# Marks a trace whose root span was not sampled, so its children are skipped too
+_NOT_SAMPLED = object()
+
+# Innermost open span of this thread or task
+_current: ContextVar[Any] = ContextVar('trace_span', default=None)
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_us: int = 0
+    duration_us: int = 0
+    thread_id: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    
+    def set(self, **attributes: Any) -> None:
+        """Add attributes, e.g. a command's exit code once it is known."""
+        self.attributes.update(attributes)
+
+
+class SpanExporter:
+    """Receives finished spans. This base class discards them."""
+    
+    def export(self, span: Span) -> None:
+        pass
+    
+    def flush(self) -> None:
+        pass
+    
+    def close(self) -> None:
+        pass
+
+
+class ChromeTraceExporter(SpanExporter):
+    """
+    Writes spans as complete events in the Chrome trace event format, which
+    chrome://tracing, Perfetto and speedscope open directly.
+    
+    The file uses the JSON array form, which viewers accept without the
+    closing bracket, so a trace cut short by a crash is still readable. It
+    is created by the first span and flushed whenever a trace ends.
+    """
+    
+    ARCHIVE_WAIT_SECONDS = 2.0
+    
+    def __init__(
+        self,
+        directory: Path = DEFAULT_TRACE_DIR,
+        keep_files: int = 20,
+        keep_bytes: int = 100 * 1024 * 1024
+    ) -> None:
+        """
+        Args:
+            directory: Folder for trace_<timestamp>.json
+            keep_files: Most earlier trace files kept (0 = no limit)
+            keep_bytes: Most bytes kept over earlier trace files (0 = no limit)
+        """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self._path = Path(directory) / f'{TRACE_PREFIX}_{timestamp}.json'
+        self._archiver = LogArchiver(
+            directory,
+            prefix=TRACE_PREFIX,
+            max_files=keep_files,
+            max_total_bytes=keep_bytes,
+            active=lambda: self._path,
+            suffix='.json'
+        )
+        self._file: Optional[TextIO] = None
+        self._separator = ''
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+    
+    @property
+    def path(self) -> Path:
+        return self._path
+    
+    def export(self, span: Span) -> None:
+        event = {
+            'name': span.name,
+            'cat': 'toolkit',
+            'ph': 'X',
+            'ts': span.start_us,
+            'dur': span.duration_us,
+            'pid': self._pid,
+            'tid': span.thread_id,
+            'args': {
+                'trace_id': span.trace_id,
+                'span_id': span.span_id,
+                'parent_id': span.parent_id,
+                **span.attributes
+            },
+        }
+        line = json.dumps(event, separators=(',', ':'), default=str)
+        
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self._file.write(self._separator + line)
+            self._separator = ',\n'
+    
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+    
+    def close(self) -> None:
+        """Close the file and stop the archiver, whose sweep walks the folder."""
+        with self._lock:
+            if self._file is not None:
+                self._file.write('\n]\n')
+                self._file.close()
+                self._file = None
+        
+        # Compression is resumed by the next session if it doesn't finish
+        self._archiver.wait(self.ARCHIVE_WAIT_SECONDS)
+    
+    def _open(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._path, 'w', encoding='utf-8', buffering=64 * 1024)
+        self._file.write('[\n')
+        self._separator = ''
+        atexit.register(self.close)
+        self._archiver.sweep()
+
+
+class Tracer:
+    """
+    Creates spans and hands finished ones to an exporter.
+    
+    Entry points such as a module run open a trace with trace(); the work
+    they call adds child spans with span(), which records nothing outside a
+    trace. Sampling is decided once per trace, at its root: a trace that is
+    not sampled costs a context variable lookup per span and exports nothing.
+    """
+    
+    def __init__(
+        self,
+        exporter: Optional[SpanExporter] = None,
+        sample_rate: float = 1.0,
+        rng: Callable[[], float] = random.random
+    ) -> None:
+        """
+        Args:
+            exporter: Destination of finished spans (None disables tracing)
+            sample_rate: Fraction of traces recorded, from 0 to 1
+            rng: Uniform random source in [0, 1)
+        """
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self._rng = rng
+    
+    @contextmanager
+    def trace(self, name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+        """
+        Time a block as the root span of a new trace, sampled at sample_rate.
+        Inside an open trace this is the same as span().
+        
+        Yields:
+            The span, or None when the trace is not recorded
+        """
+        if _current.get() is not None or self.exporter is None:
+            with self.span(name, **attributes) as span:
+                yield span
+            return
+        
+        if self._rng() >= self.sample_rate:
+            token = _current.set(_NOT_SAMPLED)
+            try:
+                yield None
+            finally:
+                _current.reset(token)
+            return
+        
+        try:
+            with self._record(name, None, attributes) as span:
+                yield span
+        finally:
+            self.exporter.flush()
+    
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+        """
+        Time a block as a child of the innermost open span. Outside a
+        recorded trace nothing is recorded.
+        
+        Yields:
+            The span, or None when the trace is not recorded
+        """
+        parent = _current.get()
+        if parent is None or parent is _NOT_SAMPLED or self.exporter is None:
+            yield None
+            return
+        
+        with self._record(name, parent, attributes) as span:
+            yield span
+    
+    @contextmanager
+    def _record(self, name: str, parent: Optional[Span], attributes: Dict[str, Any]) -> Iterator[Span]:
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            start_us=time.time_ns() // 1000,
+            thread_id=threading.get_native_id(),
+            attributes=attributes
+        )
+        token = _current.set(span)
+        started = time.perf_counter_ns()
+        try:
+            yield span
+        except BaseException as e:
+            span.attributes['error'] = type(e).__name__
+            raise
+        finally:
+            span.duration_us = (time.perf_counter_ns() - started) // 1000
+            _current.reset(token)
+            self.exporter.export(span)
+
+
+def current_span() -> Optional[Span]:
+    """Innermost recorded span of this thread, if any."""
+    span = _current.get()
+    return None if span is _NOT_SAMPLED else span
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    """Decorator running each call of a function as a span of the shared tracer."""
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_tracer().span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def read_trace(path: Path) -> List[Dict[str, Any]]:
+    """Span events of a trace file, including one that was not closed."""
+    text = path.read_text(encoding='utf-8').rstrip()
+    if not text.endswith(']'):
+        text += ']'
+    return json.loads(text)
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def _create_exporter() -> ChromeTraceExporter:
+    config = Config.load()
+    return ChromeTraceExporter(
+        keep_files=config.log_keep_files,
+        keep_bytes=int(config.log_keep_mb * 1024 * 1024)
+    )
+
+
+def get_tracer() -> Tracer:
+    """Get the shared tracer, configured from trace_sample_rate."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                rate = Config.load().trace_sample_rate
+                _tracer = Tracer(_create_exporter() if rate > 0 else None, sample_rate=rate)
+    return _tracer
+
+
+def set_sample_rate(rate: float) -> None:
+    """Change the sampling of the shared tracer, e.g. to trace every run."""
+    tracer = get_tracer()
+    with _tracer_lock:
+        if rate > 0 and tracer.exporter is None:
+            tracer.exporter = _create_exporter()
+        tracer.sample_rate = rate
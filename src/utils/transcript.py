@@ -0,0 +1,82 @@
+"""
+Session transcript file.
+Keeps console lines that no longer fit in the on-screen history.
+"""
+
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, TextIO
+
+from src.utils.log_rotation import LogArchiver
+
+
+class SessionTranscript:
+    """
+    Append-only text file for one session, created on first write.
+    Sessions that never overflow leave no file behind. Earlier sessions'
+    transcripts get the same compression and retention as the tool log.
+    """
+    
+    ARCHIVE_WAIT_SECONDS = 2.0
+    
+    def __init__(
+        self,
+        directory: Path,
+        prefix: str = 'console',
+        keep_files: int = 20,
+        keep_bytes: int = 100 * 1024 * 1024
+    ) -> None:
+        """
+        Args:
+            directory: Folder for the transcript (usually the log folder)
+            prefix: File name prefix; a timestamp is appended
+            keep_files: Most earlier transcripts kept (0 = no limit)
+            keep_bytes: Most bytes kept over earlier transcripts (0 = no limit)
+        """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self._path = Path(directory) / f'{prefix}_{timestamp}.log'
+        self._archiver = LogArchiver(
+            directory,
+            prefix=prefix,
+            max_files=keep_files,
+            max_total_bytes=keep_bytes,
+            active=lambda: self._path
+        )
+        self._file: Optional[TextIO] = None
+        self._lock = threading.Lock()
+        self._lines = 0
+    
+    @property
+    def path(self) -> Path:
+        return self._path
+    
+    @property
+    def lines_written(self) -> int:
+        return self._lines
+    
+    def write(self, lines: Iterable[str]) -> None:
+        """Append lines to the transcript."""
+        text = ''.join(f'{line}\n' for line in lines)
+        if not text:
+            return
+        
+        with self._lock:
+            if self._file is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self._path, 'a', encoding='utf-8')
+                # Earlier sessions' transcripts are compressed and pruned in the background
+                self._archiver.sweep()
+            self._file.write(text)
+            self._file.flush()
+            self._lines += text.count('\n')
+    
+    def close(self) -> None:
+        """Close the file and stop the archiver."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        
+        # Compression is resumed by the next session if it doesn't finish
+        self._archiver.wait(self.ARCHIVE_WAIT_SECONDS)
@@ -0,0 +1,182 @@
+"""
+Event loop watchdog.
+Detects stalls of the UI thread and records what it was doing.
+"""
+
+import sys
+import threading
+import time
+import traceback
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.utils.events import get_event_log
+from src.utils.logger import get_logger
+
+
+# Frames inside this folder are the application's own code
+SOURCE_ROOT = Path(__file__).parent.parent
+
+
+@dataclass
+class Stall:
+    """One period in which the event loop did not run."""
+    duration_ms: float
+    stack: str = ''
+    # Innermost application frame of the stack, 'file:line function'
+    site: str = ''
+
+
+@dataclass
+class StallStats:
+    """Event loop latency and stall counters for a session."""
+    beats: int = 0
+    stalls: int = 0
+    stalled_ms: float = 0.0
+    longest_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    # Stalls per duration bucket, keyed by lower bound in milliseconds
+    buckets: Dict[int, int] = field(default_factory=dict)
+    
+    def record(self, stall: Stall, bounds: List[int]) -> None:
+        self.stalls += 1
+        self.stalled_ms = round(self.stalled_ms + stall.duration_ms, 1)
+        self.longest_ms = max(self.longest_ms, stall.duration_ms)
+        bound = max(b for b in bounds if b <= stall.duration_ms)
+        self.buckets[bound] = self.buckets.get(bound, 0) + 1
+
+
+class StallWatchdog:
+    """
+    Measures event loop latency from a heartbeat.
+    
+    The event loop calls beat() from a timer every interval_ms. A monitor
+    thread checks the time since the last beat; once it exceeds threshold_ms
+    the loop is stalled, and the monitor captures the Python stack of the
+    loop's thread, which shows what is blocking it. When the loop runs the
+    next beat, the stall is logged with its duration and that stack, and
+    written to the event log as a ui_stall event. A stall still going on
+    after hang_ms is logged right away, so a frozen window leaves a trace.
+    """
+    
+    def __init__(
+        self,
+        threshold_ms: float = 250.0,
+        interval_ms: float = 50.0,
+        hang_ms: float = 5000.0,
+        thread_id: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Args:
+            threshold_ms: Time without a beat, beyond the interval, that counts as a stall
+            interval_ms: Heartbeat interval, also the monitor's polling interval
+            hang_ms: Stall length that is logged before the stall ends
+            thread_id: Thread running the event loop (defaults to the main thread)
+            clock: Monotonic clock returning seconds
+        """
+        self._logger = get_logger()
+        self.threshold_ms = threshold_ms
+        self.interval_ms = interval_ms
+        self.hang_ms = hang_ms
+        self._thread_id = thread_id if thread_id is not None else threading.main_thread().ident
+        self._clock = clock
+        self._bounds = sorted({int(threshold_ms), 1000, 5000, int(hang_ms)})
+        
+        self.stats = StallStats()
+        self._last_beat = clock()
+        self._stack = ''
+        self._site = ''
+        self._hang_reported = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def beat(self) -> Optional[Stall]:
+        """
+        Called by the event loop on each heartbeat.
+        
+        Returns:
+            The stall that just ended, if the loop was stalled
+        """
+        now = self._clock()
+        with self._lock:
+            latency_ms = max((now - self._last_beat) * 1000 - self.interval_ms, 0.0)
+            self._last_beat = now
+            stack, site = self._stack, self._site
+            self._stack = self._site = ''
+            self._hang_reported = False
+            self.stats.beats += 1
+            self.stats.max_latency_ms = max(self.stats.max_latency_ms, round(latency_ms, 1))
+            if latency_ms < self.threshold_ms:
+                return None
+            stall = Stall(duration_ms=round(latency_ms, 1), stack=stack, site=site)
+            self.stats.record(stall, self._bounds)
+        
+        self._logger.warning(
+            f'UI event loop stalled for {stall.duration_ms:.0f} ms'
+            + (f'; main thread was at:\n{stall.stack}' if stall.stack else '')
+        )
+        get_event_log().emit('ui_stall', **asdict(stall))
+        return stall
+    
+    def check(self) -> None:
+        """One monitor pass: capture the loop's stack if it is stalled."""
+        now = self._clock()
+        with self._lock:
+            stalled_ms = (now - self._last_beat) * 1000 - self.interval_ms
+            if stalled_ms < self.threshold_ms:
+                return
+            if not self._stack:
+                self._stack, self._site = self._capture()
+            report_hang = stalled_ms >= self.hang_ms and not self._hang_reported
+            if report_hang:
+                self._hang_reported = True
+            stack = self._stack
+        
+        if report_hang:
+            self._logger.error(
+                f'UI event loop not responding for {stalled_ms:.0f} ms; main thread is at:\n{stack}'
+            )
+    
+    def _capture(self) -> Tuple[str, str]:
+        frame = sys._current_frames().get(self._thread_id)
+        if frame is None:
+            return '', ''
+        frames = traceback.extract_stack(frame)
+        own = [f for f in frames if Path(f.filename).is_relative_to(SOURCE_ROOT)] or frames
+        site = f'{Path(own[-1].filename).name}:{own[-1].lineno} {own[-1].name}'
+        return ''.join(traceback.format_list(frames)).rstrip(), site
+    
+    def start(self) -> None:
+        """Start the monitor thread; the heartbeat must be driven separately."""
+        if self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            self._last_beat = self._clock()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name='StallWatchdog', daemon=True)
+        self._thread.start()
+    
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval_ms / 1000):
+            try:
+                self.check()
+            except Exception:
+                self._logger.exception('Watchdog check failed')
+    
+    def stop(self) -> StallStats:
+        """Stop the monitor and log the session's counters."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        
+        stats = self.stats
+        self._logger.info(
+            f'UI responsiveness: {stats.stalls} stall(s), {stats.stalled_ms:.0f} ms stalled, '
+            f'longest {stats.longest_ms:.0f} ms, max latency {stats.max_latency_ms:.0f} ms'
+        )
+        get_event_log().emit('ui_session', flush=True, **asdict(stats))
+        return stats
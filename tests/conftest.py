@@ -0,0 +1,30 @@
+"""
+Shared test fixtures.
+Keeps files written by the application's shared singletons out of the repository.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.core.journal import ExecutionJournal
+from src.utils.events import EventLog
+from src.utils.tracing import Tracer
+
+
+@pytest.fixture(autouse=True, scope='session')
+def isolated_output(tmp_path_factory):
+    """
+    Point the shared event log and execution journal at a temporary
+    directory for the session and turn off sampled tracing; tests of
+    tracing install their own tracer.
+    """
+    directory = tmp_path_factory.mktemp('logs')
+    event_log = EventLog(directory)
+    
+    with patch('src.utils.events._event_log', event_log), \
+            patch('src.core.journal._journal', ExecutionJournal(directory / 'journal')), \
+            patch('src.utils.tracing._tracer', Tracer(None)):
+        yield directory
+    
+    event_log.close()
@@ -0,0 +1,99 @@
+"""
+Unit tests for child process resource accounting.
+Runs real Python children through CommandRunner on this platform.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+from src.system.accounting import ProcessAccounting, ResourceUsage
+from src.system.commands import CommandRunner
+from src.utils.events import summarize
+from src.utils.timings import ExecutionTimings, collect
+
+
+# Holds 64 MB and spins for a quarter of a second of CPU time
+HEAVY_CHILD = (
+    'import time\n'
+    'block = bytearray(64 * 1024 * 1024)\n'
+    'end = time.process_time() + 0.25\n'
+    'while time.process_time() < end:\n'
+    '    pass\n'
+)
+
+
+class TestResourceAccounting(unittest.TestCase):
+    """Test measurement and aggregation of child process resources."""
+    
+    @unittest.skipUnless(hasattr(os, 'wait4'), 'needs wait4')
+    def test_child_usage_measured(self):
+        """CPU time and peak memory of the child reach the result and the collector."""
+        runner = CommandRunner()
+        timings = ExecutionTimings()
+        
+        with patch.object(runner, '_resolve_command', return_value=sys.executable), collect(timings):
+            heavy = runner.run(['python', '-c', HEAVY_CHILD])
+            light = runner.run(['python', '-c', 'pass'])
+        
+        self.assertTrue(heavy.success)
+        self.assertGreaterEqual(heavy.usage.cpu_ms, 200)
+        self.assertGreater(heavy.usage.peak_memory_bytes, 64 * 1024 * 1024)
+        self.assertLess(light.usage.cpu_ms, heavy.usage.cpu_ms)
+        
+        self.assertEqual(timings.usage.peak_memory_bytes, heavy.usage.peak_memory_bytes)
+        self.assertAlmostEqual(timings.usage.cpu_ms, heavy.usage.cpu_ms + light.usage.cpu_ms, delta=0.2)
+        self.assertIn('peak memory', timings.summary())
+    
+    def test_unsupported_platform_reports_nothing(self):
+        """The fallback accounting leaves usage unknown rather than zero."""
+        runner = CommandRunner()
+        
+        with patch.object(runner, '_resolve_command', return_value=sys.executable), \
+                patch.object(ProcessAccounting, 'for_platform', return_value=ProcessAccounting()):
+            result = runner.run(['python', '-c', 'pass'])
+        
+        self.assertTrue(result.success)
+        self.assertIsNone(result.usage)
+    
+    def test_missing_wait_hook_falls_back(self):
+        """Without Popen._try_wait, POSIX accounting is not used and usage stays unknown."""
+        with patch('src.system.accounting.PlatformCheck.is_windows', return_value=False), \
+                patch('src.system.accounting.has_wait_hook', return_value=False):
+            accounting = ProcessAccounting.for_platform()
+        
+        self.assertIs(type(accounting), ProcessAccounting)
+    
+    def test_summary_per_module(self):
+        """Resource totals are grouped per module and can order the summary."""
+        usage = ResourceUsage(user_cpu_ms=900.0, system_cpu_ms=100.0, peak_memory_bytes=300, read_bytes=10)
+        usage.add(ResourceUsage(user_cpu_ms=50.0, peak_memory_bytes=200, write_bytes=5))
+        self.assertEqual(
+            usage.to_dict(),
+            {'cpu_ms': 1050.0, 'user_cpu_ms': 950.0, 'system_cpu_ms': 100.0,
+             'peak_memory_bytes': 300, 'read_bytes': 10, 'write_bytes': 5}
+        )
+        
+        events = [
+            {'event': 'module_end', 'module_id': 'DNSFlushModule', 'status': 'success', 'duration_ms': 5000.0,
+             'cpu_ms': 20.0},
+            {'event': 'module_end', 'module_id': 'TempCleanupModule', 'status': 'success', 'duration_ms': 900.0,
+             **usage.to_dict()},
+            {'event': 'module_end', 'module_id': 'TempCleanupModule', 'status': 'success', 'duration_ms': 800.0,
+             'cpu_ms': 500.0, 'peak_memory_bytes': 700},
+        ]
+        
+        by_duration = summarize(events)
+        self.assertEqual(by_duration[0]['module'], 'DNSFlushModule')
+        
+        by_cpu = summarize(events, sort='cpu')
+        self.assertEqual(by_cpu[0]['module'], 'TempCleanupModule')
+        self.assertEqual(
+            {k: by_cpu[0][k] for k in ('cpu_ms', 'peak_memory_bytes', 'read_bytes')},
+            {'cpu_ms': 1550.0, 'peak_memory_bytes': 700, 'read_bytes': 10}
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Unit tests for the benchmark helpers.
+Covers -X importtime parsing, budget evaluation, baseline comparison and the
+fake module backend, not the measurements.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.common import check_budgets, compare_to_baseline
+from benchmarks.orchestration import FakeBackend, module_specs
+from benchmarks.startup import group_import_times, parse_importtime
+
+
+IMPORTTIME_OUTPUT = '''import time: self [us] | cumulative | imported package
+import time:       132 |        132 |   _io
+import time:       296 |        757 | _frozen_importlib_external
+import time:       178 |        178 |   src
+import time:      2000 |       2000 |     src.ui.styles
+import time:      1500 |       3500 |   src.ui.main_window
+some unrelated warning
+import time:       500 |       4178 | src.app
+'''
+
+
+class TestBenchmarkHelpers(unittest.TestCase):
+    """Test importtime parsing and budget checks."""
+    
+    def test_parse_importtime(self):
+        """Depth follows indentation and self times are grouped per package."""
+        records = parse_importtime(IMPORTTIME_OUTPUT)
+        
+        self.assertEqual([r.name for r in records if r.depth == 0], ['_frozen_importlib_external', 'src.app'])
+        self.assertEqual(next(r.depth for r in records if r.name == 'src.ui.styles'), 2)
+        
+        groups = group_import_times(records)
+        self.assertAlmostEqual(groups['src.ui'], 3.5)
+        self.assertAlmostEqual(groups['src'], 0.178)
+    
+    def test_budgets(self):
+        """Absolute limits and baseline regressions are both reported."""
+        budgets = {
+            'max_ms': {'window.total': 1000},
+            'regression': 0.25,
+            'tracked': ['imports.src.cli.total'],
+        }
+        baseline = {'imports.src.cli.total': 100.0, 'window.total': 100.0}
+        
+        self.assertEqual(check_budgets({'imports.src.cli.total': 120.0, 'window.total': 900.0}, budgets, baseline), [])
+        
+        failures = check_budgets({'imports.src.cli.total': 130.0, 'window.total': 1100.0}, budgets, baseline)
+        self.assertEqual(len(failures), 2)
+        self.assertTrue(failures[0].startswith('window.total'))
+        self.assertIn('30% over', failures[1])
+    
+    def test_compare_to_baseline(self):
+        """Changes beyond the threshold are flagged either way; unmatched metrics are listed."""
+        baseline = {'a': 10.0, 'b': 10.0, 'c': 10.0, 'gone': 1.0}
+        metrics = {'a': 11.0, 'b': 13.0, 'c': 7.0, 'added': 2.0}
+        
+        rows = {line.split()[0]: line for line in compare_to_baseline(metrics, baseline, 0.2)[1:]}
+        self.assertEqual(rows['a'].split()[1:], ['10.000', '11.000', '+10%'])
+        self.assertTrue(rows['b'].endswith('+30%  REGRESSION'))
+        self.assertTrue(rows['c'].endswith('-30%  IMPROVED'))
+        self.assertTrue(rows['added'].endswith('new'))
+        self.assertTrue(rows['gone'].endswith('removed'))
+    
+    def test_fake_backend_replaces_commands(self):
+        """A module run under the fake backend succeeds without spawning anything."""
+        backend = FakeBackend('uniform', latency_ms=0.5, seed=1)
+        specs = {spec.module_id: spec for spec in module_specs()}
+        
+        with tempfile.TemporaryDirectory() as directory, backend.installed(Path(directory)):
+            result = specs['DNSFlushModule'].load_class()().execute()
+        
+        self.assertTrue(result.success)
+        calls, waited_ms = backend.reset()
+        self.assertEqual(calls, 1)
+        self.assertGreater(waited_ms, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Unit tests for module capability probing.
+Uses a fixed service table and snapshot instead of the live system.
+"""
+
+import dataclasses
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.core.capabilities import CapabilityProbe
+from src.core.executor import ExecutionResult, ExecutionStatus
+from src.modules.base import BaseModule, ModuleInfo
+from src.modules.registry import ModuleRegistry
+from src.system.services import ServiceInventory, ServiceRecord
+from src.system.snapshot import SystemSnapshot
+
+
+class RequirementModule(BaseModule):
+    """Module with configurable requirements."""
+    
+    def __init__(self, requires_admin=False, services=(), paths=()) -> None:
+        super().__init__()
+        self._requires_admin = requires_admin
+        self.required_services = list(services)
+        self.required_paths = list(paths)
+    
+    @property
+    def info(self) -> ModuleInfo:
+        return ModuleInfo(
+            name='Requirement Module',
+            description='Module with requirements',
+            category='Test',
+            requires_admin=self._requires_admin,
+            requires_reboot=False,
+            is_critical=False
+        )
+    
+    def _execute(self) -> ExecutionResult:
+        return ExecutionResult(status=ExecutionStatus.SUCCESS, message='done')
+
+
+class BrokenModule(RequirementModule):
+    """Module whose requirement check raises."""
+    
+    def missing_requirements(self):
+        raise RuntimeError('probe exploded')
+
+
+class TestCapabilityProbe(unittest.TestCase):
+    """Test requirement evaluation and result delivery."""
+    
+    def setUp(self):
+        snapshot = SystemSnapshot.capture()
+        snapshot = dataclasses.replace(snapshot, is_admin=False, is_compatible=True)
+        inventory = ServiceInventory([
+            ServiceRecord(name='wuauserv', display_name='Windows Update', state='RUNNING'),
+        ])
+        
+        for target in ('src.modules.base', 'src.core.capabilities'):
+            for name, value in (('get_snapshot', snapshot), ('get_service_inventory', inventory)):
+                patcher = patch(f'{target}.{name}', return_value=value)
+                patcher.start()
+                self.addCleanup(patcher.stop)
+        
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+    
+    def test_reports_missing_requirements(self):
+        """Admin rights, services and paths each produce a reason."""
+        modules = {
+            'ok': RequirementModule(services=['wuauserv'], paths=[self._tmp.name]),
+            'admin': RequirementModule(requires_admin=True),
+            'service': RequirementModule(services=['WSearch']),
+            'path': RequirementModule(paths=[self._tmp.name + '/missing']),
+        }
+        results = CapabilityProbe(modules).run()
+        
+        self.assertTrue(results['ok'].available)
+        self.assertEqual(results['ok'].tooltip, '')
+        self.assertEqual(results['admin'].reasons, ('Administrator privileges required',))
+        self.assertEqual(results['service'].reasons, ('Service WSearch not found',))
+        self.assertIn('Path not found', results['path'].tooltip)
+    
+    def test_results_delivered_per_module(self):
+        """Every module gets a callback, even when its check fails."""
+        modules = {f'module{i}': RequirementModule() for i in range(6)}
+        modules['broken'] = BrokenModule()
+        received = []
+        
+        CapabilityProbe(modules, max_workers=3).run(on_result=received.append)
+        
+        self.assertEqual({c.module_id for c in received}, set(modules))
+        broken = next(c for c in received if c.module_id == 'broken')
+        self.assertFalse(broken.available)
+        self.assertIn('probe exploded', broken.tooltip)
+    
+    
+    def test_specs_probe_without_loading_modules(self):
+        """Probing registry specs answers from metadata and creates no module."""
+        registry = ModuleRegistry(load_entry_points=False)
+        
+        with patch('src.modules.base.has_network_adapter', return_value=False):
+            results = CapabilityProbe(registry.specs()).run()
+        
+        self.assertEqual(set(results), set(registry))
+        self.assertFalse(any(registry.is_loaded(module_id) for module_id in registry))
+        self.assertIn('Administrator privileges required', results['DNSFlushModule'].reasons)
+        self.assertIn('Service WSearch not found', results['SearchIndexModule'].reasons)
+        self.assertIn('No network adapters found', results['NetworkAdapterModule'].reasons)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Unit tests for the command line runner.
+Runs stand-in modules through the CLI and checks its JSON output and exit codes.
+"""
+
+import dataclasses
+import io
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.cli import EventWriter, cmd_list, cmd_run
+from src.core.executor import ExecutionResult, ExecutionStatus
+from src.modules.base import BaseModule, ModuleInfo
+from src.modules.registry import MANIFEST, ModuleRegistry, ModuleSpec
+from src.system.snapshot import SystemSnapshot
+
+
+def _info(name: str, is_critical: bool = False) -> ModuleInfo:
+    return ModuleInfo(
+        name=name,
+        description=f'{name} for CLI tests',
+        category='Test',
+        requires_admin=False,
+        requires_reboot=False,
+        is_critical=is_critical
+    )
+
+
+class PassingModule(BaseModule):
+    """Module that logs a step and succeeds."""
+    
+    @property
+    def info(self) -> ModuleInfo:
+        return _info('Passing Module')
+    
+    def _execute(self) -> ExecutionResult:
+        self._logger.info('Doing the work')
+        return ExecutionResult(status=ExecutionStatus.SUCCESS, message='done')
+
+
+class FailingModule(BaseModule):
+    """Module that always fails."""
+    
+    @property
+    def info(self) -> ModuleInfo:
+        return _info('Failing Module')
+    
+    def _execute(self) -> ExecutionResult:
+        return ExecutionResult(status=ExecutionStatus.FAILED, message='broken')
+
+
+class TestCommandLine(unittest.TestCase):
+    """Test listing, running and exit code mapping."""
+    
+    def setUp(self):
+        self.registry = ModuleRegistry(
+            specs=[
+                ModuleSpec('PassingModule', 'tests.test_cli:PassingModule', _info('Passing Module')),
+                ModuleSpec('FailingModule', 'tests.test_cli:FailingModule', _info('Failing Module')),
+                ModuleSpec('CriticalModule', 'tests.test_cli:PassingModule', _info('Critical Module', True)),
+            ],
+            load_entry_points=False
+        )
+        
+        self.snapshot = dataclasses.replace(SystemSnapshot.capture(), is_compatible=True)
+        for target, value in (
+            ('src.cli.get_snapshot', MagicMock(return_value=self.snapshot)),
+            ('src.core.validator.Validator.validate_all', MagicMock(return_value=MagicMock(valid=True))),
+        ):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def _run(self, module_ids, **kwargs):
+        out = io.StringIO()
+        options = {'confirmed': False, 'stop_on_failure': False, **kwargs}
+        code = cmd_run(self.registry, module_ids, writer=EventWriter(out), **options)
+        return code, [json.loads(line) for line in out.getvalue().splitlines()]
+    
+    def test_list_does_not_import_ui(self):
+        """Listing modules loads neither Qt nor the UI package."""
+        script = (
+            'import contextlib, io, json, sys\n'
+            'from src.cli import main\n'
+            'out = io.StringIO()\n'
+            'with contextlib.redirect_stdout(out):\n'
+            '    main(["list"])\n'
+            'ui = [m for m in sys.modules if m.startswith(("src.ui", "PySide6"))]\n'
+            'print(len(json.loads(out.getvalue())["modules"]), ui)\n'
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', script],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent.parent
+        ).stdout.strip()
+        
+        self.assertEqual(output, f'{len(MANIFEST)} []')
+    
+    def test_list_check_does_not_load_modules(self):
+        """Capabilities are probed from the specs, so no module is instantiated."""
+        out = io.StringIO()
+        with patch('src.modules.base.get_snapshot', MagicMock(return_value=self.snapshot)):
+            code = cmd_list(self.registry, tab=None, check=True, out=out)
+        
+        self.assertEqual(code, 0)
+        modules = json.loads(out.getvalue())['modules']
+        self.assertEqual({m['module_id'] for m in modules}, set(self.registry))
+        self.assertTrue(all('available' in m for m in modules))
+        self.assertFalse(any(self.registry.is_loaded(m) for m in self.registry))
+    
+    def test_streams_progress_and_summary(self):
+        """A successful run streams start, progress, result and summary events."""
+        code, events = self._run(['PassingModule'])
+        
+        self.assertEqual(code, 0)
+        self.assertEqual(events[0], {'event': 'started', 'module_id': 'PassingModule', 'name': 'Passing Module'})
+        self.assertIn('Doing the work', [e['message'] for e in events if e['event'] == 'progress'])
+        self.assertEqual(events[-2]['event'], 'finished')
+        self.assertEqual(events[-1]['status'], 'success')
+    
+    def test_exit_code_follows_worst_result(self):
+        """Unconfirmed critical modules are cancelled, and failures outrank cancellations."""
+        code, events = self._run(['PassingModule', 'CriticalModule'])
+        self.assertEqual(code, 3)
+        self.assertNotIn('CriticalModule', [e.get('module_id') for e in events if e['event'] == 'started'])
+        
+        code, events = self._run(['FailingModule', 'PassingModule'], stop_on_failure=True)
+        self.assertEqual(code, 1)
+        self.assertEqual(
+            [r['status'] for r in events[-1]['results']],
+            ['failed', 'cancelled']
+        )
+    
+    def test_unknown_module_is_usage_error(self):
+        """Unknown ids are rejected before anything runs."""
+        code, events = self._run(['PassingModule', 'NoSuchModule'])
+        
+        self.assertEqual(code, 2)
+        self.assertEqual([e['event'] for e in events], ['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
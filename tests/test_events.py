@@ -0,0 +1,88 @@
+"""
+Unit tests for the structured event log.
+Covers command signatures, context binding, the writer and the summaries.
+"""
+
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.utils.events import (
+    EventLog, argv_signature, bind, event_files, percentile, read_events, summarize
+)
+
+
+class TestEventLog(unittest.TestCase):
+    """Test event writing, reading and aggregation."""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.directory = Path(self._tmp.name)
+    
+    def test_argv_signature(self):
+        """Values are masked so runs with different paths group together."""
+        self.assertEqual(argv_signature(['ipconfig', '/flushdns']), 'ipconfig /flushdns')
+        self.assertEqual(
+            argv_signature([r'C:\Windows\System32\dism.exe', '/Online', '/Cleanup-Image', r'/Source:D:\sxs']),
+            'dism /online /cleanup-image /source:*'
+        )
+        self.assertEqual(
+            argv_signature(['powershell', '-NoProfile', '-Command', 'Get-Service | Stop-Service']),
+            'powershell -noprofile -command *'
+        )
+        self.assertEqual(argv_signature(['net', 'stop', 'wuauserv', '42']), 'net stop wuauserv *')
+    
+    def test_bound_fields_and_buffering(self):
+        """Context fields are added to events; nothing is created before the first one."""
+        log = EventLog(self.directory, flush_interval=3600)
+        self.addCleanup(log.close)
+        self.assertFalse(log.path.exists())
+        
+        with bind(module_id='DNSFlushModule', run_id='abc'):
+            log.emit('module_start')
+            with bind(step='flush'):
+                log.emit('command', argv='ipconfig /flushdns', exit_code=0, duration_ms=12.5)
+        log.emit('module_end', flush=True, status='success')
+        
+        events = list(read_events([log.path]))
+        self.assertEqual([e['event'] for e in events], ['module_start', 'command', 'module_end'])
+        self.assertEqual(events[1]['step'], 'flush')
+        self.assertEqual(events[1]['run_id'], 'abc')
+        self.assertNotIn('module_id', events[2])
+        
+        # The archiver's sweep must be done before the folder is removed
+        log.close()
+        self.assertIsNone(log._file)
+        self.assertFalse(log._archiver._thread.is_alive())
+    
+    def test_summarize_percentiles(self):
+        """Durations are grouped per command across plain and compressed files."""
+        lines = [
+            {'event': 'command', 'module_id': 'A', 'argv': 'sfc /scannow', 'exit_code': 0, 'duration_ms': float(ms)}
+            for ms in range(1, 101)
+        ]
+        lines.append({'event': 'command', 'module_id': 'B', 'argv': 'net stop *', 'exit_code': 2, 'duration_ms': 5.0})
+        
+        plain = self.directory / 'events_1.jsonl'
+        plain.write_text('\n'.join(json.dumps(e) for e in lines[:50]) + '\n{"torn', encoding='utf-8')
+        with gzip.open(self.directory / 'events_0.jsonl.gz', 'wt', encoding='utf-8') as f:
+            f.write('\n'.join(json.dumps(e) for e in lines[50:]))
+        
+        groups = summarize(read_events(event_files(self.directory)), by='command')
+        self.assertEqual([g['command'] for g in groups], ['sfc /scannow', 'net stop *'])
+        self.assertEqual(
+            {k: groups[0][k] for k in ('count', 'failures', 'p50_ms', 'p90_ms', 'p99_ms', 'max_ms')},
+            {'count': 100, 'failures': 0, 'p50_ms': 50.0, 'p90_ms': 90.0, 'p99_ms': 99.0, 'max_ms': 100.0}
+        )
+        self.assertEqual(groups[1]['failures'], 1)
+        
+        only_b = summarize(read_events(event_files(self.directory)), by='command', module_id='B')
+        self.assertEqual(len(only_b), 1)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
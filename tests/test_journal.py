@@ -0,0 +1,157 @@
+"""
+Unit tests for the execution journal.
+Tests write-ahead replay, resume of interrupted runs and compensation.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.core.executor import ExecutionResult, ExecutionStatus, ModuleExecutor
+from src.core.journal import ExecutionJournal, JournalRun, RunState
+from src.modules.base import BaseModule, ModuleInfo
+from tests.test_modules import MockModule
+
+
+class StepModule(BaseModule):
+    """Module with journaled steps that can be made to crash."""
+    
+    def __init__(self, journal: ExecutionJournal, crash_at: str = '') -> None:
+        super().__init__()
+        self._journal = journal
+        self.crash_at = crash_at
+        self.calls = []
+    
+    @property
+    def info(self) -> ModuleInfo:
+        return ModuleInfo(
+            name='Step Module',
+            description='A journaled test module',
+            category='Test',
+            requires_admin=False,
+            requires_reboot=False,
+            is_critical=False
+        )
+    
+    def _action(self, name: str):
+        def run() -> str:
+            if name == self.crash_at:
+                raise KeyboardInterrupt('simulated crash')
+            self.calls.append(name)
+            return f'[OK] {name}'
+        return run
+    
+    def _execute(self) -> ExecutionResult:
+        lines = [self._step(name, self._action(name)) for name in ('stop', 'clear', 'start')]
+        return ExecutionResult(
+            status=ExecutionStatus.SUCCESS,
+            message='Done',
+            details='\n'.join(lines)
+        )
+    
+    def _compensate(self, run: JournalRun) -> str:
+        self.calls.append('compensate')
+        return '[OK] rolled back'
+
+
+class TestExecutionJournal(unittest.TestCase):
+    """Test journal persistence and replay."""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.journal = ExecutionJournal(Path(self._tmp.name))
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _crash(self, crash_at: str) -> StepModule:
+        module = StepModule(self.journal, crash_at=crash_at)
+        with patch.object(module._validator, 'validate_all') as mock_validate:
+            mock_validate.return_value = MagicMock(valid=True)
+            with self.assertRaises(KeyboardInterrupt):
+                module.execute()
+        return module
+    
+    def test_completed_run_leaves_no_journal(self):
+        """Finished runs discard their journal file."""
+        module = StepModule(self.journal)
+        with patch.object(module._validator, 'validate_all') as mock_validate:
+            mock_validate.return_value = MagicMock(valid=True)
+            result = module.execute()
+        
+        self.assertTrue(result.success)
+        self.assertEqual(self.journal.pending_runs(), [])
+    
+    def test_run_without_steps_writes_nothing(self):
+        """Modules that journal no steps create no journal file."""
+        directory = Path(self._tmp.name) / 'runs'
+        module = MockModule()
+        module._journal = ExecutionJournal(directory)
+        with patch.object(module._validator, 'validate_all') as mock_validate:
+            mock_validate.return_value = MagicMock(valid=True)
+            result = module.execute()
+        
+        self.assertTrue(result.success)
+        self.assertFalse(directory.exists())
+    
+    def test_interrupted_run_is_replayed(self):
+        """A crash mid-run leaves committed and uncommitted steps on disk."""
+        self._crash('clear')
+        
+        runs = self.journal.pending_runs()
+        self.assertEqual(len(runs), 1)
+        run = runs[0]
+        self.assertEqual(run.state, RunState.RUNNING)
+        self.assertEqual(run.module_id, 'StepModule')
+        self.assertEqual(run.last_committed_step, 'stop')
+        self.assertEqual(run.uncommitted_steps, ['clear'])
+    
+    def test_torn_record_is_ignored(self):
+        """A partial trailing line from a crash does not break replay."""
+        self._crash('start')
+        run = self.journal.pending_runs()[0]
+        with open(run.path, 'a', encoding='utf-8') as f:
+            f.write('{"type":"step_com')
+        
+        replayed = self.journal.load(run.path)
+        self.assertEqual(set(replayed.committed_steps), {'stop', 'clear'})
+    
+    def test_resume_skips_committed_steps(self):
+        """Resuming runs only the steps that did not commit."""
+        self._crash('clear')
+        run = self.journal.pending_runs()[0]
+        
+        module = StepModule(self.journal)
+        with patch.object(module._validator, 'validate_all') as mock_validate:
+            mock_validate.return_value = MagicMock(valid=True)
+            result = module.execute(resume=run)
+        
+        self.assertTrue(result.success)
+        self.assertEqual(module.calls, ['clear', 'start'])
+        self.assertIn('[OK] stop', result.details)
+        self.assertEqual(self.journal.pending_runs(), [])
+    
+    def test_executor_recovers_with_compensation(self):
+        """Executor rolls back interrupted runs when asked to."""
+        self._crash('start')
+        module = StepModule(self.journal)
+        executor = ModuleExecutor()
+        results = []
+        
+        scheduled = executor.recover(
+            {'StepModule': module},
+            journal=self.journal,
+            on_complete=lambda module_id, result: results.append((module_id, result)),
+            compensate_only=True
+        )
+        executor.shutdown(wait=True)
+        
+        self.assertEqual(scheduled, ['StepModule'])
+        self.assertEqual(module.calls, ['compensate'])
+        self.assertTrue(results[0][1].success)
+        self.assertEqual(self.journal.pending_runs(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Unit tests for the asynchronous logging pipeline.
+Fills a small queue with the listener stopped to exercise the overflow policies.
+"""
+
+import logging
+import queue
+import unittest
+
+from src.utils.log_pipeline import (
+    OVERFLOW_BLOCK, OVERFLOW_DROP_DEBUG, OVERFLOW_SAMPLE,
+    BatchingQueueListener, BoundedQueueHandler
+)
+
+
+class RecordingHandler(logging.Handler):
+    """Keeps handled records and counts flushes."""
+    
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.flushes = 0
+    
+    def emit(self, record):
+        self.records.append(record)
+    
+    def flush(self):
+        self.flushes += 1
+
+
+class FullQueue(queue.Queue):
+    """Always full: records that would wait for room are collected instead."""
+    
+    def __init__(self):
+        super().__init__()
+        self.waited = []
+    
+    def put(self, item, block=True, timeout=None):
+        if not block:
+            raise queue.Full
+        self.waited.append(item)
+
+
+def make_record(level, message):
+    return logging.LogRecord('test', level, __file__, 0, message, None, None)
+
+
+class TestLogPipeline(unittest.TestCase):
+    """Test overflow policies, batching and draining."""
+    
+    def test_drop_debug_when_full(self):
+        """A full queue drops DEBUG records and counts them."""
+        log_queue = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(log_queue, OVERFLOW_DROP_DEBUG)
+        
+        handler.handle(make_record(logging.DEBUG, 'a'))
+        handler.handle(make_record(logging.DEBUG, 'b'))
+        handler.handle(make_record(logging.DEBUG, 'c'))
+        
+        self.assertEqual(log_queue.qsize(), 2)
+        self.assertEqual(handler.take_dropped(), 1)
+        self.assertEqual(handler.take_dropped(), 0)
+    
+    def test_sample_keeps_one_in_n(self):
+        """Sampling keeps every n-th overflowing record; warnings always wait."""
+        log_queue = FullQueue()
+        handler = BoundedQueueHandler(log_queue, OVERFLOW_SAMPLE, sample_every=3)
+        
+        for i in range(6):
+            handler.handle(make_record(logging.INFO, str(i)))
+        handler.handle(make_record(logging.WARNING, 'warn'))
+        
+        self.assertEqual([r.getMessage() for r in log_queue.waited], ['2', '5', 'warn'])
+        self.assertEqual(handler.take_dropped(), 4)
+    
+    def test_listener_drains_in_batches(self):
+        """Stopping the listener writes every queued record and the drop warning."""
+        log_queue = queue.Queue(maxsize=100)
+        source = BoundedQueueHandler(log_queue, OVERFLOW_BLOCK)
+        target = RecordingHandler()
+        listener = BatchingQueueListener(log_queue, target, batch_size=50, source=source)
+        
+        for i in range(100):
+            source.handle(make_record(logging.INFO, str(i)))
+        source._dropped = 2
+        listener.start()
+        listener.stop()
+        
+        messages = [r.getMessage() for r in target.records]
+        self.assertEqual(messages[:50], [str(i) for i in range(50)])
+        self.assertIn('dropped 2 record(s)', messages[50])
+        self.assertEqual(messages[51:], [str(i) for i in range(50, 100)])
+        self.assertEqual(target.flushes, listener.batches)
+        self.assertLessEqual(listener.batches, 4)
+    
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            BoundedQueueHandler(queue.Queue(), 'discard')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Unit tests for log rotation and retention.
+Writes into a temporary directory.
+"""
+
+import gzip
+import logging
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.utils.log_rotation import STALE_SECONDS, LogArchiver, RotatingLogHandler
+
+
+def write_file(path, size, age_seconds=0):
+    path.write_bytes(b'x' * size)
+    if age_seconds:
+        stamp = time.time() - age_seconds
+        os.utime(path, (stamp, stamp))
+
+
+class TestLogRotation(unittest.TestCase):
+    """Test lazy creation, rotation, compression and retention."""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.directory = Path(self._tmp.name) / 'logs'
+    
+    def test_rotates_by_size_and_compresses(self):
+        """The file appears on first write and full files are gzipped."""
+        active = self.directory / 'toolkit_1.log'
+        archiver = LogArchiver(self.directory, active=lambda: active)
+        handler = RotatingLogHandler(active, max_bytes=100, max_age_seconds=0, archiver=archiver)
+        self.addCleanup(handler.close)
+        self.assertFalse(self.directory.exists())
+        
+        for i in range(12):
+            handler.handle(logging.makeLogRecord({'msg': f'line {i:02d} ' + 'x' * 12}))
+        handler.flush_batch()
+        self.assertTrue(archiver.wait(5))
+        
+        rotated = sorted(p.name for p in self.directory.iterdir())
+        self.assertEqual(rotated, ['toolkit_1.1.log.gz', 'toolkit_1.2.log.gz', 'toolkit_1.log'])
+        with gzip.open(self.directory / 'toolkit_1.1.log.gz', 'rt') as f:
+            self.assertTrue(f.read().startswith('line 00'))
+    
+    def test_retention_caps(self):
+        """The oldest archived files beyond the count or byte cap are removed."""
+        self.directory.mkdir()
+        for i in range(5):
+            write_file(self.directory / f'toolkit_{i}.log.gz', 100, age_seconds=100 * (5 - i))
+        
+        LogArchiver(self.directory, max_files=3, max_total_bytes=0).enforce_retention()
+        self.assertEqual(sorted(p.name for p in self.directory.iterdir()),
+                         ['toolkit_2.log.gz', 'toolkit_3.log.gz', 'toolkit_4.log.gz'])
+        
+        LogArchiver(self.directory, max_files=0, max_total_bytes=250).enforce_retention()
+        self.assertEqual(sorted(p.name for p in self.directory.iterdir()),
+                         ['toolkit_3.log.gz', 'toolkit_4.log.gz'])
+    
+    def test_sweep_skips_recent_files(self):
+        """Old plain logs are compressed; recent ones may belong to a live process."""
+        self.directory.mkdir()
+        write_file(self.directory / 'toolkit_old.log', 10, age_seconds=STALE_SECONDS + 60)
+        write_file(self.directory / 'toolkit_new.log', 10)
+        write_file(self.directory / 'console_old.log', 10, age_seconds=STALE_SECONDS + 60)
+        
+        archiver = LogArchiver(self.directory)
+        archiver.sweep()
+        self.assertTrue(archiver.wait(5))
+        
+        self.assertEqual(sorted(p.name for p in self.directory.iterdir()),
+                         ['console_old.log', 'toolkit_new.log', 'toolkit_old.log.gz'])
+    
+    
+    def test_archiver_survives_os_errors(self):
+        """A folder that cannot be listed is logged and later work still runs."""
+        self.directory.mkdir()
+        write_file(self.directory / 'toolkit_old.log', 10, age_seconds=STALE_SECONDS + 60)
+        archiver = LogArchiver(self.directory)
+        
+        with patch.object(Path, 'glob', side_effect=FileNotFoundError('share dropped')), \
+                self.assertLogs('WinRepairToolkit.archiver', level='WARNING'):
+            archiver.sweep()
+            self.assertTrue(archiver.wait(5))
+        
+        with patch.object(LogArchiver, 'compress', side_effect=[RuntimeError('boom'), None]) as compress, \
+                self.assertLogs('WinRepairToolkit.archiver', level='ERROR'):
+            archiver.submit(self.directory / 'toolkit_1.log')
+            archiver.submit(self.directory / 'toolkit_2.log')
+            self.assertTrue(archiver.wait(5))
+        self.assertEqual(compress.call_count, 2)
+        
+        archiver.sweep()
+        self.assertTrue(archiver.wait(5))
+        self.assertTrue((self.directory / 'toolkit_old.log.gz').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
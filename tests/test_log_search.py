@@ -0,0 +1,129 @@
+"""
+Unit tests for log search and tail.
+Builds small log files in a temporary directory with a tiny index block size.
+"""
+
+import gzip
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.utils.log_search import LogIndex, get_index, log_files, parse_time, read_from, search, tail
+
+
+RUN_A = 'aaaaaaaaaaaa'
+RUN_B = 'bbbbbbbbbbbb'
+
+
+def log_line(minute: int, level: str, message: str, run_id: str = '') -> str:
+    run = f'[{run_id}] ' if run_id else ''
+    return f'2026-10-19 10:{minute:02d}:00 | {level:<8} | WinRepairToolkit | {run}{message}\n'
+
+
+class TestLogSearch(unittest.TestCase):
+    """Test indexing, filtered search and tailing."""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.directory = Path(self._tmp.name)
+        
+        lines = []
+        for minute in range(60):
+            run_id = RUN_A if minute < 30 else RUN_B
+            lines.append(log_line(minute, 'INFO', f'step {minute} done', run_id))
+            if minute == 45:
+                lines.append(log_line(minute, 'ERROR', 'Command failed', run_id))
+                lines.append('Traceback (most recent call last):\n')
+                lines.append('  OSError: access denied\n')
+        self.path = self.directory / 'toolkit_20261019_100000.log'
+        self.path.write_text(''.join(lines), encoding='utf-8')
+        
+        patcher = patch.object(LogIndex, 'BLOCK_SIZE', 512)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_index_blocks(self):
+        """Blocks record time ranges and run ids, and growth is indexed incrementally."""
+        index = LogIndex(self.path)
+        index.refresh()
+        
+        self.assertGreater(len(index.blocks), 5)
+        self.assertEqual(index.blocks[0].first_time, '2026-10-19 10:00:00')
+        self.assertEqual(index.blocks[-1].last_time, '2026-10-19 10:59:00')
+        self.assertEqual(index.indexed_bytes, self.path.stat().st_size)
+        
+        since = parse_time('2026-10-19 10:50')
+        self.assertTrue(all(b.last_time >= since for b in index.candidates(since=since)))
+        self.assertTrue(all(RUN_B in b.run_ids for b in index.candidates(run_id=RUN_B)))
+        
+        blocks = len(index.blocks)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(log_line(59, 'WARNING', 'appended'))
+            f.write('2026-10-19 10:59:00 | INFO     | partial')
+        index.refresh()
+        self.assertEqual(len(index.blocks), blocks + 1)
+        self.assertLess(index.indexed_bytes, self.path.stat().st_size)
+    
+    def test_search_filters(self):
+        """Query, level, run and time filters combine; tracebacks belong to their record."""
+        def texts(**filters):
+            return [m.text for m in search(self.path, **filters)]
+        
+        self.assertEqual(len(texts()), 61)
+        self.assertEqual(texts(min_level='ERROR'), [log_line(45, 'ERROR', 'Command failed', RUN_B).rstrip('\n')])
+        self.assertEqual(texts(query='access DENIED'), ['  OSError: access denied'])
+        self.assertEqual(texts(query='access denied', run_id=RUN_A), [])
+        self.assertEqual(len(texts(run_id=RUN_A)), 30)
+        
+        window = texts(since=parse_time('2026-10-19 10:10'), until=parse_time('2026-10-19 10:12'))
+        self.assertEqual([t.split(' | ')[-1] for t in window],
+                         [f'[{RUN_A}] step {m} done' for m in (10, 11, 12)])
+    
+    def test_compressed_segments_and_listing(self):
+        """Rotated .gz segments are searched line by line and listed oldest first."""
+        segment = self.directory / 'toolkit_20261019_090000.1.log.gz'
+        with gzip.open(segment, 'wt', encoding='utf-8') as f:
+            f.write(log_line(1, 'WARNING', 'disk almost full'))
+            f.write(log_line(2, 'INFO', 'ok'))
+        older = segment.stat().st_mtime - 60
+        os.utime(segment, (older, older))
+        
+        self.assertEqual(log_files(self.directory), [segment, self.path])
+        matches = list(search(segment, min_level='WARNING'))
+        self.assertEqual([m.level for m in matches], ['WARNING'])
+        self.assertEqual(matches[0].timestamp, '2026-10-19 10:01:00')
+    
+    def test_tail_and_follow(self):
+        """tail() returns the last lines; read_from() only complete new ones."""
+        lines, offset = tail(self.path, 2)
+        self.assertEqual(lines, [
+            log_line(58, 'INFO', 'step 58 done', RUN_B).rstrip('\n'),
+            log_line(59, 'INFO', 'step 59 done', RUN_B).rstrip('\n'),
+        ])
+        
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('first new\nsecond ')
+        new, offset = read_from(self.path, offset)
+        self.assertEqual(new, ['first new'])
+        
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('half\n')
+        new, offset = read_from(self.path, offset)
+        self.assertEqual(new, ['second half'])
+        self.assertEqual(offset, self.path.stat().st_size)
+    
+    def test_rewritten_file_is_reindexed(self):
+        """A file replaced by rotation is indexed from the start."""
+        index = get_index(self.path)
+        self.assertGreater(len(index.blocks), 1)
+        
+        self.path.unlink()
+        self.path.write_text(log_line(0, 'INFO', 'fresh'), encoding='utf-8')
+        self.assertEqual(len(get_index(self.path).blocks), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Unit tests for the memory probe.
+Covers allocation site reporting, tracemalloc ownership and module events.
+"""
+
+import inspect
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.utils.config import Config
+from src.utils.events import EventLog, read_events
+from src.utils import memory as memory_module
+from src.utils.memory import MemoryProbe, current_rss
+from tests.test_modules import MockModule
+
+
+class TestMemoryProbe(unittest.TestCase):
+    """Test memory measurement around a block of work."""
+    
+    def test_retained_allocations_reported(self):
+        """Memory kept after the block is attributed to the line that allocated it."""
+        probe = MemoryProbe(top=3)
+        probe.start()
+        line = inspect.currentframe().f_lineno + 1
+        kept = [bytearray(1024) for _ in range(1000)]
+        report = probe.stop()
+        
+        self.assertGreaterEqual(report.traced_peak_bytes, 1024 * 1000)
+        self.assertGreaterEqual(report.traced_delta_bytes, 1024 * 1000)
+        self.assertTrue(report.top[0].site.endswith(f'{Path(__file__).name}:{line}'))
+        self.assertGreaterEqual(report.top[0].count, 1000)
+        self.assertLessEqual(len(report.top), 3)
+        self.assertIn('retained +1.', report.describe())
+        self.assertEqual(len(kept), 1000)
+    
+    def test_tracing_owned_by_outermost_probe(self):
+        """tracemalloc is stopped only when the last probe that needed it closes."""
+        if tracemalloc.is_tracing():
+            self.skipTest('tracemalloc already enabled')
+        
+        outer, inner = MemoryProbe(), MemoryProbe()
+        outer.start()
+        inner.start()
+        inner.stop()
+        self.assertTrue(tracemalloc.is_tracing())
+        outer.stop()
+        self.assertFalse(tracemalloc.is_tracing())
+    
+    def test_module_run_emits_memory_event(self):
+        """With the probe on, a memory event precedes module_end."""
+        with tempfile.TemporaryDirectory() as directory:
+            log = EventLog(Path(directory))
+            module = MockModule()
+            
+            with patch.object(module._validator, 'validate_all', return_value=MagicMock(valid=True)), \
+                    patch('src.modules.base.Config.load', return_value=Config(memory_probe=True)), \
+                    patch('src.modules.base.get_event_log', return_value=log):
+                module.execute()
+            log.close()
+            
+            events = list(read_events([log.path]))
+        self.assertEqual([e['event'] for e in events][-2:], ['memory', 'module_end'])
+        memory = events[-2]
+        self.assertEqual(memory['module_id'], module.module_id)
+        self.assertIn('traced_peak_bytes', memory)
+        if current_rss() is not None:
+            self.assertEqual(memory['rss_delta_bytes'], memory['rss_after_bytes'] - memory['rss_before_bytes'])
+    
+    def test_probe_released_when_validation_raises(self):
+        """A run that raises before it finishes still turns tracemalloc off."""
+        if tracemalloc.is_tracing():
+            self.skipTest('tracemalloc already enabled')
+        
+        module = MockModule()
+        with patch.object(module._validator, 'validate_all', side_effect=RuntimeError('boom')), \
+                patch('src.modules.base.Config.load', return_value=Config(memory_probe=True)):
+            with self.assertRaises(RuntimeError):
+                module.execute()
+        
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(memory_module._active, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,198 @@
+"""
+Unit tests for the escalating network repair pipeline.
+Probes run against local stand-in servers instead of public targets.
+"""
+
+import socket
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.core.executor import ExecutionResult, ExecutionStatus
+from src.core.journal import ExecutionJournal, RunState
+from src.modules.base import BaseModule, ModuleInfo
+from src.modules.bugfix.network_repair import NetworkRepairModule
+from src.system.probes import ConnectivityProbe
+
+
+class LocalServer:
+    """TCP listener on localhost that can be switched on by a repair tier."""
+    
+    def __init__(self) -> None:
+        # Reserve a port, then close it so connections are refused until started
+        probe = socket.socket()
+        probe.bind(('127.0.0.1', 0))
+        self.port = probe.getsockname()[1]
+        probe.close()
+        self._sock = None
+    
+    @property
+    def target(self) -> str:
+        return f'127.0.0.1:{self.port}'
+    
+    def start(self) -> None:
+        self._sock = socket.socket()
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind(('127.0.0.1', self.port))
+        self._sock.listen(8)
+    
+    def stop(self) -> None:
+        if self._sock:
+            self._sock.close()
+
+
+class FakeTier(BaseModule):
+    """Repair tier that records its run and optionally fixes the network."""
+    
+    def __init__(self, name: str, log: list, fix=None, requires_reboot: bool = False) -> None:
+        super().__init__()
+        self._name = name
+        self._log = log
+        self._fix = fix
+        self._requires_reboot = requires_reboot
+    
+    @property
+    def module_id(self) -> str:
+        return self._name
+    
+    @property
+    def info(self) -> ModuleInfo:
+        return ModuleInfo(
+            name=self._name,
+            description='Fake repair tier',
+            category='Network',
+            requires_admin=False,
+            requires_reboot=self._requires_reboot,
+            is_critical=False
+        )
+    
+    def _execute(self) -> ExecutionResult:
+        self._log.append(self._name)
+        if self._fix:
+            self._fix()
+        return ExecutionResult(status=ExecutionStatus.SUCCESS, message='applied')
+
+
+class TestNetworkRepair(unittest.TestCase):
+    """Test tier escalation against local probe targets."""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.journal = ExecutionJournal(Path(self._tmp.name))
+        self.server = LocalServer()
+        self.probe = ConnectivityProbe(
+            dns_names=['localhost'],
+            tcp_targets=[self.server.target],
+            gateway=None,
+            timeout=1.0
+        )
+        self.ran = []
+    
+    def tearDown(self):
+        self.server.stop()
+        self._tmp.cleanup()
+    
+    def _run(self, tiers):
+        for tier in tiers:
+            tier._journal = self.journal
+        module = NetworkRepairModule(probe=self.probe, tiers=tiers)
+        module._journal = self.journal
+        with patch('src.modules.base.Validator.validate_all') as mock_validate, \
+                patch('src.modules.base.AutoStart'):
+            mock_validate.return_value = MagicMock(valid=True)
+            return module.execute()
+    
+    def _continue(self, tiers, run):
+        for tier in tiers:
+            tier._journal = self.journal
+        module = NetworkRepairModule(probe=self.probe, tiers=tiers)
+        module._journal = self.journal
+        with patch('src.modules.base.Validator.validate_all') as mock_validate, \
+                patch('src.modules.base.AutoStart') as autostart:
+            mock_validate.return_value = MagicMock(valid=True)
+            result = module.continue_after_reboot(run)
+        self.autostart = autostart
+        return result
+    
+    def test_healthy_network_runs_no_tiers(self):
+        """Nothing is repaired when the probes already pass."""
+        self.server.start()
+        result = self._run([FakeTier('dns', self.ran)])
+        
+        self.assertTrue(result.success)
+        self.assertEqual(self.ran, [])
+    
+    def test_stops_at_first_tier_that_restores_connectivity(self):
+        """Escalation ends once a tier makes the probes pass."""
+        tiers = [
+            FakeTier('dns', self.ran),
+            FakeTier('adapter', self.ran, fix=self.server.start),
+            FakeTier('winsock', self.ran, requires_reboot=True),
+        ]
+        result = self._run(tiers)
+        
+        self.assertTrue(result.success)
+        self.assertFalse(result.reboot_required)
+        self.assertEqual(self.ran, ['dns', 'adapter'])
+        self.assertIn('adapter', result.message)
+    
+    def test_reboot_tier_defers_to_restart(self):
+        """A tier that needs a restart stops escalation and flags the reboot."""
+        tiers = [
+            FakeTier('dns', self.ran),
+            FakeTier('winsock', self.ran, requires_reboot=True),
+            FakeTier('reset', self.ran, requires_reboot=True),
+        ]
+        result = self._run(tiers)
+        
+        self.assertTrue(result.success)
+        self.assertTrue(result.reboot_required)
+        self.assertEqual(self.ran, ['dns', 'winsock'])
+        
+        runs = self.journal.pending_runs()
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(runs[0].continuations, ['_continue_after_restart'])
+    
+    def test_failed_escalation_after_restart_fails_run(self):
+        """A continuation that cannot restore connectivity fails the run."""
+        self._run([FakeTier('dns', self.ran), FakeTier('winsock', self.ran, requires_reboot=True)])
+        run = self.journal.pending_runs()[0]
+        
+        result = self._continue([
+            FakeTier('dns', self.ran),
+            FakeTier('winsock', self.ran, requires_reboot=True),
+            FakeTier('adapter', self.ran),
+        ], run)
+        
+        self.assertFalse(result.success)
+        self.assertIn('could not restore connectivity', result.message)
+        self.assertEqual(self.ran, ['dns', 'winsock', 'adapter'])
+        self.assertEqual(self.journal.pending_runs(), [])
+    
+    def test_second_restart_keeps_run_parked(self):
+        """A tier needing another restart parks the run with the continuation again."""
+        tiers = [
+            FakeTier('dns', self.ran),
+            FakeTier('winsock', self.ran, requires_reboot=True),
+            FakeTier('reset', self.ran, requires_reboot=True),
+        ]
+        self._run(tiers)
+        run = self.journal.pending_runs()[0]
+        
+        result = self._continue(tiers, run)
+        
+        self.assertTrue(result.success)
+        self.assertTrue(result.reboot_required)
+        self.assertEqual(self.ran, ['dns', 'winsock', 'reset'])
+        self.autostart.return_value.register_run_once.assert_called_once()
+        
+        runs = self.journal.pending_runs()
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(runs[0].state, RunState.AWAITING_REBOOT)
+        self.assertEqual(runs[0].continuations, ['_continue_after_restart'])
+        self.assertIn('tier_reset', runs[0].committed_steps)
+
+
+if __name__ == '__main__':
+    unittest.main()
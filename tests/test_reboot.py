@@ -0,0 +1,108 @@
+"""
+Unit tests for reboot coordination.
+Tests restart window handling, the persisted verification list and
+post-restart checks.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.core.reboot import RebootManager, parse_restart_window, seconds_until_window
+from src.modules.bugfix.winsock_reset import WinsockResetModule
+from src.modules.reset.network_reset import NetworkResetModule
+from src.modules.reset.update_reset import UpdateResetModule
+from src.system.services import ServiceInventory, ServiceRecord
+
+
+class TestRestartWindow(unittest.TestCase):
+    """Test restart window parsing."""
+    
+    def test_parse_window(self):
+        """Valid windows parse to minutes after midnight."""
+        self.assertEqual(parse_restart_window('02:00-04:30'), (120, 270))
+        self.assertIsNone(parse_restart_window(''))
+        self.assertIsNone(parse_restart_window('25:00-26:00'))
+    
+    def test_seconds_until_window(self):
+        """Delay is zero inside the window and wraps past midnight."""
+        now = datetime(2026, 1, 1, 23, 30)
+        self.assertEqual(seconds_until_window('23:00-02:00', now), 0)
+        self.assertEqual(seconds_until_window('02:00-04:00', now), 150 * 60)
+
+
+class TestRebootManager(unittest.TestCase):
+    """Test reboot requirement collection."""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.state_path = Path(self._tmp.name) / 'post_reboot.json'
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_requirements_are_coalesced(self):
+        """Each module is recorded once and clears its expectation."""
+        manager = RebootManager(self.state_path)
+        manager.expect('NetworkResetModule')
+        manager.require('NetworkResetModule', 'Network Reset')
+        manager.require('NetworkResetModule', 'Network Reset')
+        manager.require('UpdateResetModule', 'Windows Update Soft-Reset')
+        
+        self.assertEqual(len(manager.requirements), 2)
+        self.assertFalse(manager.expects_more)
+        self.assertTrue(self.state_path.exists())
+    
+    def test_restore_before_and_after_reboot(self):
+        """Pending list survives a relaunch and is consumed after a restart."""
+        RebootManager(self.state_path).require('NetworkResetModule', 'Network Reset')
+        
+        with patch('src.core.reboot.PlatformCheck.has_rebooted_since', return_value=False):
+            manager = RebootManager(self.state_path)
+            self.assertEqual(manager.restore(), [])
+            self.assertTrue(manager.has_pending)
+        
+        with patch('src.core.reboot.PlatformCheck.has_rebooted_since', return_value=True):
+            due = RebootManager(self.state_path).restore()
+        
+        self.assertEqual([r.module_id for r in due], ['NetworkResetModule'])
+        self.assertFalse(self.state_path.exists())
+
+
+class TestPostRestartVerification(unittest.TestCase):
+    """Test the checks run for modules due after a restart."""
+    
+    def test_network_modules_check_ipv4(self):
+        """Both network resets pass only with an IPv4 configuration."""
+        for module_class in (WinsockResetModule, NetworkResetModule):
+            with self.subTest(module=module_class.__name__):
+                module = module_class()
+                module._runner = MagicMock()
+                module._runner.run.return_value = MagicMock(success=True, stdout='IPv4 Address: 10.0.0.2', stderr='')
+                self.assertTrue(module.verify().success)
+                
+                module._runner.run.return_value = MagicMock(success=True, stdout='Media disconnected', stderr='')
+                self.assertFalse(module.verify().success)
+    
+    def test_update_reset_verifies_services_only_once(self):
+        """Update reset is verified through verify() and parks no journal run."""
+        inventory = ServiceInventory([ServiceRecord('wuauserv', 'Windows Update', 'RUNNING')])
+        module = UpdateResetModule()
+        
+        with patch('src.modules.reset.update_reset.get_service_inventory', return_value=inventory):
+            result = module.verify()
+        
+        self.assertTrue(result.success)
+        self.assertIn('[OK] wuauserv running', result.details)
+        self.assertIn('[INFO] bits not running', result.details)
+        
+        with patch.object(module, 'register_continuation') as register, \
+                patch.object(module, '_step', return_value=''):
+            module._execute()
+        register.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
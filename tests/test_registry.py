@@ -0,0 +1,99 @@
+"""
+Unit tests for the module registry.
+Checks the static manifest against the module classes it names.
+"""
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.core.executor import ExecutionResult, ExecutionStatus
+from src.modules.base import BaseModule, ModuleInfo
+from src.modules.registry import MANIFEST, ModuleRegistry, ModuleSpec
+
+
+PLUGIN_INFO = ModuleInfo(
+    name='Plugin Module',
+    description='Module provided by a third-party package',
+    category='System',
+    requires_admin=False,
+    requires_reboot=False,
+    is_critical=False
+)
+
+
+class PluginModule(BaseModule):
+    """Stand-in for a module shipped by a plugin package."""
+    
+    @property
+    def info(self) -> ModuleInfo:
+        return PLUGIN_INFO
+    
+    def _execute(self) -> ExecutionResult:
+        return ExecutionResult(status=ExecutionStatus.SUCCESS, message='done')
+
+
+class TestModuleRegistry(unittest.TestCase):
+    """Test manifest consistency, lazy loading and plugins."""
+    
+    def test_manifest_matches_modules(self):
+        """Each manifest entry names its class and repeats its ModuleInfo and requirements exactly."""
+        for spec in MANIFEST:
+            with self.subTest(module=spec.module_id):
+                cls = spec.load_class()
+                self.assertEqual(cls.__name__, spec.module_id)
+                self.assertEqual(cls().info, spec.info)
+                self.assertEqual(list(spec.required_services), list(cls.required_services))
+                self.assertEqual(list(spec.required_paths), list(cls.required_paths))
+                self.assertEqual(spec.requires_network_adapter, cls.requires_network_adapter)
+    
+    def test_metadata_does_not_import_modules(self):
+        """Listing modules and reading metadata leaves module code unimported."""
+        script = (
+            'import sys\n'
+            'from src.modules.registry import ModuleRegistry\n'
+            'registry = ModuleRegistry()\n'
+            'names = [registry.info(m).name for m in registry]\n'
+            'loaded = [m for m in sys.modules if m.startswith(("src.modules.bugfix.", "src.modules.reset."))]\n'
+            'print(len(names), loaded)\n'
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', script],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent.parent
+        ).stdout.split('\n')[-2]
+        
+        self.assertEqual(output, f'{len(MANIFEST)} []')
+    
+    def test_instantiates_once_on_first_lookup(self):
+        """Modules are created on first access and then reused."""
+        registry = ModuleRegistry(load_entry_points=False)
+        
+        self.assertFalse(registry.is_loaded('DNSFlushModule'))
+        module = registry['DNSFlushModule']
+        self.assertIs(registry.get('DNSFlushModule'), module)
+        self.assertIsNone(registry.get('MissingModule'))
+    
+    def test_entry_point_plugins(self):
+        """Specs published under the entry point group are registered after the manifest."""
+        spec = ModuleSpec(
+            module_id='PluginModule',
+            target='tests.test_registry:PluginModule',
+            info=PLUGIN_INFO,
+            tab='reset'
+        )
+        entry_point = MagicMock()
+        entry_point.load.return_value = lambda: [spec]
+        
+        with patch('importlib.metadata.entry_points', return_value=[entry_point]):
+            registry = ModuleRegistry()
+        
+        self.assertEqual(registry.ids(tab='reset')[-1], 'PluginModule')
+        self.assertEqual(registry.info('PluginModule'), PLUGIN_INFO)
+        self.assertIsInstance(registry['PluginModule'], PluginModule)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Unit tests for the maintenance scheduler.
+Uses a fake clock and fake load readings instead of real idle signals.
+"""
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.scheduler import IdlePolicy, MaintenanceScheduler
+from src.system.idle import IdleSignals
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeSignals(IdleSignals):
+    """Idle signals with settable readings."""
+    
+    def __init__(self) -> None:
+        self.cpu = 5.0
+        self.disk = 5.0
+        self.input_idle = 3600.0
+        self.ac_power = True
+    
+    def cpu_percent(self) -> float:
+        return self.cpu
+    
+    def disk_percent(self) -> float:
+        return self.disk
+    
+    def input_idle_seconds(self) -> float:
+        return self.input_idle
+    
+    def on_ac_power(self) -> bool:
+        return self.ac_power
+
+
+class TestMaintenanceScheduler(unittest.TestCase):
+    """Test interval scheduling and idle gating."""
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        self.signals = FakeSignals()
+        self.dispatched = []
+        self.rejected = set()
+        self.scheduler = MaintenanceScheduler(
+            dispatch=self.dispatch,
+            signals=self.signals,
+            policy=IdlePolicy(defer_seconds=300),
+            clock=self.clock,
+            rng=random.Random(42)
+        )
+    
+    def dispatch(self, module_id: str) -> bool:
+        if module_id in self.rejected:
+            return False
+        self.dispatched.append(module_id)
+        return True
+    
+    def test_runs_when_due_and_idle(self):
+        """A job runs once its interval elapses and the machine is idle."""
+        self.scheduler.add_job('TempCleanupModule', interval=3600)
+        
+        self.assertEqual(self.scheduler.tick(), [])
+        self.clock.advance(3600)
+        self.assertEqual(self.scheduler.tick(), ['TempCleanupModule'])
+        self.assertEqual(self.scheduler.next_due(), self.clock.now + 3600)
+    
+    def test_defers_while_busy(self):
+        """Load, user input and battery power each defer a due job."""
+        job = self.scheduler.add_job('DNSFlushModule', interval=60)
+        self.clock.advance(60)
+        
+        for setup in (
+            lambda: setattr(self.signals, 'cpu', 90.0),
+            lambda: setattr(self.signals, 'disk', 90.0),
+            lambda: setattr(self.signals, 'input_idle', 5.0),
+            lambda: setattr(self.signals, 'ac_power', False),
+        ):
+            self.signals.__init__()
+            setup()
+            self.assertEqual(self.scheduler.tick(), [])
+            self.clock.advance(300)
+        
+        self.assertEqual(job.deferrals, 4)
+        self.signals.__init__()
+        self.assertEqual(self.scheduler.tick(), ['DNSFlushModule'])
+    
+    def test_deferral_jitter_is_bounded(self):
+        """Deferred jobs are spread out by at most their jitter."""
+        jobs = [self.scheduler.add_job(f'Module{i}', interval=60, jitter=120) for i in range(5)]
+        self.clock.advance(300)
+        self.signals.cpu = 95.0
+        self.scheduler.tick()
+        
+        for job in jobs:
+            self.assertGreaterEqual(job.next_run, self.clock.now + 300)
+            self.assertLessEqual(job.next_run, self.clock.now + 420)
+        self.assertGreater(len({job.next_run for job in jobs}), 1)
+    
+    def test_one_job_per_pass(self):
+        """Only one job starts per pass so signals are re-checked between jobs."""
+        self.scheduler.add_job('TempCleanupModule', interval=60)
+        self.scheduler.add_job('ExplorerCacheModule', interval=60)
+        self.clock.advance(60)
+        
+        self.assertEqual(len(self.scheduler.tick()), 1)
+        self.clock.advance(300)
+        self.assertEqual(len(self.scheduler.tick()), 1)
+        self.assertEqual(len(set(self.dispatched)), 2)
+    
+    def test_last_run_is_persisted(self):
+        """Intervals continue from the last run after a relaunch."""
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = Path(tmp) / 'state.json'
+            scheduler = MaintenanceScheduler(
+                dispatch=self.dispatch,
+                signals=self.signals,
+                clock=self.clock,
+                state_path=state_path
+            )
+            scheduler.add_job('TempCleanupModule', interval=3600)
+            self.clock.advance(3600)
+            scheduler.tick()
+            ran_at = self.clock.now
+            
+            self.clock.advance(600)
+            relaunched = MaintenanceScheduler(
+                dispatch=self.dispatch,
+                signals=self.signals,
+                clock=self.clock,
+                state_path=state_path
+            )
+            job = relaunched.add_job('TempCleanupModule', interval=3600)
+        
+        self.assertEqual(job.next_run, ran_at + 3600)
+    
+    def test_rejected_dispatch_is_not_recorded(self):
+        """A job the window refuses is retried and does not count as run."""
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = Path(tmp) / 'state.json'
+            scheduler = MaintenanceScheduler(
+                dispatch=self.dispatch,
+                signals=self.signals,
+                policy=IdlePolicy(defer_seconds=300),
+                clock=self.clock,
+                state_path=state_path
+            )
+            rejected = scheduler.add_job('DiskCleanupModule', interval=3600)
+            scheduler.add_job('TempCleanupModule', interval=7200)
+            self.rejected.add('DiskCleanupModule')
+            
+            # The refused job gives up its slot to the next due job
+            self.clock.advance(7200)
+            self.assertEqual(scheduler.tick(), ['TempCleanupModule'])
+            self.assertIsNone(rejected.last_run)
+            self.assertEqual(rejected.deferrals, 1)
+            self.assertEqual(rejected.next_run, self.clock.now + 300)
+            self.assertNotIn('DiskCleanupModule', scheduler._load_state())
+            
+            self.rejected.clear()
+            self.clock.advance(300)
+            self.assertEqual(scheduler.tick(), ['DiskCleanupModule'])
+            self.assertEqual(rejected.last_run, self.clock.now)
+
+
+if __name__ == '__main__':
+    unittest.main()
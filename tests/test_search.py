@@ -0,0 +1,60 @@
+"""
+Unit tests for the module search index.
+Uses the built-in manifest as the catalog.
+"""
+
+import unittest
+
+from src.modules.base import ModuleInfo
+from src.modules.registry import MANIFEST
+from src.modules.search import ModuleIndex
+
+
+class TestModuleIndex(unittest.TestCase):
+    """Test word-prefix search by name and category."""
+    
+    def setUp(self):
+        self.index = ModuleIndex((spec.module_id, spec.info) for spec in MANIFEST)
+    
+    def test_prefix_terms_must_all_match(self):
+        """Every query word has to start a word of the name or category."""
+        self.assertEqual(self.index.search('dns fl'), {'DNSFlushModule'})
+        self.assertEqual(
+            self.index.ordered(self.index.search('cache')),
+            ['DNSFlushModule', 'UpdateCacheModule', 'ExplorerCacheModule']
+        )
+        self.assertEqual(self.index.search('ache'), set())
+        self.assertEqual(self.index.search('dns reset'), set())
+    
+    def test_category_filter(self):
+        """Categories filter on their own and match as search words."""
+        cleanup = {s.module_id for s in MANIFEST if s.info.category == 'Cleanup'}
+        
+        self.assertEqual(self.index.search(category='cleanup'), cleanup)
+        self.assertEqual(self.index.search('clean'), cleanup)
+        self.assertEqual(self.index.search('reset', category='Network'), {
+            'WinsockResetModule', 'NetworkResetModule'
+        })
+        self.assertEqual(self.index.categories, ['Network', 'System', 'Cleanup'])
+    
+    def test_empty_query_matches_everything(self):
+        """No terms and no category returns every module."""
+        self.assertEqual(len(self.index.search('')), len(MANIFEST))
+        self.assertEqual(len(self.index.search('  ,  ')), len(MANIFEST))
+    
+    def test_large_catalog(self):
+        """Lookups stay exact with hundreds of modules."""
+        info = MANIFEST[0].info
+        entries = [
+            (f'Script{i}', ModuleInfo(f'Custom Script {i}', '', 'Scripts', False, False, False))
+            for i in range(500)
+        ]
+        index = ModuleIndex([(MANIFEST[0].module_id, info)] + entries)
+        
+        self.assertEqual(index.search('script 421'), {'Script421'})
+        self.assertEqual(len(index.search('script 42')), 11)
+        self.assertEqual(len(index.search('custom', category='scripts')), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Unit tests for the service inventory.
+Parses captured sc.exe output instead of querying a live SCM.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from src.core.validator import Validator
+from src.modules.base import missing_requirements
+from src.system import services
+from src.system.services import ServiceInventory, ServiceRecord, get_service_inventory, parse_sc_queryex
+
+
+SC_QUERYEX_OUTPUT = '''
+SERVICE_NAME: wuauserv
+DISPLAY_NAME: Windows Update
+        TYPE               : 20  WIN32_SHARE_PROCESS
+        STATE              : 4  RUNNING
+                                (STOPPABLE, NOT_PAUSABLE, ACCEPTS_PRESHUTDOWN)
+        WIN32_EXIT_CODE    : 0  (0x0)
+        SERVICE_EXIT_CODE  : 0  (0x0)
+        CHECKPOINT         : 0x0
+        WAIT_HINT          : 0x0
+        PID                : 1234
+        FLAGS              :
+
+SERVICE_NAME: BITS
+DISPLAY_NAME: Background Intelligent Transfer Service
+        TYPE               : 20  WIN32_SHARE_PROCESS
+        STATE              : 1  STOPPED
+        WIN32_EXIT_CODE    : 0  (0x0)
+        SERVICE_EXIT_CODE  : 0  (0x0)
+        CHECKPOINT         : 0x0
+        WAIT_HINT          : 0x0
+        PID                : 0
+        FLAGS              :
+'''
+
+
+class TestServiceInventory(unittest.TestCase):
+    """Test sc.exe parsing and inventory lookups."""
+    
+    def test_parse_sc_queryex(self):
+        """Each SERVICE_NAME block becomes a record."""
+        records = parse_sc_queryex(SC_QUERYEX_OUTPUT)
+        
+        self.assertEqual([r.name for r in records], ['wuauserv', 'BITS'])
+        self.assertEqual(records[0].display_name, 'Windows Update')
+        self.assertTrue(records[0].is_running)
+        self.assertEqual(records[0].pid, 1234)
+        self.assertEqual(records[1].state, 'STOPPED')
+    
+    def test_lookups_are_case_insensitive(self):
+        """Service names match regardless of case, like the SCM."""
+        inventory = ServiceInventory(parse_sc_queryex(SC_QUERYEX_OUTPUT))
+        
+        self.assertIn('bits', inventory)
+        self.assertEqual(inventory.get('WUAUSERV').pid, 1234)
+        self.assertEqual(inventory.missing(['bits', 'cryptsvc']), ['cryptsvc'])
+    
+    def test_unavailable_inventory_reports_nothing_missing(self):
+        """A failed enumeration does not mark required services as missing."""
+        unavailable = ServiceInventory([], source='unavailable')
+        
+        self.assertEqual(unavailable.missing(['wuauserv', 'bits']), [])
+        with patch('src.modules.base.get_service_inventory', return_value=unavailable):
+            reasons = missing_requirements(False, ['wuauserv'], [], False)
+        self.assertNotIn('Service wuauserv not found', reasons)
+    
+    def test_validator_uses_inventory(self):
+        """Service validation is answered from the table without running commands."""
+        inventory = ServiceInventory([
+            ServiceRecord(name='wuauserv', display_name='Windows Update', state='RUNNING'),
+        ])
+        
+        with patch('src.core.validator.get_service_inventory', return_value=inventory), \
+                patch('src.system.commands.CommandRunner.run') as run:
+            result = Validator().validate_all(require_admin=False, services=['wuauserv', 'msiserver'])
+            exists = Validator().validate_service_exists('wuauserv')
+        
+        run.assert_not_called()
+        self.assertTrue(exists.valid)
+        self.assertIn('Service msiserver not found', result.warnings)
+        self.assertNotIn('Service wuauserv not found', result.warnings)
+    
+    def test_unavailable_inventory_is_retried(self):
+        """A failed enumeration is not served for the rest of the session."""
+        unavailable = ServiceInventory([], source='unavailable')
+        loaded = ServiceInventory(parse_sc_queryex(SC_QUERYEX_OUTPUT), source='sc')
+        
+        with patch.object(services, '_inventory', None), \
+                patch.object(ServiceInventory, 'load', side_effect=[unavailable, loaded]) as load:
+            self.assertIs(get_service_inventory(), unavailable)
+            self.assertIs(get_service_inventory(), unavailable)
+            
+            unavailable.captured_at -= services.UNAVAILABLE_RETRY_SECONDS
+            self.assertIs(get_service_inventory(), loaded)
+            self.assertIs(get_service_inventory(), loaded)
+        
+        self.assertEqual(load.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
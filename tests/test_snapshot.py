@@ -0,0 +1,53 @@
+"""
+Unit tests for the session system snapshot.
+Checks that platform probing happens once per session.
+"""
+
+import dataclasses
+import unittest
+from unittest.mock import patch
+
+from src.core.validator import Validator
+from src.system import snapshot
+from src.system.platform_check import PlatformCheck
+
+
+class TestSystemSnapshot(unittest.TestCase):
+    """Test snapshot caching, refresh and validator lookups."""
+    
+    def setUp(self):
+        patcher = patch.object(snapshot, '_snapshot', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_probed_once_per_session(self):
+        """Validation and platform checks reuse one capture."""
+        with patch.object(PlatformCheck, 'probe_system', wraps=PlatformCheck.probe_system) as probe, \
+                patch('src.system.snapshot.is_admin', return_value=True) as admin:
+            validator = Validator()
+            for _ in range(5):
+                validator.validate_all(require_admin=True)
+                PlatformCheck.check_system()
+        
+        self.assertEqual(probe.call_count, 1)
+        self.assertEqual(admin.call_count, 1)
+    
+    def test_refresh_replaces_snapshot(self):
+        """refresh() re-probes and later reads see the new values."""
+        with patch('src.system.snapshot.is_admin', return_value=False):
+            before = snapshot.get_snapshot()
+        with patch('src.system.snapshot.is_admin', return_value=True):
+            PlatformCheck.refresh()
+        
+        self.assertFalse(before.is_admin)
+        self.assertTrue(snapshot.get_snapshot().is_admin)
+        self.assertTrue(Validator().validate_admin().valid)
+    
+    def test_snapshot_is_immutable(self):
+        """Readers cannot change the shared snapshot."""
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            snapshot.get_snapshot().is_admin = True
+
+
+if __name__ == '__main__':
+    unittest.main()
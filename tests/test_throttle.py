@@ -0,0 +1,152 @@
+"""
+Unit tests for resource throttling.
+Rate limits are checked against a fake clock instead of real sleeps.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.core.executor import ExecutionStatus
+from src.modules.bugfix.update_cache import UpdateCacheModule
+from src.system.commands import CommandResult
+from src.system.files import DeletionStats, ThrottledDeleter
+from src.system.throttle import ThrottlePolicy, TokenBucket
+from src.utils.config import Config
+
+
+class FakeClock:
+    """Clock advanced by the fake sleep."""
+    
+    def __init__(self) -> None:
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test the token bucket rate limiter."""
+    
+    def test_limits_sustained_rate(self):
+        """After the initial burst, consumption proceeds at the configured rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(10, clock=clock, sleep=clock.sleep)
+        
+        for _ in range(110):
+            bucket.consume()
+        
+        self.assertAlmostEqual(clock.now, 10.0)
+    
+    def test_oversized_request_is_admitted_with_debt(self):
+        """A request larger than the bucket waits proportionally instead of blocking forever."""
+        clock = FakeClock()
+        bucket = TokenBucket(100, clock=clock, sleep=clock.sleep)
+        
+        self.assertAlmostEqual(bucket.consume(500), 4.0)
+    
+    def test_zero_rate_is_unlimited(self):
+        """A rate of 0 never waits."""
+        clock = FakeClock()
+        bucket = TokenBucket(0, clock=clock, sleep=clock.sleep)
+        
+        self.assertEqual(sum(bucket.consume(1000) for _ in range(100)), 0.0)
+
+
+class TestThrottlePolicy(unittest.TestCase):
+    """Test policy resolution from configuration."""
+    
+    def test_module_entry_overrides_default(self):
+        """Module settings override the default entry and unknown keys are ignored."""
+        config = Config()
+        config.throttle = {
+            'default': {'priority': 'below_normal', 'max_files_per_second': 100},
+            'TempCleanupModule': {'priority': 'idle', 'low_io': True, 'bogus': 1},
+        }
+        
+        policy = ThrottlePolicy.from_config(config, 'TempCleanupModule')
+        self.assertEqual(policy.priority, 'idle')
+        self.assertTrue(policy.low_io)
+        self.assertEqual(policy.max_files_per_second, 100)
+        
+        self.assertFalse(ThrottlePolicy.from_config(Config(), 'DNSFlushModule').is_throttled)
+    
+    def test_module_reads_config_once(self):
+        """A module resolves its policy from config.json without rereading it per run."""
+        module = UpdateCacheModule()
+        with patch('src.modules.base.Config.load', return_value=Config()) as load:
+            module.throttle
+            module.throttle
+        load.assert_called_once()
+
+
+class TestThrottledDeleter(unittest.TestCase):
+    """Test rate-limited directory clearing."""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _populate(self, directory: Path, count: int, size: int) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        for i in range(count):
+            (directory / f'file{i}.tmp').write_bytes(b'x' * size)
+    
+    def test_clears_contents_within_rate(self):
+        """All files are removed and the elapsed time respects the file rate."""
+        target = self.root / 'temp'
+        self._populate(target, 10, 1024)
+        self._populate(target / 'nested' / 'deeper', 10, 1024)
+        
+        clock = FakeClock()
+        policy = ThrottlePolicy(max_files_per_second=5)
+        stats = ThrottledDeleter(policy, clock=clock, sleep=clock.sleep).clear_directory(target)
+        
+        self.assertEqual(stats.files, 20)
+        self.assertEqual(stats.bytes, 20 * 1024)
+        self.assertEqual(stats.directories, 2)
+        self.assertAlmostEqual(stats.elapsed, 3.0)
+        self.assertTrue(target.is_dir())
+        self.assertEqual(list(target.iterdir()), [])
+    
+    @unittest.skipUnless(hasattr(os, 'symlink'), 'symlinks unavailable')
+    def test_does_not_follow_links(self):
+        """A directory link inside the target is removed without touching its target."""
+        outside = self.root / 'outside'
+        self._populate(outside, 3, 10)
+        target = self.root / 'temp'
+        target.mkdir()
+        try:
+            os.symlink(outside, target / 'link', target_is_directory=True)
+        except OSError:
+            self.skipTest('cannot create symlinks')
+        
+        ThrottledDeleter(ThrottlePolicy()).clear_directory(target)
+        
+        self.assertFalse((target / 'link').exists())
+        self.assertEqual(len(list(outside.iterdir())), 3)
+    
+    def test_undeletable_update_cache_is_reported(self):
+        """Files the deleter skips fail the update cache repair."""
+        module = UpdateCacheModule()
+        module._runner = MagicMock()
+        module._runner.run.return_value = CommandResult(True, 0, '', '', 'net')
+        module._deleter = MagicMock()
+        module._deleter.clear_directory.return_value = DeletionStats(files=3, skipped=2)
+        
+        result = module._execute()
+        
+        self.assertEqual(result.status, ExecutionStatus.FAILED)
+        self.assertIn('4 item(s) in use', result.details)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Unit tests for execution timings.
+Covers the breakdown itself, command collection and module phases.
+"""
+
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.system.commands import CommandRunner
+from src.utils.config import Config
+from src.utils.events import bind
+from src.utils.timings import CommandTiming, ExecutionTimings, collect, current_timings
+from tests.test_modules import MockModule
+
+
+class TestExecutionTimings(unittest.TestCase):
+    """Test timing collection and reporting."""
+    
+    def test_summary_and_dict(self):
+        """Phases keep their order; commands are listed slowest first."""
+        timings = ExecutionTimings()
+        with timings.phase('validation'):
+            pass
+        timings.phases['execute'] = 2500.0
+        timings.add_command(CommandTiming('sfc /scannow', 0, 4.0, 2000.0, step='scan'))
+        timings.add_command(CommandTiming('ipconfig /flushdns', 1, 3.0, 40.0))
+        
+        self.assertEqual(list(timings.phases), ['validation', 'execute'])
+        self.assertEqual(timings.command_ms, 2047.0)
+        
+        lines = timings.summary().splitlines()
+        self.assertTrue(lines[0].startswith('Timings: validation 0 ms, execute 2.5 s'))
+        self.assertEqual(lines[1], '  2 command(s): 2.0 s')
+        self.assertEqual(lines[2], '  sfc /scannow: spawn 4 ms, run 2.0 s (exit 0)')
+        
+        data = timings.to_dict()
+        self.assertEqual(data['commands'][0]['step'], 'scan')
+        self.assertEqual(data['command_ms'], 2047.0)
+    
+    def test_commands_recorded_while_collecting(self):
+        """CommandRunner adds a timing per call only inside collect()."""
+        runner = CommandRunner()
+        timings = ExecutionTimings()
+        
+        with patch.object(runner, '_resolve_command', return_value=sys.executable):
+            runner.run(['python', '-c', 'pass'])
+            self.assertIsNone(current_timings())
+            
+            with collect(timings), bind(step='probe'):
+                result = runner.run(['python', '-c', 'raise SystemExit(3)'])
+        
+        self.assertEqual(result.return_code, 3)
+        self.assertEqual(len(timings.commands), 1)
+        command = timings.commands[0]
+        self.assertEqual((command.exit_code, command.step), (3, 'probe'))
+        self.assertGreater(command.spawn_ms, 0)
+        self.assertGreater(command.run_ms, 0)
+    
+    def test_module_phases(self):
+        """execute() attaches the phase breakdown unless it is turned off."""
+        module = MockModule()
+        
+        with patch.object(module._validator, 'validate_all', return_value=MagicMock(valid=True)):
+            result = module.execute()
+        self.assertEqual(
+            list(result.timings.phases), ['validation', 'journal', 'execute', 'finalize', 'total']
+        )
+        self.assertGreaterEqual(result.timings.phases['total'], result.timings.phases['execute'])
+        
+        # Settings are read once per module, so a fresh module sees the change
+        module = MockModule()
+        with patch.object(module._validator, 'validate_all', return_value=MagicMock(valid=True)), \
+                patch('src.modules.base.Config.load', return_value=Config(collect_timings=False)), \
+                patch.object(ExecutionTimings, 'phase') as phase:
+            result = module.execute()
+        self.assertIsNone(result.timings)
+        phase.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Unit tests for tracing.
+Covers nesting across threads, sampling and the Chrome trace file.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.core.executor import ModuleExecutor
+from src.system.commands import CommandRunner
+from src.utils.tracing import ChromeTraceExporter, SpanExporter, Tracer, read_trace
+from tests.test_modules import MockModule
+
+
+class ListExporter(SpanExporter):
+    """Keeps finished spans in memory."""
+    
+    def __init__(self):
+        self.spans = []
+        self.flushes = 0
+    
+    def export(self, span):
+        self.spans.append(span)
+    
+    def flush(self):
+        self.flushes += 1
+
+
+class TestTracing(unittest.TestCase):
+    """Test span recording and export."""
+    
+    def setUp(self):
+        self.exporter = ListExporter()
+        self.tracer = Tracer(self.exporter)
+        patcher = patch('src.utils.tracing._tracer', self.tracer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_spans_nest_across_executor_thread(self):
+        """A module run on the executor's worker thread forms one trace."""
+        module = MockModule()
+        executor = ModuleExecutor()
+        self.addCleanup(executor.shutdown)
+        
+        with patch.object(module._validator, 'validate_all', return_value=MagicMock(valid=True)):
+            executor.execute(module.execute).result(timeout=10)
+        
+        spans = {span.name: span for span in self.exporter.spans}
+        self.assertEqual(set(spans), {'executor.execute', 'module.execute'})
+        self.assertIsNone(spans['executor.execute'].parent_id)
+        self.assertEqual(spans['module.execute'].parent_id, spans['executor.execute'].span_id)
+        self.assertEqual(spans['module.execute'].trace_id, spans['executor.execute'].trace_id)
+        self.assertEqual(spans['module.execute'].attributes['status'], 'success')
+        self.assertEqual(self.exporter.flushes, 1)
+    
+    def test_child_spans_need_a_trace(self):
+        """Commands are recorded inside a trace only, with their exit code."""
+        runner = CommandRunner()
+        
+        with patch.object(runner, '_resolve_command', return_value=sys.executable):
+            runner.run(['python', '-c', 'pass'])
+            self.assertEqual(self.exporter.spans, [])
+            
+            with self.tracer.trace('test') as root:
+                runner.run(['python', '-c', 'raise SystemExit(2)'])
+        
+        command, recorded_root = self.exporter.spans
+        self.assertIs(recorded_root, root)
+        self.assertEqual(command.parent_id, root.span_id)
+        self.assertEqual(command.attributes['exit_code'], 2)
+        self.assertIn('spawn_ms', command.attributes)
+    
+    def test_sampling_per_trace(self):
+        """An unsampled root suppresses its whole trace; errors are recorded."""
+        draws = iter([0.7, 0.2])
+        self.tracer.sample_rate = 0.5
+        self.tracer._rng = lambda: next(draws)
+        
+        with self.tracer.trace('skipped') as root:
+            self.assertIsNone(root)
+            with self.tracer.span('child') as child:
+                self.assertIsNone(child)
+        self.assertEqual(self.exporter.spans, [])
+        
+        with self.assertRaises(ValueError):
+            with self.tracer.trace('kept'):
+                raise ValueError('boom')
+        self.assertEqual(self.exporter.spans[0].attributes['error'], 'ValueError')
+    
+    def test_chrome_trace_file(self):
+        """The trace file is readable both before and after it is closed."""
+        with tempfile.TemporaryDirectory() as directory:
+            exporter = ChromeTraceExporter(Path(directory))
+            tracer = Tracer(exporter)
+            with tracer.trace('module.execute', module_id='A'):
+                with tracer.span('command', argv='sfc /scannow'):
+                    pass
+            
+            events = read_trace(exporter.path)
+            self.assertEqual([e['name'] for e in events], ['command', 'module.execute'])
+            self.assertTrue(all(e['ph'] == 'X' for e in events))
+            self.assertLessEqual(events[1]['ts'], events[0]['ts'])
+            self.assertEqual(events[1]['args']['module_id'], 'A')
+            
+            exporter.close()
+            self.assertEqual(len(read_trace(exporter.path)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Unit tests for the session transcript.
+Writes into a temporary directory.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.utils.log_rotation import STALE_SECONDS
+from src.utils.transcript import SessionTranscript
+
+
+class TestSessionTranscript(unittest.TestCase):
+    """Test lazy creation, appending and retention."""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.directory = Path(self._tmp.name) / 'logs'
+    
+    def test_file_created_on_first_write(self):
+        """Nothing is created until lines are spilled."""
+        transcript = SessionTranscript(self.directory)
+        transcript.write([])
+        self.assertFalse(transcript.path.exists())
+        
+        transcript.write(['first', 'second'])
+        transcript.write(['third'])
+        transcript.close()
+        
+        self.assertTrue(transcript.path.name.startswith('console_'))
+        self.assertEqual(transcript.path.read_text(encoding='utf-8'), 'first\nsecond\nthird\n')
+        self.assertEqual(transcript.lines_written, 3)
+    
+    def test_earlier_transcripts_are_pruned(self):
+        """Old transcripts are compressed and trimmed like the tool log."""
+        self.directory.mkdir()
+        stamp = time.time() - STALE_SECONDS - 60
+        for i in range(4):
+            old = self.directory / f'console_2020010{i}_000000.log'
+            old.write_text('old\n', encoding='utf-8')
+            os.utime(old, (stamp + i, stamp + i))
+        
+        transcript = SessionTranscript(self.directory, keep_files=2)
+        transcript.write(['line'])
+        transcript.close()
+        
+        self.assertEqual(
+            sorted(p.name for p in self.directory.iterdir()),
+            ['console_20200102_000000.log.gz', 'console_20200103_000000.log.gz', transcript.path.name]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Unit tests for the UI stall watchdog.
+Drives the heartbeat with a fake clock and blocks a helper thread as the event loop.
+"""
+
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.utils.events import summarize
+from src.utils.watchdog import StallWatchdog
+
+
+def blocked_event_loop(release: threading.Event) -> None:
+    release.wait(10)
+
+
+class TestStallWatchdog(unittest.TestCase):
+    """Test latency measurement, stack capture and counters."""
+    
+    def setUp(self):
+        self.now = 100.0
+        self.events = MagicMock()
+        patcher = patch('src.utils.watchdog.get_event_log', return_value=self.events)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.release = threading.Event()
+        self.loop = threading.Thread(target=blocked_event_loop, args=(self.release,))
+        self.loop.start()
+        self.addCleanup(self.loop.join)
+        self.addCleanup(self.release.set)
+        
+        self.watchdog = StallWatchdog(
+            threshold_ms=250, interval_ms=50, hang_ms=2000,
+            thread_id=self.loop.ident, clock=lambda: self.now
+        )
+    
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+    
+    def test_on_time_beats_are_not_stalls(self):
+        """Latency below the threshold only updates the maximum."""
+        for _ in range(5):
+            self.advance(0.05)
+            self.assertIsNone(self.watchdog.beat())
+        self.advance(0.2)
+        self.assertIsNone(self.watchdog.beat())
+        
+        self.assertEqual(self.watchdog.stats.beats, 6)
+        self.assertEqual(self.watchdog.stats.stalls, 0)
+        self.assertAlmostEqual(self.watchdog.stats.max_latency_ms, 150.0)
+        self.events.emit.assert_not_called()
+    
+    def test_stall_captures_blocking_stack(self):
+        """The monitor captures where the loop thread is stuck; the next beat reports it."""
+        self.advance(0.2)
+        self.watchdog.check()
+        self.assertEqual(self.watchdog._stack, '')
+        
+        with patch('src.utils.watchdog.SOURCE_ROOT', Path(__file__).parent):
+            self.advance(0.3)
+            self.watchdog.check()
+        self.advance(0.1)
+        stall = self.watchdog.beat()
+        
+        self.assertEqual(stall.duration_ms, 550.0)
+        self.assertIn('release.wait(10)', stall.stack)
+        self.assertTrue(stall.site.startswith('test_watchdog.py:'))
+        self.assertTrue(stall.site.endswith(' blocked_event_loop'))
+        self.events.emit.assert_called_once_with(
+            'ui_stall', duration_ms=550.0, stack=stall.stack, site=stall.site
+        )
+        
+        self.advance(0.05)
+        self.assertIsNone(self.watchdog.beat())
+    
+    def test_hang_logged_once_and_counters(self):
+        """A long stall is logged while ongoing; the session counters bucket stalls."""
+        with patch.object(self.watchdog._logger, 'error') as error:
+            self.advance(3.0)
+            self.watchdog.check()
+            self.advance(1.0)
+            self.watchdog.check()
+        self.assertEqual(error.call_count, 1)
+        self.assertIn('not responding', error.call_args[0][0])
+        self.watchdog.beat()
+        
+        self.advance(0.35)
+        self.watchdog.beat()
+        
+        stats = self.watchdog.stop()
+        self.assertEqual(stats.stalls, 2)
+        self.assertEqual(stats.longest_ms, 3950.0)
+        self.assertEqual(stats.buckets, {2000: 1, 250: 1})
+        self.assertEqual(self.events.emit.call_args[0][0], 'ui_session')
+        
+        stall_events = [
+            {'event': name, **fields} for (name,), fields in
+            (c[0:2] for c in self.events.emit.call_args_list) if name == 'ui_stall'
+        ]
+        groups = summarize(stall_events, by='stall')
+        self.assertEqual(sum(g['count'] for g in groups), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()